@@ -1,40 +1,392 @@
 # flask_wrapper.py
-from flask import Flask, jsonify
+from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
 from sydney_events_api import SydneyEventsAPI
+from snapshot_store import SnapshotStore
+from scheduler import RefreshScheduler
+from batch_feed import BatchFeed
+from event_store import EventStore
+from event_query import EventQuery, response_records
+from response_cache import ResponseCache, conditional_response
+from shared_snapshot import SharedSnapshot, SnapshotFile
+import json_codec
+from datetime import datetime
 import json
+import os
+import threading
 
 app = Flask(__name__)
 CORS(app, resources={r"/*": {"origins": "*"}})
 
+# Scraped events persist in SQLite so queries use indexes and restarts start warm;
+# set EVENT_DB to an empty string to keep everything in memory
+EVENT_DB = os.environ.get('EVENT_DB', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'events.db'))
+event_store = EventStore(EVENT_DB) if EVENT_DB else None
+
 # Initialize API
-events_api = SydneyEventsAPI()
+events_api = SydneyEventsAPI(
+    pool_size=int(os.environ.get('BROWSER_POOL_SIZE', 4)),
+    per_host_limit=int(os.environ.get('BROWSER_PER_HOST_LIMIT', 2)),
+    http_first=os.environ.get('HTTP_FIRST', '1') != '0',
+    event_store=event_store,
+    # A full crawl stops waiting on listings after REFRESH_TIMEOUT seconds and serves their last good events
+    refresh_timeout=float(os.environ.get('REFRESH_TIMEOUT', 600))
+)
+
+# Serve scraped data from a cached snapshot. By default a background scheduler keeps it
+# fresh so no request ever waits on Selenium; with SCHEDULER_ENABLED=0 a stale snapshot
+# is refreshed on demand instead. EXTERNAL_REFRESH=1 leaves publishing to another
+# component, such as the async refresh loop in asgi.py.
+EXTERNAL_REFRESH = os.environ.get('EXTERNAL_REFRESH') == '1'
+SCHEDULER_ENABLED = os.environ.get('SCHEDULER_ENABLED', '1') != '0' and not EXTERNAL_REFRESH
+SNAPSHOT_TTL = int(os.environ.get('SNAPSHOT_TTL', 900))
+SNAPSHOT_WAIT_TIMEOUT = float(os.environ.get('SNAPSHOT_WAIT_TIMEOUT',
+                                             0 if SCHEDULER_ENABLED or EXTERNAL_REFRESH else 300))
+
+# Pages crawled per category listing; a crawl stops early once a page only repeats known events
+MAX_PAGES = int(os.environ.get('MAX_PAGES', 2))
+
+# Under gunicorn every worker imports this module. With SHARED_SNAPSHOT_DIR set, only the
+# worker holding that directory's producer lock scrapes: it writes every snapshot's bodies
+# to a versioned file there, which the other workers memory-map and serve as they are.
+SHARED_SNAPSHOT_DIR = os.environ.get('SHARED_SNAPSHOT_DIR')
+shared_snapshot = SharedSnapshot(SHARED_SNAPSHOT_DIR,
+                                 poll_interval=float(os.environ.get('SHARED_SNAPSHOT_POLL', 1.0))) \
+    if SHARED_SNAPSHOT_DIR else None
+
+# Listing pages of the first crawl are also fanned out to /api/events/stream clients
+crawl_feed = BatchFeed()
+STREAM_TIMEOUT = float(os.environ.get('STREAM_TIMEOUT', 600))
+
+def load_all_events():
+    crawl_feed.start()
+    try:
+        return events_api.scrape_all_events(max_pages=MAX_PAGES, on_batch=crawl_feed.push)
+    finally:
+        crawl_feed.finish()
+
+if SCHEDULER_ENABLED:
+    snapshots = SnapshotStore(ttl=SNAPSHOT_TTL)
+    scheduler = RefreshScheduler(events_api, snapshots, jitter=float(os.environ.get('SCHEDULER_JITTER', 0.2)),
+                                 feed=crawl_feed, max_pages=MAX_PAGES)
+else:
+    snapshots = SnapshotStore(None if EXTERNAL_REFRESH else load_all_events, ttl=SNAPSHOT_TTL)
+    scheduler = None
+    # Per-category snapshots that serve category requests until the full crawl has loaded
+    category_snapshots = {}
+    category_snapshots_lock = threading.Lock()
+
+# Serialized, precompressed bodies are reused until a new snapshot is published. Clients
+# may reuse a response for CACHE_MAX_AGE seconds and serve it stale while revalidating
+# for CACHE_STALE_WHILE_REVALIDATE more.
+CACHE_MAX_AGE = int(os.environ.get('CACHE_MAX_AGE', 60))
+CACHE_STALE_WHILE_REVALIDATE = int(os.environ.get('CACHE_STALE_WHILE_REVALIDATE', 600))
+CACHE_CONTROL = f'public, max-age={CACHE_MAX_AGE}, stale-while-revalidate={CACHE_STALE_WHILE_REVALIDATE}'
+response_cache = ResponseCache(json_codec.dumps, metrics=events_api.metrics)
+
+# Cache counters are exported alongside the stage timings on /metrics
+events_api.metrics.add_collector('fetch_cache_total', 'Listing fetches by cache outcome', 'result',
+                                 lambda: events_api.fetch_cache.stats)
+events_api.metrics.add_collector('response_cache_total', 'Response body lookups by outcome', 'result',
+                                 lambda: response_cache.stats)
+
+def first_pass_running():
+    """Whether the scheduler is still on its first pass after a cold start.
+
+    Its snapshots then cover only the listings scraped so far, fine for the
+    category they feed but not for the full event set.
+    """
+    return scheduler is not None and not scheduler.first_pass_complete
+
+def snapshot_freshness(category_name, snapshot):
+    if snapshot is not None and isinstance(snapshot.data, SnapshotFile):
+        return snapshot.data.freshness.get(category_name)  # as the producer saw it
+    if scheduler is not None:
+        return scheduler.category_freshness(category_name)
+    return {
+        'refreshed_at': datetime.fromtimestamp(snapshot.created_at).isoformat() if snapshot else None
+    }
+
+def category_payload(category_name, snapshot, partial, freshness, dates):
+    """Body of /api/events/category/<name>, optionally limited to a date range"""
+    if event_store is not None and not partial:
+        # Index lookup on category (and start date) instead of scanning the snapshot
+        events = event_store.category_events(category_name, start=dates.start, end=dates.end)
+        category_data = {
+            'success': True,
+            'category': category_name,
+            'total_events': len(events),
+            'events': events
+        }
+    else:
+        category_data = events_api.get_category_events(category_name, snapshot.data)
+        if dates.start or dates.end:
+            category_data['events'] = [event for event in category_data['events'] if dates.matches(event)]
+            category_data['total_events'] = len(category_data['events'])
+    category_data['freshness'] = freshness
+    return category_data
+
+@snapshots.on_publish
+def prewarm_responses(snapshot):
+    """Encode and compress the full and per-category bodies once, in the publishing thread.
+
+    The producer of a shared snapshot also writes them to the next snapshot
+    file; a follower caches the bodies of the file it maps as they are.
+    """
+    if isinstance(snapshot.data, SnapshotFile):
+        for key, body in snapshot.data.bodies.items():
+            response_cache.put(key, snapshot, body)
+        return
+
+    bodies, freshness = {}, {}
+    body = bodies['/api/events/all?'] = response_cache.get('/api/events/all?', snapshot, lambda: snapshot.data)
+    body.precompress()
+    for category_name in snapshot.data.get('category_groups', {}):
+        if events_api.category_jobs(category_name):
+            freshness[category_name] = snapshot_freshness(category_name, snapshot)
+            key = f'/api/events/category/{category_name}?'
+            body = bodies[key] = response_cache.get(key, snapshot, lambda: category_payload(
+                category_name, snapshot, False, freshness[category_name], EventQuery()))
+            body.precompress()
+
+    if shared_snapshot is not None and shared_snapshot.is_producer and not first_pass_running():
+        # Followers serve the file's full body as is, so only share complete snapshots
+        path = shared_snapshot.write(bodies, '/api/events/all?', snapshot.created_at, freshness)
+        print(f"📤 Shared snapshot {shared_snapshot.version} written to {path}")
+
+# Start from stored listings when there are any, then keep them fresh. A shared snapshot's
+# producer is elected in the worker processes, so the scheduler waits for their first request.
+if scheduler is not None:
+    if shared_snapshot is None:
+        scheduler.start()
+elif event_store is not None:
+    stored = event_store.load_listings()
+    if stored:
+        snapshots.publish(events_api.stored_response(),
+                          created_at=min(refreshed_at for refreshed_at, _ in stored.values()))
+
+def following():
+    """Whether this process serves another process's shared snapshot instead of scraping"""
+    return shared_snapshot is not None and not shared_snapshot.is_producer
+
+def follow_shared_snapshot():
+    """Serve the newest shared snapshot file if it is not the one served already"""
+    mapped = shared_snapshot.current()
+    served = snapshots.peek()
+    if mapped is not None and (served is None or served.data is not mapped):
+        snapshots.publish(mapped, created_at=mapped.created_at)
+
+@app.before_request
+def ensure_scheduler():
+    # A follower takes over as producer as soon as the producer's lock is released
+    if shared_snapshot is not None and not shared_snapshot.claim_producer():
+        follow_shared_snapshot()
+        return
+    # Gunicorn forks workers after import; restart the thread in each worker process
+    if scheduler is not None:
+        scheduler.start()
+
+def current_snapshot():
+    """Return the served snapshot, or None while the first scrape is still running"""
+    if following():
+        return snapshots.peek()  # never scrape here; the producer publishes
+    return snapshots.get(wait_timeout=SNAPSHOT_WAIT_TIMEOUT)
+
+def cached_response(snapshot, build):
+    """Serve build()'s payload for this request from the per-snapshot response cache.
+
+    Answers If-None-Match with 304 and picks gzip or brotli from Accept-Encoding.
+    """
+    body = response_cache.get(request.full_path, snapshot, build)
+    status, headers, content = conditional_response(
+        body, request.headers.get('If-None-Match'), request.headers.get('Accept-Encoding'), CACHE_CONTROL)
+    # WSGI servers only write bytes, so a body mapped from a shared snapshot is copied out here
+    return Response(bytes(content), status=status, headers=headers)
+
+def loading_response():
+    response = jsonify({
+        'success': False,
+        'error': 'Events are still loading, please retry shortly',
+        'snapshot': snapshots.status()
+    })
+    response.headers['Retry-After'] = '30'
+    return response, 503
 
 @app.route('/api/events/all', methods=['GET'])
 def get_all_events():
     """Get all events organized by category"""
     try:
-        response = events_api.scrape_all_events(max_pages=2)
-        return jsonify(response)
+        snapshot = current_snapshot()
+        if snapshot is None or first_pass_running():
+            return loading_response()
+        return cached_response(snapshot, lambda: snapshot.data)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/events', methods=['GET'])
+def query_events():
+    """Get one page of events filtered by category, source, date range and text.
+
+    Query parameters: category, source, from, to (ISO dates), q, limit, cursor
+    (next_cursor of the previous page) and fields (comma-separated, or `card`).
+    """
+    try:
+        query = EventQuery.from_args(request.args, {key: source['name'] for key, source in events_api.sources.items()})
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+    try:
+        snapshot = current_snapshot()
+        if snapshot is None or first_pass_running():
+            return loading_response()
+
+        def build():
+            if event_store is not None:
+                return event_store.page(query)
+            return query.page(response_records(snapshot.data))
+        return cached_response(snapshot, build)
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
+def category_snapshot(category_name):
+    """Snapshot to serve one category from, whether it covers only that category, and its freshness.
+
+    Only the listing URLs that feed the category are ever waited on: with the
+    scheduler they jump its queue if they have not loaded yet, and without it a
+    cold app scrapes just those URLs instead of the whole crawl.
+    """
+    if following():
+        snapshot = snapshots.peek()
+        return snapshot, False, snapshot_freshness(category_name, snapshot)
+
+    if scheduler is not None:
+        freshness = scheduler.category_freshness(category_name)
+        if not any(freshness['listings'].values()):
+            scheduler.prioritize(events_api.category_jobs(category_name))
+            return None, False, freshness
+        return current_snapshot(), False, freshness
+
+    partial = snapshots.peek() is None and snapshots.loader is not None
+    if partial:
+        with category_snapshots_lock:
+            if category_name not in category_snapshots:
+                category_snapshots[category_name] = SnapshotStore(
+                    lambda: events_api.scrape_category_response(category_name, max_pages=MAX_PAGES),
+                    ttl=SNAPSHOT_TTL)
+        snapshot = category_snapshots[category_name].get(wait_timeout=SNAPSHOT_WAIT_TIMEOUT)
+    else:
+        snapshot = snapshots.get()  # starts a background refresh once the snapshot is stale
+    freshness = snapshot_freshness(category_name, snapshot)
+    return snapshot, partial, freshness
+
 @app.route('/api/events/category/<category_name>', methods=['GET'])
 def get_category_events(category_name):
     """Get events for specific category"""
     try:
-        all_data = events_api.scrape_all_events(max_pages=1)
-        category_data = events_api.get_category_events(category_name, all_data)
-        return jsonify(category_data)
+        if not events_api.category_jobs(category_name):
+            return jsonify(events_api.get_category_events(category_name, {}))
+
+        try:
+            dates = EventQuery.date_range(request.args)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+
+        snapshot, partial, freshness = category_snapshot(category_name)
+        if snapshot is None:
+            return loading_response()
+        return cached_response(snapshot, lambda: category_payload(category_name, snapshot, partial, freshness, dates))
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
+def stream_message(kind, payload, sse):
+    if sse:
+        return b'event: ' + kind.encode() + b'\ndata: ' + json_codec.dumps(payload) + b'\n\n'
+    return json_codec.dumps(dict(payload, type=kind)) + b'\n'
+
+@app.route('/api/events/stream', methods=['GET'])
+def stream_events():
+    """Stream events one per line as NDJSON, or as Server-Sent Events with format=sse.
+
+    While a crawl fed to crawl_feed is running - the first full crawl, or the
+    scheduler's first pass, which publishes partial snapshots along the way -
+    each listing page's new events are sent as soon as the page is extracted,
+    so the first events arrive after one page load. Otherwise the served
+    snapshot is streamed straight from memory.
+    """
+    sse = request.args.get('format') == 'sse' or 'text/event-stream' in request.headers.get('Accept', '')
+    snapshot = snapshots.peek()
+    live = True
+    if crawl_feed.running:
+        records = events_api.stream_records(crawl_feed.follow(STREAM_TIMEOUT, crawl_feed.generation))
+    elif snapshot is not None:
+        live = False
+        records = ((category, event) for category, events in snapshot.data['category_groups'].items()
+                   for event in events)
+    elif following():
+        live = False
+        records = ()  # only the producer's first crawl is streamed
+    elif scheduler is not None:
+        # The scheduler's first pass feeds crawl_feed
+        records = events_api.stream_records(crawl_feed.follow(STREAM_TIMEOUT, crawl_feed.generation))
+    else:
+        generation = crawl_feed.next_generation()
+        if snapshots.loader is not None:
+            snapshots.refresh_async()
+        records = events_api.stream_records(crawl_feed.follow(STREAM_TIMEOUT, generation))
+
+    def generate():
+        count = 0
+        for category, event in records:
+            count += 1
+            yield stream_message('event', {'category': category, 'event': event}, sse)
+        # A followed crawl is complete once it has finished, not when it merely published something
+        complete = not crawl_feed.running if live else snapshot is not None
+        yield stream_message('done', {'total_events': count, 'complete': complete}, sse)
+
+    return Response(stream_with_context(generate()),
+                    mimetype='text/event-stream' if sse else 'application/x-ndjson',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/api/events/status', methods=['GET'])
+def get_snapshot_status():
+    """Get freshness of the cached events snapshot"""
+    return jsonify({
+        'success': True,
+        'snapshot': snapshots.status(),
+        'schedule': scheduler.status() if scheduler is not None else None,
+        'page_timings': events_api.page_timing_summary(),
+        'circuit_breakers': events_api.breakers.status(),
+        'fetch_cache': dict(events_api.fetch_cache.stats, hit_rate=events_api.fetch_cache.hit_rate()),
+        'event_store': event_store.status() if event_store is not None else None,
+        'shared_snapshot': shared_snapshot.status() if shared_snapshot is not None else None,
+        'response_cache': dict(response_cache.stats, hit_rate=response_cache.hit_rate())
+    })
+
+@app.route('/api/events/report', methods=['GET'])
+def get_run_report():
+    """Get where scrape and response time went, per stage and per listing"""
+    return jsonify({'success': True, 'report': events_api.metrics.report()})
+
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Stage timings and listing counters in the Prometheus text format"""
+    return Response(events_api.metrics.render_prometheus(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/api/events/categories', methods=['GET'])
 def get_available_categories():
     """Get list of available categories"""
@@ -0,0 +1,150 @@
+# asgi.py (ASGI entry point with an async refresh loop)
+#
+# Run with: uvicorn asgi:application --host 0.0.0.0 --port 5000
+#
+# Snapshots are refreshed by the asyncio scraping engine on this process's event
+# loop, and the hot read endpoints are served natively from the cached bodies,
+# so any number of readers are answered while a scrape runs. Everything else is
+# handed to the Flask app in app.py. With SHARED_SNAPSHOT_DIR set and several
+# workers, only the worker holding the producer lock runs the refresh loop; the
+# others serve the snapshot files it writes.
+import asyncio
+import contextlib
+import os
+
+# Publishing is done by refresh_loop() below rather than app.py's scheduler thread
+os.environ['EXTERNAL_REFRESH'] = '1'
+
+from a2wsgi import WSGIMiddleware
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Mount, Route
+
+import app as flask_app
+from event_query import EventQuery, response_records
+from response_cache import conditional_response
+
+events_api = flask_app.events_api
+snapshots = flask_app.snapshots
+REFRESH_INTERVAL = float(os.environ.get('ASYNC_REFRESH_INTERVAL', flask_app.SNAPSHOT_TTL))
+
+
+async def follow_shared_snapshot(shared):
+    """Serve the producer's snapshot files until this process claims the producer lock"""
+    while not shared.claim_producer():
+        await run_in_threadpool(flask_app.follow_shared_snapshot)
+        await asyncio.sleep(shared.poll_interval)
+
+
+async def refresh_loop():
+    """Scrape everything with the async engine every REFRESH_INTERVAL seconds"""
+    if flask_app.shared_snapshot is not None:
+        await follow_shared_snapshot(flask_app.shared_snapshot)
+
+    snapshot = snapshots.peek()
+    if snapshot is not None:
+        # Started warm from the event store; wait until that data is due
+        await asyncio.sleep(max(0, REFRESH_INTERVAL - snapshot.age()))
+
+    while True:
+        flask_app.crawl_feed.start()
+        try:
+            data = await events_api.scrape_all_events_async(max_pages=flask_app.MAX_PAGES, on_batch=flask_app.crawl_feed.push)
+            # Publishing encodes and compresses the response bodies; keep that off the loop
+            await run_in_threadpool(snapshots.publish, data)
+        except Exception as e:
+            print(f"❌ Async refresh failed: {e}")
+        finally:
+            flask_app.crawl_feed.finish()
+        await asyncio.sleep(REFRESH_INTERVAL)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    task = asyncio.create_task(refresh_loop())
+    try:
+        yield
+    finally:
+        task.cancel()
+        events_api.browser_pool.close()
+
+
+def loading_response():
+    return JSONResponse({
+        'success': False,
+        'error': 'Events are still loading, please retry shortly',
+        'snapshot': snapshots.status()
+    }, status_code=503, headers={'Retry-After': '30'})
+
+
+async def cached_response(request, snapshot, build):
+    """Serve a cached body for this request, building it in a worker thread on a miss"""
+    key = request.url.path + '?' + request.url.query
+    body = flask_app.response_cache.peek(key, snapshot)
+    if body is None:
+        body = await run_in_threadpool(flask_app.response_cache.get, key, snapshot, build)
+    status, headers, content = conditional_response(
+        body, request.headers.get('If-None-Match'), request.headers.get('Accept-Encoding'), flask_app.CACHE_CONTROL)
+    return Response(content, status_code=status, headers=headers)
+
+
+async def get_all_events(request):
+    """Get all events organized by category"""
+    snapshot = snapshots.peek()
+    if snapshot is None:
+        return loading_response()
+    return await cached_response(request, snapshot, lambda: snapshot.data)
+
+
+async def get_category_events(request):
+    """Get events for specific category"""
+    category_name = request.path_params['category_name']
+    if not events_api.category_jobs(category_name):
+        return JSONResponse(events_api.get_category_events(category_name, {}))
+
+    try:
+        dates = EventQuery.date_range(request.query_params)
+    except ValueError as e:
+        return JSONResponse({'success': False, 'error': str(e)}, status_code=400)
+
+    snapshot = snapshots.peek()
+    if snapshot is None:
+        return loading_response()
+    freshness = flask_app.snapshot_freshness(category_name, snapshot)
+    return await cached_response(
+        request, snapshot, lambda: flask_app.category_payload(category_name, snapshot, False, freshness, dates))
+
+
+async def query_events(request):
+    """Get one page of events filtered by category, source, date range and text"""
+    try:
+        query = EventQuery.from_args(request.query_params,
+                                     {key: source['name'] for key, source in events_api.sources.items()})
+    except ValueError as e:
+        return JSONResponse({'success': False, 'error': str(e)}, status_code=400)
+
+    snapshot = snapshots.peek()
+    if snapshot is None:
+        return loading_response()
+
+    def build():
+        if flask_app.event_store is not None:
+            return flask_app.event_store.page(query)
+        return query.page(response_records(snapshot.data))
+    return await cached_response(request, snapshot, build)
+
+
+application = Starlette(
+    routes=[
+        Route('/api/events/all', get_all_events),
+        Route('/api/events/category/{category_name}', get_category_events),
+        Route('/api/events', query_events),
+        # Status, categories and streaming are served by the Flask app in worker threads
+        Mount('/', WSGIMiddleware(flask_app.app)),
+    ],
+    middleware=[Middleware(CORSMiddleware, allow_origins=['*'], allow_methods=['*'], allow_headers=['*'])],
+    lifespan=lifespan
+)
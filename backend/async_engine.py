@@ -0,0 +1,171 @@
+# async_engine.py (Asyncio scraping pipeline)
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import httpx
+
+from pagination import ListingCrawl
+from resilience import CircuitOpenError
+
+
+def retryable_http_error(error):
+	"""httpx counterpart of SydneyEventsAPI.retryable_http_error"""
+	if isinstance(error, httpx.HTTPStatusError):
+		return error.response.status_code == 429 or error.response.status_code >= 500
+	return isinstance(error, httpx.TransportError)
+
+
+class AsyncScraper:
+	"""Scrape an API's listing URLs from one event loop.
+
+	Listing pages are fetched over a pooled httpx.AsyncClient, at most per_host
+	at a time per host, each host slot held for the source's request_delay after
+	a fetch; later pages of a listing are crawled per_host at a time. Parsing runs in a small thread pool so the loop stays responsive, and
+	listings that need a browser drive the API's pooled Selenium drivers from
+	their own executor, one thread per pooled browser. Page loads go through
+	the API's retry policy and circuit breakers, as in the threaded crawl.
+	"""
+
+	def __init__(self, api, per_host=2, max_connections=20, parse_workers=2):
+		self.api = api
+		self.per_host = per_host
+		self.max_connections = max_connections
+		self.parse_workers = parse_workers
+
+	async def scrape_all_events(self, max_pages=2, on_batch=None):
+		"""Async counterpart of SydneyEventsAPI.scrape_all_events"""
+		jobs = [(source_key, category) for source_key, source in self.api.sources.items() for category in source['urls']]
+		results = [None] * len(jobs)
+		async for index, events in self.iter_category_batches(jobs, max_pages):
+			source_key, category = jobs[index]
+			events = results[index] = self.api.listing_result(source_key, category, events)
+			if on_batch is not None:
+				on_batch(source_key, category, events)
+
+		all_events = [event for events in results for event in events]
+		print(f"\n📈 Total raw events collected: {len(all_events)}")
+		if not all_events:
+			raise RuntimeError('No listing returned events or has earlier ones to fall back on')
+		return await asyncio.get_running_loop().run_in_executor(None, self.api.build_response, all_events)
+
+	async def iter_category_batches(self, jobs, max_pages=2):
+		"""Scrape jobs concurrently, yielding (job index, events) as each listing finishes.
+
+		events is None for a listing that failed or was still running after the
+		API's refresh_timeout; those are cancelled.
+		"""
+		loop = asyncio.get_running_loop()
+		host_slots = {}
+		limits = httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+
+		async def run(index):
+			source_key, category = jobs[index]
+			url = self.api.sources[source_key]['urls'][category]
+			slot = host_slots.setdefault(urlparse(url).netloc, asyncio.Semaphore(self.per_host))
+			print(f"  📄 Scraping {category}: {url}")
+			started = time.monotonic()
+			try:
+				events = await self.fetch_category(client, parse_pool, browser_pool, slot, source_key, category, max_pages)
+				print(f"    ✅ Found {len(events)} events ({self.api.sources[source_key]['name']} {category})")
+				self.api.metrics.record_listing(source_key, category, len(events), time.monotonic() - started)
+			except Exception as e:
+				print(f"    ❌ Error ({self.api.sources[source_key]['name']} {category}): {e}")
+				self.api.metrics.record_listing(source_key, category, 0, time.monotonic() - started, error=e)
+				events = None
+			return index, events
+
+		# Shut down without waiting: a browser load still running after refresh_timeout finishes in
+		# its thread, and joining it here would block the event loop and every request it serves
+		parse_pool = ThreadPoolExecutor(self.parse_workers, thread_name_prefix='parse')
+		browser_pool = ThreadPoolExecutor(self.api.browser_pool.size, thread_name_prefix='browser')
+		try:
+			async with httpx.AsyncClient(headers=dict(self.api.session.headers), limits=limits,
+										 timeout=self.api.http_timeout, follow_redirects=True) as client:
+				tasks = [loop.create_task(run(index)) for index in range(len(jobs))]
+				pending = set(range(len(jobs)))
+				try:
+					for task in asyncio.as_completed(tasks, timeout=self.api.refresh_timeout):
+						index, events = await task
+						pending.discard(index)
+						yield index, events
+				except asyncio.TimeoutError:
+					for index in sorted(pending):
+						source_key, category = jobs[index]
+						print(f"    ⏱️  Gave up waiting on {source_key}/{category} after {self.api.refresh_timeout}s")
+						yield index, None
+				finally:
+					for task in tasks:
+						task.cancel()
+					await asyncio.gather(*tasks, return_exceptions=True)
+		finally:
+			parse_pool.shutdown(wait=False, cancel_futures=True)
+			browser_pool.shutdown(wait=False, cancel_futures=True)
+
+	async def fetch_category(self, client, parse_pool, browser_pool, slot, source_key, category, max_pages=1):
+		"""Fetch up to max_pages pages of one category over HTTP, falling back to a pooled browser when that finds no events"""
+		loop = asyncio.get_running_loop()
+		urls = self.api.listing_page_urls(source_key, category, max_pages)
+		if self.api.http_first:
+			try:
+				events = await self.fetch_page_http(client, parse_pool, slot, source_key, category, urls[0])
+				if events:
+					return await self.crawl_next_pages(client, parse_pool, slot, source_key, category, urls, events)
+			except httpx.HTTPError as e:
+				print(f"    ⚠️  HTTP fetch failed for {source_key}/{category}, using browser: {e}")
+
+		async def load():
+			async with slot:
+				try:
+					return await loop.run_in_executor(browser_pool, self.api.fetch_category_browser, source_key, category,
+													  max_pages)
+				finally:
+					await asyncio.sleep(self.api.sources[source_key]['request_delay'])  # Be respectful
+		return await self.api.retry_policy.call_async(load, self.api.retryable_browser_error,
+													  f'Browser load of {source_key}/{category}')
+
+	async def crawl_next_pages(self, client, parse_pool, slot, source_key, category, urls, first_events):
+		"""Add the later pages of a listing to its first page, per_host pages at a time"""
+		crawl = ListingCrawl(urls, first_events, self.api.fetch_cache, self.api.cached_page_ttl)
+
+		async def fetch(page):
+			try:
+				return await self.fetch_page_http(client, parse_pool, slot, source_key, category, urls[page])
+			except (httpx.HTTPError, CircuitOpenError) as e:
+				print(f"    ⚠️  Page {page + 1} of {source_key}/{category} failed: {e}")
+				return None
+
+		pages = crawl.next_pages(self.per_host)
+		while pages:
+			for page, events in zip(pages, await asyncio.gather(*(fetch(page) for page in pages))):
+				crawl.add(page, events)
+			pages = crawl.next_pages(self.per_host)
+		return crawl.events()
+
+	async def fetch_page_http(self, client, parse_pool, slot, source_key, category, url):
+		"""Fetch and extract one listing page, retrying transient failures with backoff"""
+		return await self.api.retry_policy.call_async(
+			lambda: self.load_page_http(client, parse_pool, slot, source_key, category, url), retryable_http_error, url)
+
+	async def load_page_http(self, client, parse_pool, slot, source_key, category, url):
+		"""Fetch and extract one listing page, holding a host slot until the request delay has passed"""
+		async with slot:
+			try:
+				started = time.monotonic()
+				with self.api.breakers.guard(url, retryable_http_error):
+					try:
+						# httpx's timeout bounds each read; this bounds the whole page
+						response = await asyncio.wait_for(
+							client.get(url, headers=self.api.fetch_cache.conditional_headers(url)), self.api.http_timeout)
+					except asyncio.TimeoutError:
+						raise httpx.ReadTimeout(f'{url} took longer than {self.api.http_timeout}s') from None
+					if response.status_code != 304:
+						response.raise_for_status()
+				loaded = time.monotonic()
+
+				return await asyncio.get_running_loop().run_in_executor(
+					parse_pool, self.api.http_listing_events, source_key, category, url, response.status_code,
+					response.content, response.encoding, response.headers, started, loaded)
+			finally:
+				await asyncio.sleep(self.api.sources[source_key]['request_delay'])  # Be respectful
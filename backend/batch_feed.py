@@ -0,0 +1,81 @@
+# batch_feed.py (Per-page event batches of a running crawl)
+import threading
+import time
+
+
+class BatchFeed:
+	"""Fan out the event batches of the crawl in progress to any number of readers.
+
+	The crawler calls start(), then push() once per scraped listing page, then
+	finish(). Readers iterate follow(), which replays the batches pushed so far
+	and then blocks for new ones until the crawl finishes, so a streaming client
+	sees each page as soon as it is extracted.
+	"""
+
+	def __init__(self):
+		self._batches = []
+		self._running = False
+		self._generation = 0
+		self._condition = threading.Condition()
+
+	@property
+	def running(self):
+		return self._running
+
+	def start(self):
+		with self._condition:
+			self._batches = []
+			self._running = True
+			self._generation += 1
+			self._condition.notify_all()
+
+	def push(self, source_key, category, events):
+		with self._condition:
+			if self._running:
+				self._batches.append({'source': source_key, 'category': category, 'events': events})
+				self._condition.notify_all()
+
+	def finish(self):
+		with self._condition:
+			self._running = False
+			self._condition.notify_all()
+
+	@property
+	def generation(self):
+		"""Number of crawls started so far"""
+		return self._generation
+
+	def next_generation(self):
+		"""Generation a new reader should follow: the running crawl, or else the next one"""
+		with self._condition:
+			return self._generation if self._running else self._generation + 1
+
+	def follow(self, timeout=None, generation=None):
+		"""Yield batches of a crawl until it finishes or timeout seconds pass.
+
+		Waits for the given generation to start if it hasn't yet; by default
+		follows next_generation().
+		"""
+		deadline = time.monotonic() + timeout if timeout is not None else None
+		if generation is None:
+			generation = self.next_generation()
+		with self._condition:
+			if not self._condition.wait_for(lambda: self._generation >= generation, timeout):
+				return
+			generation, batches = self._generation, self._batches
+		index = 0
+
+		while True:
+			with self._condition:
+				while index >= len(batches) and self._running and self._generation == generation:
+					remaining = deadline - time.monotonic() if deadline is not None else None
+					if remaining is not None and remaining <= 0:
+						return
+					self._condition.wait(remaining)
+				pending = batches[index:]
+				done = not self._running or self._generation != generation
+
+			index += len(pending)
+			yield from pending
+			if done and index >= len(batches):
+				return
@@ -0,0 +1,82 @@
+# bench_card_text.py (Date and price extraction over synthetic card texts)
+#
+# Usage, from the backend directory:
+#   python -m benchmarks.bench_card_text [--cards N] [--repeat N]
+import argparse
+import random
+import re
+import statistics
+import time
+from datetime import datetime
+
+from benchmarks.fixtures import card_text
+from card_text import CardTextExtractor
+
+LEGACY_DATE_PATTERNS = [
+	r'\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)(?:\s*-\s*\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec))?',
+	r'\d{1,2}/\d{1,2}/\d{4}',
+	r'\d{4}-\d{2}-\d{2}'
+]
+LEGACY_PRICE_PATTERNS = [r'from\s*\$\d+', r'\$\d+(?:\.\d{2})?', r'free', r'Free']
+
+
+def legacy_extract(text):
+	"""One re.search per pattern, as extract_date_from_text/extract_price_from_text did"""
+	date = price = None
+	for pattern in LEGACY_DATE_PATTERNS:
+		match = re.search(pattern, text, re.IGNORECASE)
+		if match:
+			date = match.group()
+			break
+	for pattern in LEGACY_PRICE_PATTERNS:
+		match = re.search(pattern, text, re.IGNORECASE)
+		if match:
+			price = match.group()
+			break
+	return date or "Check event page for dates", price or "See event page for pricing"
+
+
+def synthetic_cards(count, seed=0):
+	"""Card texts shaped like get_text() output, including cards with no date or price"""
+	rng = random.Random(seed)
+	cards = []
+	for index in range(count):
+		title, place, date, price = card_text(rng, index)
+		filler = f"{title} returns to {place} with live music, food stalls and activities for all ages."
+		if index % 5 == 0:
+			date = f"{rng.randint(1, 28)}/{rng.randint(1, 12)}/2026"
+		if index % 7 == 0:
+			date = ''
+		cards.append(f"\n{title}\n{place}\n{filler}\n{date}\n{price}\nBook now")
+	return cards
+
+
+def main():
+	parser = argparse.ArgumentParser(description='Compare date/price extraction over synthetic cards')
+	parser.add_argument('--cards', type=int, default=10000)
+	parser.add_argument('--repeat', type=int, default=5)
+	args = parser.parse_args()
+
+	cards = synthetic_cards(args.cards)
+	extractor = CardTextExtractor()
+	reference = datetime.now()
+
+	legacy = [legacy_extract(text) for text in cards]
+	current = [(fields['date_time'], fields['price']) for fields in extractor.extract_many(cards, reference)]
+	mismatches = sum(1 for a, b in zip(legacy, current) if a != b)
+
+	for name, run in (('legacy', lambda: [legacy_extract(text) for text in cards]),
+					  ('single-scan', lambda: extractor.extract_many(cards, reference))):
+		timings = []
+		for _ in range(args.repeat):
+			started = time.perf_counter()
+			run()
+			timings.append(time.perf_counter() - started)
+		seconds = statistics.median(timings)
+		print(f"{name:12} {len(cards)} cards  {seconds * 1000:8.1f} ms  {len(cards) / seconds:10.0f} cards/s")
+
+	print(f"mismatched date/price results: {mismatches}")
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,106 @@
+# bench_categorize.py (Categorization throughput and equivalence with the original rules)
+#
+# Usage, from the backend directory:
+#   python -m benchmarks.bench_categorize [--events N] [--repeat N]
+import argparse
+import random
+import statistics
+import time
+
+import categorizer
+from benchmarks.fixtures import PLACES, TITLES
+from categorizer import EventCategorizer
+
+FILLER = ['with', 'the', 'friends', 'ocean', 'views', 'city', 'night', 'lights', 'walk', 'people', 'join',
+		  'us', 'enjoy', 'harbour', 'sunset', 'family', 'bring', 'weekend', 'evening', 'kids', 'party']
+SOURCE_CATEGORIES = ['events', 'general', 'events', 'general', 'festivals', 'food', 'sport', 'EVTBUS']
+
+
+def legacy_categorize(event):
+	"""The original elif chain from SydneyEventsAPI.categorize_event"""
+	title = (event.get('title', '') + ' ' + event.get('description', '')).lower()
+	source_category = event.get('source_category', '').lower()
+
+	if source_category in ['festivals', 'festival']:
+		return 'festivals'
+	elif source_category in ['performance', 'performanc']:
+		return 'performance'
+	elif source_category in ['exhibit', 'exhibition']:
+		return 'exhibit'
+	elif source_category in ['food', 'evtfood']:
+		return 'food'
+	elif source_category in ['sport', 'sports']:
+		return 'sport'
+	elif source_category in ['community', 'evtcomnty']:
+		return 'community'
+	elif source_category in ['markets', 'evtmarket']:
+		return 'markets'
+	elif source_category in ['business', 'evtbus']:
+		return 'business'
+
+	if any(word in title for word in ['festival', 'fest', 'carnival']):
+		return 'festivals'
+	elif any(word in title for word in
+			 ['concert', 'music', 'band', 'singer', 'performance', 'show', 'theatre', 'theater']):
+		return 'performance'
+	elif any(word in title for word in ['exhibition', 'exhibit', 'gallery', 'museum', 'art']):
+		return 'exhibit'
+	elif any(word in title for word in ['food', 'wine', 'dining', 'restaurant', 'cuisine', 'cooking']):
+		return 'food'
+	elif any(word in title for word in ['sport', 'game', 'match', 'race', 'competition']):
+		return 'sport'
+	elif any(word in title for word in ['market', 'farmers', 'craft', 'vendor']):
+		return 'markets'
+	elif any(word in title for word in ['business', 'conference', 'workshop', 'seminar', 'networking']):
+		return 'business'
+	elif any(word in title for word in ['community', 'local', 'neighborhood', 'volunteer']):
+		return 'community'
+
+	return 'events'
+
+
+def synthetic_events(count, seed=0):
+	rng = random.Random(seed)
+	return [{
+		'title': f"{rng.choice(TITLES)} {index}",
+		'description': ' '.join(rng.choice(FILLER) for _ in range(20)) + ' at ' + rng.choice(PLACES),
+		'source_category': rng.choice(SOURCE_CATEGORIES)
+	} for index in range(count)]
+
+
+def median_seconds(fn, repeat):
+	timings = []
+	for _ in range(repeat):
+		started = time.perf_counter()
+		fn()
+		timings.append(time.perf_counter() - started)
+	return statistics.median(timings)
+
+
+def main():
+	parser = argparse.ArgumentParser(description='Compare categorization strategies')
+	parser.add_argument('--events', type=int, default=50000)
+	parser.add_argument('--repeat', type=int, default=5)
+	args = parser.parse_args()
+
+	events = synthetic_events(args.events)
+	expected = [legacy_categorize(event) for event in events]
+
+	runs = [('legacy elif chain', lambda: [legacy_categorize(event) for event in events])]
+	engines = [('automaton', EventCategorizer())] if categorizer.ahocorasick is not None else []
+	saved, categorizer.ahocorasick = categorizer.ahocorasick, None
+	engines.append(('substring fallback', EventCategorizer()))
+	categorizer.ahocorasick = saved
+
+	for name, engine in engines:
+		assert engine.categorize_many(events) == expected, f"{name} disagrees with the original rules"
+		runs.append((name, lambda engine=engine: engine.categorize_many(events)))
+
+	for name, run in runs:
+		seconds = median_seconds(run, args.repeat)
+		print(f"{name:20} {len(events)} events  {seconds * 1000:8.1f} ms  {len(events) / seconds:10.0f} events/s")
+	print("all engines match the original rules")
+
+
+if __name__ == '__main__':
+	main()
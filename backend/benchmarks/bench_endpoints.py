@@ -0,0 +1,101 @@
+# bench_endpoints.py (Load test of the Flask endpoints against a local stub of the event sites)
+#
+# Serves a page for every listing URL from a local StubSite, crawls it once into a
+# snapshot through the real HTTP path, then drives the Flask app over real sockets
+# with concurrent clients and reports throughput, p50/p99 latency and peak RSS.
+#
+# Usage, from the backend directory:
+#   python -m benchmarks.bench_endpoints [--events-per-page N] [--clients N] [--requests N]
+#                                        [--save out.json] [--baseline out.json --tolerance 0.25]
+import argparse
+import contextlib
+import io
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Publish the snapshot from here rather than the scheduler, and keep the run out of events.db
+os.environ['EXTERNAL_REFRESH'] = '1'
+os.environ.setdefault('EVENT_DB', '')
+
+import requests
+from werkzeug.serving import make_server
+
+import app as flask_app
+from benchmarks.fixtures import StubSite, listing_pages
+from benchmarks.harness import add_result_arguments, finish, max_rss_mb, summarize
+
+ENDPOINTS = [
+	'/api/events/all',
+	'/api/events/category/festivals',
+	'/api/events?category=food&limit=50',
+	'/api/events?q=harbour&fields=card',
+	'/api/events/status',
+]
+
+
+def load(base_url, path, clients, total):
+	"""Issue `total` GETs of path from `clients` threads; returns the latencies and wall time"""
+	local = threading.local()
+
+	def fetch(_):
+		session = getattr(local, 'session', None)
+		if session is None:
+			session = local.session = requests.Session()
+		started = time.perf_counter()
+		response = session.get(base_url + path)
+		response.raise_for_status()
+		return time.perf_counter() - started
+
+	started = time.perf_counter()
+	with ThreadPoolExecutor(clients) as pool:
+		timings = list(pool.map(fetch, range(total)))
+	return timings, time.perf_counter() - started
+
+
+def main():
+	parser = argparse.ArgumentParser(description='Load-test the Flask endpoints offline')
+	parser.add_argument('--events-per-page', type=int, default=None,
+						help='generate pages of this size instead of replaying recorded ones')
+	parser.add_argument('--clients', type=int, default=8)
+	parser.add_argument('--requests', type=int, default=400, help='requests per endpoint')
+	add_result_arguments(parser)
+	args = parser.parse_args()
+
+	api = flask_app.events_api
+	site = StubSite(listing_pages(api.sources, args.events_per_page))
+	site.point(api)
+
+	started = time.perf_counter()
+	with contextlib.redirect_stdout(io.StringIO()):
+		flask_app.snapshots.publish(flask_app.load_all_events())
+	stats = flask_app.snapshots.peek().data['statistics']
+	print(f"Crawled the stub in {time.perf_counter() - started:.2f}s: {stats['total_events']} events")
+
+	logging.getLogger('werkzeug').setLevel(logging.ERROR)  # no per-request access log
+	server = make_server('127.0.0.1', 0, flask_app.app, threaded=True)
+	threading.Thread(target=server.serve_forever, daemon=True).start()
+	base_url = f'http://127.0.0.1:{server.server_port}'
+
+	results = {}
+	print(f"\n{args.clients} clients, {args.requests} requests per endpoint")
+	print(f"  {'endpoint':40} {'p50 ms':>9} {'p99 ms':>9} {'requests/s':>11} {'peak RSS MB':>12}")
+	try:
+		for path in ENDPOINTS:
+			load(base_url, path, 1, 1)  # build the cached body outside the measurement
+			timings, elapsed = load(base_url, path, args.clients, args.requests)
+			result = dict(summarize(timings), per_second=round(len(timings) / elapsed, 1), peak_mb=max_rss_mb())
+			results[path] = result
+			print(f"  {path:40} {result['p50_ms']:>9.2f} {result['p99_ms']:>9.2f} "
+				  f"{result['per_second']:>11.0f} {result['peak_mb']:>12.1f}")
+	finally:
+		server.shutdown()
+		site.close()
+
+	finish(args, results)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,124 @@
+# bench_event_records.py (Memory and build time of dict events against EventRecords)
+#
+# Usage, from the backend directory:
+#   python -m benchmarks.bench_event_records [--events 100000] [--repeat N]
+import argparse
+import contextlib
+import gc
+import io
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import datetime
+
+import dedup
+from benchmarks.fixtures import card_text
+from sydney_events_api import SydneyEventsAPI
+
+SOURCES = [('Sydney.com', 'https://www.sydney.com', 'Sydney'), ('Visit NSW', 'https://www.visitnsw.com', 'NSW, Australia')]
+SOURCE_CATEGORIES = ['events', 'festivals', 'performance', 'exhibit', 'food', 'sport', 'community', 'markets']
+
+
+class LegacyRecord(dict):
+	"""Stands in for EventRecord in dedup.py: records as the plain dict copies they used to be.
+
+	dedup reads and sets record fields as attributes; here those go straight to the dict.
+	"""
+	__slots__ = ()
+	__getattr__ = dict.get
+	__setattr__ = dict.__setitem__
+
+	@classmethod
+	def from_event(cls, event):
+		return cls(event)
+
+
+def extracted_events(api, count, seed=0):
+	"""Event dicts shaped like the extractors' output, each value a fresh string as parsing makes them"""
+	rng = random.Random(seed)
+	events = []
+	for index in range(count):
+		title, place, date, price = card_text(rng, index)
+		source, base_url, default_location = SOURCES[index % 2]
+		event = {
+			'title': title,
+			'ticket_link': f'{base_url}/events/{seed}-{index}',
+			'location': ''.join(place) or default_location,
+			'description': f'{title} returns to {place} with a program for all ages.',
+			'image_url': f'{base_url}/images/{index}.jpg',
+			'image_alt': ''.join(title),
+		}
+		event.update(api.extract_text_fields(f'{title} {date} {price}'))
+		event['source'] = ''.join(source)
+		event['source_category'] = ''.join(rng.choice(SOURCE_CATEGORIES))
+		event['event_id'] = api.generate_event_id(event)
+		events.append(event)
+	return events
+
+
+def legacy_events(events):
+	"""The dicts as they were held: one datetime.now() string per event"""
+	return [dict(event, scraped_at=datetime.now().isoformat()) for event in events]
+
+
+def held_mb(build):
+	"""Memory still allocated by build()'s result once temporaries are freed, in MB"""
+	gc.collect()
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+	result = build()
+	dedup.token_signature.cache_clear()  # a cache, not part of what is held
+	gc.collect()
+	held = tracemalloc.get_traced_memory()[0] - before
+	tracemalloc.stop()
+	return result, held / 2 ** 20
+
+
+def median_seconds(fn, repeat):
+	timings = []
+	for _ in range(repeat):
+		started = time.perf_counter()
+		fn()
+		timings.append(time.perf_counter() - started)
+	return statistics.median(timings)
+
+
+def build(api, events):
+	with contextlib.redirect_stdout(io.StringIO()):
+		return api.build_response(events, persist=False)
+
+
+def main():
+	parser = argparse.ArgumentParser(description='Compare dict events with EventRecords')
+	parser.add_argument('--events', type=int, default=100000)
+	parser.add_argument('--repeat', type=int, default=3)
+	args = parser.parse_args()
+
+	api = SydneyEventsAPI()
+	source = extracted_events(api, args.events)
+	variants = [
+		('dicts', LegacyRecord, lambda: legacy_events(source)),
+		('EventRecords', dedup.EventRecord, lambda: api.event_records(legacy_events(source)))
+	]
+
+	print(f"{args.events} raw events")
+	print(f"  {'':14} {'raw events MB':>14} {'snapshot MB':>12} {'bytes/event':>12} {'build s':>9}")
+	saved = dedup.EventRecord
+	for name, record_type, make_raw in variants:
+		# One variant at a time, so neither pays for the other's objects in garbage collection
+		dedup.EventRecord = record_type
+		try:
+			raw, raw_mb = held_mb(make_raw)
+			snapshot, snapshot_mb = held_mb(lambda: build(api, raw))
+			total = snapshot['statistics']['total_events']
+			del snapshot
+			seconds = median_seconds(lambda: build(api, raw), args.repeat)
+		finally:
+			dedup.EventRecord = saved
+		del raw
+		gc.collect()
+		print(f"  {name:14} {raw_mb:>14.1f} {snapshot_mb:>12.1f} {snapshot_mb * 2 ** 20 / total:>12.0f} {seconds:>9.2f}")
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,102 @@
+# bench_extraction.py (Visit NSW card extraction time per page)
+#
+# Usage, from the backend directory:
+#   python -m benchmarks.bench_extraction [--repeat N] [--events N]
+import argparse
+import statistics
+import time
+from urllib.parse import urljoin
+
+from benchmarks.fixtures import saved_pages, visit_nsw_page
+from parsing import parse_listing
+from sydney_events_api import SydneyEventsAPI
+
+LEGACY_CONTAINERS = ['div[class*="event"]', 'div[class*="listing"]', 'div[class*="card"]', 'article',
+					 '.event-item', '.listing-item', '.product-item']
+
+
+def legacy_card(api, container, source_category):
+	"""The selector-cascade extraction the single-pass reader replaced"""
+	event_data = {}
+	for selector in ['h1', 'h2', 'h3', 'h4', '.title', '[class*="title"]']:
+		title_elem = container.select_one(selector)
+		if title_elem and len(title_elem.get_text(strip=True)) > 3:
+			event_data['title'] = title_elem.get_text(strip=True)
+			break
+	link_elem = container.find('a', href=True)
+	if link_elem and link_elem.get('href'):
+		event_data['ticket_link'] = urljoin(api.sources['visit_nsw']['base_url'], link_elem.get('href'))
+	img_elem = container.find('img')
+	if img_elem:
+		src = img_elem.get('src') or img_elem.get('data-src')
+		if src:
+			event_data['image_url'] = src if src.startswith('http') else urljoin(api.sources['visit_nsw']['base_url'], src)
+			event_data['image_alt'] = img_elem.get('alt', '')
+	for selector in ['.location', '[class*="location"]', '[class*="venue"]']:
+		location_elem = container.select_one(selector)
+		if location_elem and len(location_elem.get_text(strip=True)) > 2:
+			event_data['location'] = location_elem.get_text(strip=True)
+			break
+	event_data.setdefault('location', "NSW, Australia")
+	for selector in ['.description', '[class*="description"]', 'p']:
+		desc_elem = container.select_one(selector)
+		if desc_elem:
+			desc_text = desc_elem.get_text(strip=True)
+			if len(desc_text) > 20:
+				event_data['description'] = desc_text[:300] + "..." if len(desc_text) > 300 else desc_text
+				break
+	event_data['date_time'] = api.extract_date_from_text(container.get_text())
+	event_data['price'] = api.extract_price_from_text(container.get_text())
+	event_data['source'] = 'Visit NSW'
+	event_data['source_category'] = source_category
+	event_data['event_id'] = api.generate_event_id(event_data)
+	return event_data
+
+
+def legacy_events(api, soup, source_category):
+	for selector in LEGACY_CONTAINERS:
+		containers = soup.select(selector)
+		events = [event for event in (legacy_card(api, c, source_category) for c in containers)
+				  if event.get('title') and len(event['title']) > 5]
+		if events:
+			return events
+	return []
+
+
+def median_ms(fn, repeat):
+	timings = []
+	for _ in range(repeat):
+		started = time.perf_counter()
+		fn()
+		timings.append(time.perf_counter() - started)
+	return statistics.median(timings) * 1000
+
+
+def comparable(events):
+	"""Fields both strategies produce; parsed start/end dates postdate the cascade"""
+	ignored = ('scraped_at', 'start_date', 'end_date')
+	return [{key: value for key, value in event.items() if key not in ignored} for event in events]
+
+
+def main():
+	parser = argparse.ArgumentParser(description='Compare Visit NSW extraction strategies')
+	parser.add_argument('--repeat', type=int, default=20)
+	parser.add_argument('--events', type=int, default=24)
+	args = parser.parse_args()
+
+	api = SydneyEventsAPI()
+	pages = [page for page in saved_pages() if page[0] == 'visit_nsw'] or [('visit_nsw', 'events', visit_nsw_page(args.events))]
+
+	print(f"{'page':32} {'events':>6} {'cascade ms':>11} {'single-pass ms':>15} {'same output':>12}")
+	for source_key, category, html in pages:
+		soup = parse_listing(html, source_key)
+		legacy = legacy_events(api, soup, category)
+		current = api.extract_visit_nsw_events(soup, category)
+		legacy_ms = median_ms(lambda: legacy_events(api, soup, category), args.repeat)
+		current_ms = median_ms(lambda: api.extract_visit_nsw_events(soup, category), args.repeat)
+		print(f"{source_key + '/' + category:32} {len(current):>6} {legacy_ms:>11.2f} {current_ms:>15.2f} "
+			  f"{str(comparable(legacy) == comparable(current)):>12}")
+
+
+if __name__ == '__main__':
+	main()
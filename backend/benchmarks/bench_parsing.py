@@ -0,0 +1,58 @@
+# bench_parsing.py (Parse time and peak memory per listing page)
+#
+# Usage, from the backend directory:
+#   python -m benchmarks.bench_parsing [--repeat N] [--fixtures DIR]
+import argparse
+import statistics
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+from benchmarks.fixtures import FIXTURE_DIR, saved_pages, synthetic_pages
+from sydney_events_api import SydneyEventsAPI
+
+
+def legacy_extract(api, source_key, html, category):
+	"""Full-document html.parser tree, as the scrapers originally built it"""
+	return api.extract_events(source_key, BeautifulSoup(html, 'html.parser'), category)
+
+
+def current_extract(api, source_key, html, category):
+	return api.extract_page_events(source_key, html, category)
+
+
+def measure(fn, repeat):
+	"""Median wall time over repeat runs and the peak traced allocation of one run"""
+	timings = []
+	for _ in range(repeat):
+		started = time.perf_counter()
+		result = fn()
+		timings.append(time.perf_counter() - started)
+
+	tracemalloc.start()
+	fn()
+	_, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return statistics.median(timings), peak, result
+
+
+def main():
+	parser = argparse.ArgumentParser(description='Compare listing parse time and peak memory')
+	parser.add_argument('--repeat', type=int, default=5)
+	parser.add_argument('--fixtures', default=FIXTURE_DIR)
+	args = parser.parse_args()
+
+	api = SydneyEventsAPI()
+	pages = saved_pages(args.fixtures) or synthetic_pages()
+
+	print(f"{'page':32} {'parser':8} {'events':>6} {'median ms':>10} {'peak KiB':>9}")
+	for source_key, category, html in pages:
+		label = f"{source_key}/{category}"
+		for name, extract in (('legacy', legacy_extract), ('lxml', current_extract)):
+			seconds, peak, events = measure(lambda: extract(api, source_key, html, category), args.repeat)
+			print(f"{label:32} {name:8} {len(events):>6} {seconds * 1000:>10.2f} {peak / 1024:>9.0f}")
+
+
+if __name__ == '__main__':
+	main()
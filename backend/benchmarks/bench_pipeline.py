@@ -0,0 +1,98 @@
+# bench_pipeline.py (Per-stage throughput, latency and memory of the scrape-to-response pipeline)
+#
+# Replays a page for every listing URL in SydneyEventsAPI.sources - recorded pages
+# from benchmarks/fixtures/ where saved with record_pages, generated ones otherwise -
+# through parse -> extract -> categorize -> dedup -> build -> serialize, then repeats
+# with generated pages scaled up to each of --sizes total events.
+#
+# Usage, from the backend directory:
+#   python -m benchmarks.bench_pipeline [--sizes 10000,100000] [--repeat N] [--save out.json]
+#                                       [--baseline out.json --tolerance 0.25]
+import argparse
+import contextlib
+import io
+import math
+
+import json_codec
+from benchmarks.fixtures import listing_pages
+from benchmarks.harness import add_result_arguments, finish, peak_memory_mb, summarize, time_stage
+from dedup import DedupIndex
+from parsing import parse_listing
+from sydney_events_api import CATEGORY_GROUPS, SydneyEventsAPI
+
+STAGES = ['parse', 'extract', 'categorize', 'dedup', 'build', 'serialize']
+
+
+def pipeline_stages(api, pages):
+	"""The pipeline as (stage, fn) pairs; each fn feeds the next through `state`"""
+	state = {}
+
+	def parse():
+		state['soups'] = [(source_key, category, parse_listing(html, source_key)) for source_key, category, html in pages]
+
+	def extract():
+		state['events'] = [event for source_key, category, soup in state['soups']
+						   for event in api.extract_events(source_key, soup, category)]
+
+	def categorize():
+		state['categories'] = api.categorizer.categorize_many(state['events'])
+
+	def dedup():
+		index = DedupIndex()
+		for event, category in zip(state['events'], state['categories']):
+			index.add(event, category if category in CATEGORY_GROUPS else 'events')
+		state['records'] = index.records
+
+	def build():
+		with contextlib.redirect_stdout(io.StringIO()):
+			state['response'] = api.build_response(state['events'], persist=False)
+
+	def serialize():
+		state['body'] = json_codec.dumps(state['response'])
+
+	return state, [('parse', parse), ('extract', extract), ('categorize', categorize),
+				   ('dedup', dedup), ('build', build), ('serialize', serialize)]
+
+
+def run_pipeline(api, label, pages, repeat, results):
+	state, stages = pipeline_stages(api, pages)
+	timings = {stage: [] for stage in STAGES}
+	for _ in range(repeat):
+		for stage, fn in stages:
+			timings[stage] += time_stage(fn, 1)[1]
+
+	# One more pass under tracemalloc; it slows allocation, so it is kept out of the timings
+	peaks = {stage: peak_memory_mb(fn) for stage, fn in stages}
+
+	events = len(state['events'])
+	print(f"\n{label}: {len(pages)} pages, {events} events extracted, "
+		  f"{state['response']['statistics']['total_events']} after dedup, {len(state['body']) / 2 ** 20:.1f} MB JSON")
+	print(f"  {'stage':12} {'p50 ms':>10} {'p99 ms':>10} {'events/s':>12} {'peak MB':>9}")
+	for stage in STAGES:
+		result = dict(summarize(timings[stage], events), peak_mb=peaks[stage])
+		results[f'{label}/{stage}'] = result
+		print(f"  {stage:12} {result['p50_ms']:>10.2f} {result['p99_ms']:>10.2f} "
+			  f"{result['per_second'] or 0:>12.0f} {result['peak_mb']:>9.2f}")
+
+
+def main():
+	parser = argparse.ArgumentParser(description='Benchmark each stage of the scraping pipeline offline')
+	parser.add_argument('--sizes', default='10000,100000', help='total events for the generated scale-ups')
+	parser.add_argument('--repeat', type=int, default=5)
+	add_result_arguments(parser)
+	args = parser.parse_args()
+
+	api = SydneyEventsAPI()
+	listings = sum(len(source['urls']) for source in api.sources.values())
+	results = {}
+
+	run_pipeline(api, 'replay', listing_pages(api.sources), args.repeat, results)
+	for size in [int(size) for size in args.sizes.split(',') if size]:
+		pages = listing_pages(api.sources, events_per_page=math.ceil(size / listings))
+		run_pipeline(api, f'{size} events', pages, args.repeat, results)
+
+	finish(args, results)
+
+
+if __name__ == '__main__':
+	main()
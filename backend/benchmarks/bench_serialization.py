@@ -0,0 +1,78 @@
+# bench_serialization.py (Response encoding cost per request at 1k/10k events)
+#
+# Usage, from the backend directory:
+#   python -m benchmarks.bench_serialization [--sizes 1000,10000] [--repeat N]
+import argparse
+import contextlib
+import io
+import statistics
+import time
+
+from flask import Flask
+
+import json_codec
+from benchmarks.fixtures import sydney_com_page
+from response_cache import ResponseCache
+from snapshot_store import Snapshot
+from sydney_events_api import SydneyEventsAPI
+
+
+def snapshot_data(api, events):
+	"""A full API response with `events` distinct events"""
+	raw = api.extract_page_events('sydney_com', sydney_com_page(events, seed=1), 'events')
+	with contextlib.redirect_stdout(io.StringIO()):
+		return api.build_response(raw)
+
+
+def median_seconds(fn, repeat):
+	timings = []
+	for _ in range(repeat):
+		started = time.perf_counter()
+		fn()
+		timings.append(time.perf_counter() - started)
+	return statistics.median(timings)
+
+
+def main():
+	parser = argparse.ArgumentParser(description='Compare response serialization paths')
+	parser.add_argument('--sizes', default='1000,10000')
+	parser.add_argument('--repeat', type=int, default=20)
+	args = parser.parse_args()
+
+	api = SydneyEventsAPI()
+	app = Flask(__name__)
+
+	for size in [int(size) for size in args.sizes.split(',')]:
+		data = snapshot_data(api, size)
+		snapshot = Snapshot(data, 1)
+
+		def stdlib_dumps():
+			saved, json_codec.orjson = json_codec.orjson, None
+			try:
+				return json_codec.dumps(data)
+			finally:
+				json_codec.orjson = saved
+
+		# Flask's provider can't encode EventRecords; give it the plain dicts the API used to build
+		plain = json_codec.loads(json_codec.dumps(data))
+
+		cache = ResponseCache(json_codec.dumps)
+		cache.get('/api/events/all?', snapshot, lambda: data).precompress()
+
+		runs = [
+			('jsonify', lambda: app.json.response(plain).get_data()),
+			('json (stdlib)', stdlib_dumps),
+		]
+		if json_codec.orjson is not None:
+			runs.append(('orjson', lambda: json_codec.dumps(data)))
+		runs.append(('cached bytes + gzip', lambda: cache.get('/api/events/all?', snapshot, lambda: data).encoded('gzip')))
+
+		print(f"\n{data['statistics']['total_events']} events, {len(json_codec.dumps(data)) / 1024:.0f} KB")
+		with app.app_context():
+			for name, run in runs:
+				seconds = median_seconds(run, args.repeat)
+				print(f"  {name:22} {seconds * 1000:9.3f} ms/request  {1 / seconds:10.0f} requests/s")
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,195 @@
+# fixtures.py (Listing pages for offline benchmarks)
+#
+# No recorded pages are committed: benchmarks/fixtures/ is only filled by running
+# benchmarks.record_pages against the live sites. Until then every benchmark runs
+# on the generated pages below, which follow the sites' markup but not their size
+# or mix of cards, and says so when it starts.
+import glob
+import os
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+TITLES = ['Harbour Jazz Night', 'Sydney Film Festival', 'Night Noodle Markets', 'Vivid Light Walk',
+		  'Archibald Prize Exhibition', 'Rugby League Grand Final', 'Farmers Market at Carriageworks',
+		  'Startup Networking Breakfast', 'Community Clean Up Day', 'Opera on the Harbour',
+		  'Wine and Cheese Tasting', 'City2Surf Fun Run', 'Contemporary Art Gallery Late']
+PLACES = ['Circular Quay', 'Darling Harbour', 'The Rocks', 'Barangaroo', 'Surry Hills', 'Newtown', 'Manly']
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+
+def page_noise(rng, links=250):
+	"""Header, navigation and footer markup that surrounds a real listing"""
+	nav = ''.join(f'<li class="nav__item"><a href="/section/{i}">Section {i}</a></li>' for i in range(links))
+	script = '<script>window.__config = {' + ','.join(f'"k{i}": {rng.random()}' for i in range(200)) + '};</script>'
+	return (f'<header class="site-header"><nav><ul>{nav}</ul></nav></header>{script}',
+			f'<footer class="site-footer"><ul>{nav}</ul><p>Copyright Destination NSW</p></footer>')
+
+
+def card_text(rng, index):
+	title = f"{rng.choice(TITLES)} {index}"
+	day = rng.randint(1, 27)
+	month = rng.choice(MONTHS)
+	date = f"{day} {month} - {day + 1} {month}" if rng.random() < 0.5 else f"{day} {month}"
+	price = rng.choice(['Free', f'From ${rng.randint(10, 200)}', f'${rng.randint(10, 90)}.50', ''])
+	return title, rng.choice(PLACES), date, price
+
+
+def sydney_com_page(events=24, seed=0):
+	"""A Sydney.com category page with `events` listing items"""
+	rng = random.Random(seed)
+	header, footer = page_noise(rng)
+	items = []
+	for i in range(events):
+		title, place, date, price = card_text(rng, i)
+		items.append(
+			f'<div class="product-list__item" itemprop="Event" data-type="Event">'
+			f'<a href="/events/{seed}-{i}"><img src="/images/{i}.jpg" alt="{title}"></a>'
+			f'<h3 class="title__product-list-title-heading">{title}</h3>'
+			f'<span class="title__area-name">{place}</span>'
+			f'<div itemprop="description">{title} returns to {place} with a program for all ages.</div>'
+			f'<p class="product-list__date">{date}</p><p class="product-list__price">{price}</p></div>')
+	listing = f'<div class="product-list__results-wrapper">{"".join(items)}</div>'
+	return f'<html><head><title>Events</title></head><body>{header}<main>{listing}</main>{footer}</body></html>'
+
+
+def visit_nsw_page(events=24, seed=0):
+	"""A Visit NSW category page with `events` listing cards"""
+	rng = random.Random(seed)
+	header, footer = page_noise(rng)
+	cards = []
+	for i in range(events):
+		title, place, date, price = card_text(rng, i)
+		cards.append(
+			f'<div class="event-card">'
+			f'<a href="/events/{seed}-{i}"><img data-src="/images/{i}.jpg" alt="{title}"></a>'
+			f'<h3 class="event-card__title">{title}</h3>'
+			f'<div class="event-card__location">{place}</div>'
+			f'<p class="event-card__description">{title} takes over {place} this season, bring friends.</p>'
+			f'<span class="event-card__date">{date}</span><span class="event-card__price">{price}</span></div>')
+	listing = f'<section class="results">{"".join(cards)}</section>'
+	return f'<html><head><title>Events</title></head><body>{header}<main>{listing}</main>{footer}</body></html>'
+
+
+PAGE_BUILDERS = {
+	'sydney_com': sydney_com_page,
+	'visit_nsw': visit_nsw_page
+}
+
+
+def warn_synthetic(directory):
+	print(f"⚠️  No recorded pages in {directory}; using generated pages only "
+		  f"(record them with python -m benchmarks.record_pages)")
+
+
+def saved_pages(directory=FIXTURE_DIR):
+	"""Saved pages named <source_key>__<category>.html, as (source_key, category, html)"""
+	pages = []
+	for path in sorted(glob.glob(os.path.join(directory, '*__*.html'))):
+		source_key, category = os.path.basename(path)[:-len('.html')].split('__', 1)
+		with open(path, encoding='utf-8') as f:
+			pages.append((source_key, category, f.read()))
+	if not pages:
+		warn_synthetic(directory)
+	return pages
+
+
+def synthetic_pages(events_per_page=24):
+	"""One generated page per source, used when no saved pages are available"""
+	return [(source_key, 'events', builder(events_per_page)) for source_key, builder in PAGE_BUILDERS.items()]
+
+
+def fixture_path(source_key, category, directory=FIXTURE_DIR):
+	return os.path.join(directory, f'{source_key}__{category}.html')
+
+
+def listing_pages(sources, events_per_page=None, directory=FIXTURE_DIR):
+	"""One page per URL in `sources`, as (source_key, category, html).
+
+	Recorded pages are replayed as saved; listings without one get a generated
+	page seeded by the listing, so every URL has distinct events. Passing
+	events_per_page generates every page at that size instead, for scale-ups.
+	"""
+	pages = []
+	recorded = 0
+	for seed, (source_key, category) in enumerate(
+			(source_key, category) for source_key, source in sources.items() for category in source['urls']):
+		path = fixture_path(source_key, category, directory)
+		if events_per_page is None and os.path.exists(path):
+			with open(path, encoding='utf-8') as f:
+				pages.append((source_key, category, f.read()))
+			recorded += 1
+		else:
+			pages.append((source_key, category, PAGE_BUILDERS[source_key](events_per_page or 24, seed)))
+	if events_per_page is None and not recorded:
+		warn_synthetic(directory)
+	return pages
+
+
+class StubSite:
+	"""Serve listing pages over local HTTP in place of the live sites.
+
+	point(api) rewrites the API's listing URLs to this server, one host name per
+	source so per-host limits still apply, and drops the politeness delay. Each
+	listing also answers ?page=1 .. ?page=extra_pages with further generated
+	pages of events_per_page events, and an empty listing past those.
+	"""
+
+	HOSTS = ['127.0.0.1', 'localhost']
+
+	def __init__(self, pages, latency=0.0, extra_pages=0, events_per_page=24):
+		self.pages = {f'/{source_key}/{category}': html.encode('utf-8') for source_key, category, html in pages}
+		self.sources = {f'/{source_key}/{category}': source_key for source_key, category, _ in pages}
+		self.latency = latency
+		self.extra_pages = extra_pages
+		self.events_per_page = events_per_page
+		self.requests = 0
+		site = self
+
+		class Handler(BaseHTTPRequestHandler):
+			def do_GET(self):
+				url = urlparse(self.path)
+				site.requests += 1
+				body = site.page(url.path, int(parse_qs(url.query).get('page', ['0'])[0]))
+				if body is None:
+					self.send_error(404)
+					return
+				if site.latency:
+					threading.Event().wait(site.latency)
+				self.send_response(200)
+				self.send_header('Content-Type', 'text/html; charset=utf-8')
+				self.send_header('Content-Length', str(len(body)))
+				self.end_headers()
+				self.wfile.write(body)
+
+			def log_message(self, *args):
+				pass
+
+		self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+		self.server.daemon_threads = True
+		threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+	def page(self, path, page):
+		if path not in self.pages or not page:
+			return self.pages.get(path)
+		events = self.events_per_page if page <= self.extra_pages else 0
+		seed = 1000 * page + list(self.pages).index(path)
+		return PAGE_BUILDERS[self.sources[path]](events, seed).encode('utf-8')
+
+	@property
+	def port(self):
+		return self.server.server_address[1]
+
+	def point(self, api):
+		for index, (source_key, source) in enumerate(api.sources.items()):
+			host = self.HOSTS[index % len(self.HOSTS)]
+			source['request_delay'] = 0
+			source['urls'] = {category: f'http://{host}:{self.port}/{source_key}/{category}' for category in source['urls']}
+
+	def close(self):
+		self.server.shutdown()
+		self.server.server_close()
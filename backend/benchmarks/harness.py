@@ -0,0 +1,102 @@
+# harness.py (Timing, memory and regression checks shared by the suite benchmarks)
+import json
+import math
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+
+
+def percentile(values, fraction):
+	"""Nearest-rank percentile of a list of numbers"""
+	ordered = sorted(values)
+	return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def summarize(timings, items=1):
+	"""p50/p99 latency in milliseconds and items processed per second at the median"""
+	p50 = statistics.median(timings)
+	return {
+		'p50_ms': round(p50 * 1000, 3),
+		'p99_ms': round(percentile(timings, 0.99) * 1000, 3),
+		'per_second': round(items / p50, 1) if p50 else None
+	}
+
+
+def time_stage(fn, repeat):
+	"""Run fn `repeat` times, returning its last result and the durations in seconds"""
+	timings = []
+	result = None
+	for _ in range(repeat):
+		started = time.perf_counter()
+		result = fn()
+		timings.append(time.perf_counter() - started)
+	return result, timings
+
+
+def peak_memory_mb(fn):
+	"""Peak Python heap allocated while fn runs, in MB"""
+	already_tracing = tracemalloc.is_tracing()
+	if not already_tracing:
+		tracemalloc.start()
+	tracemalloc.reset_peak()
+	base = tracemalloc.get_traced_memory()[0]
+	try:
+		fn()
+		return round((tracemalloc.get_traced_memory()[1] - base) / 2 ** 20, 2)
+	finally:
+		if not already_tracing:
+			tracemalloc.stop()
+
+
+def max_rss_mb():
+	"""Peak resident set size of this process so far, in MB"""
+	rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	return round(rss / 2 ** 20 if sys.platform == 'darwin' else rss / 2 ** 10, 1)
+
+
+def save_results(path, results):
+	with open(path, 'w', encoding='utf-8') as f:
+		json.dump(results, f, indent=2, sort_keys=True)
+
+
+def regressions(results, baseline_path, tolerance):
+	"""Entries whose p50 or p99 grew, or whose throughput fell, by more than tolerance against a saved run"""
+	with open(baseline_path, encoding='utf-8') as f:
+		baseline = json.load(f)
+
+	found = []
+	for name, current in results.items():
+		previous = baseline.get(name)
+		if not isinstance(previous, dict):
+			continue
+		for field in ('p50_ms', 'p99_ms', 'peak_mb'):
+			if previous.get(field) and current.get(field) is not None and current[field] > previous[field] * (1 + tolerance):
+				found.append(f"{name} {field}: {previous[field]} -> {current[field]}")
+		if previous.get('per_second') and current.get('per_second') is not None \
+				and current['per_second'] < previous['per_second'] * (1 - tolerance):
+			found.append(f"{name} per_second: {previous['per_second']} -> {current['per_second']}")
+	return found
+
+
+def add_result_arguments(parser):
+	parser.add_argument('--save', help='write the results as JSON, e.g. to use as a baseline')
+	parser.add_argument('--baseline', help='JSON results of an earlier run to compare against')
+	parser.add_argument('--tolerance', type=float, default=0.25,
+						help='allowed slowdown against the baseline before failing (default 0.25)')
+
+
+def finish(args, results):
+	"""Save and/or compare results as requested; exit non-zero on a regression"""
+	if args.save:
+		save_results(args.save, results)
+		print(f"\nSaved results to {args.save}")
+	if args.baseline:
+		found = regressions(results, args.baseline, args.tolerance)
+		if found:
+			print(f"\n❌ {len(found)} regression(s) beyond {args.tolerance:.0%} of {args.baseline}:")
+			for line in found:
+				print(f"  {line}")
+			sys.exit(1)
+		print(f"\n✅ No regressions beyond {args.tolerance:.0%} of {args.baseline}")
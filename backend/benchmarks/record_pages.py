@@ -0,0 +1,59 @@
+# record_pages.py (Save the live listing pages as benchmark fixtures)
+#
+# Fetches every listing URL in SydneyEventsAPI.sources and saves it as
+# benchmarks/fixtures/<source_key>__<category>.html, which the benchmarks replay
+# instead of generated pages. Needs network access; --browser also needs Chrome.
+#
+# Usage, from the backend directory:
+#   python -m benchmarks.record_pages [--browser] [--only sydney_com]
+import argparse
+import os
+import time
+
+from benchmarks.fixtures import FIXTURE_DIR, fixture_path
+from sydney_events_api import SydneyEventsAPI
+
+
+def fetch_http(api, url):
+	response = api.session.get(url, timeout=api.http_timeout)
+	response.raise_for_status()
+	return response.text
+
+
+def fetch_browser(api, source, url):
+	with api.browser_pool.driver() as driver:
+		driver.get(url)
+		api.wait_for_listing(driver, source['ready_selector'])
+		return driver.page_source
+
+
+def main():
+	parser = argparse.ArgumentParser(description='Record listing pages for offline benchmarks')
+	parser.add_argument('--browser', action='store_true', help='save the rendered page from a browser')
+	parser.add_argument('--only', help='record a single source key')
+	args = parser.parse_args()
+
+	api = SydneyEventsAPI()
+	os.makedirs(FIXTURE_DIR, exist_ok=True)
+	try:
+		for source_key, source in api.sources.items():
+			if args.only and source_key != args.only:
+				continue
+			for category, url in source['urls'].items():
+				try:
+					html = fetch_browser(api, source, url) if args.browser else fetch_http(api, url)
+				except Exception as e:
+					print(f"❌ {source_key}/{category}: {e}")
+					continue
+				path = fixture_path(source_key, category)
+				with open(path, 'w', encoding='utf-8') as f:
+					f.write(html)
+				events = len(api.extract_page_events(source_key, html, category))
+				print(f"✅ {source_key}/{category}: {len(html) / 1024:.0f} KB, {events} events -> {path}")
+				time.sleep(source['request_delay'])  # Be respectful
+	finally:
+		api.browser_pool.close()
+
+
+if __name__ == '__main__':
+	main()
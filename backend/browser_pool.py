@@ -0,0 +1,73 @@
+# browser_pool.py (Reusable headless browsers)
+import atexit
+import queue
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+
+class BrowserPool:
+	"""Bounded pool of headless Chrome drivers that are kept alive between scrapes.
+
+	At most `size` drivers exist at once and at most `per_host` pages of the same
+	host are loaded concurrently. A driver that raised while in use is quit and
+	replaced instead of being returned to the pool.
+	"""
+
+	def __init__(self, factory, size=4, per_host=2):
+		self.factory = factory
+		self.size = size
+		self.per_host = per_host
+		self._idle = queue.LifoQueue()
+		self._slots = threading.BoundedSemaphore(size)
+		self._host_slots = {}
+		self._lock = threading.Lock()
+		self._closed = False
+		atexit.register(self.close)
+
+	@contextmanager
+	def host_slot(self, url):
+		"""Hold one of the per-host concurrency slots for url's host"""
+		host = urlparse(url).netloc
+		with self._lock:
+			slot = self._host_slots.get(host)
+			if slot is None:
+				slot = self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+		with slot:
+			yield
+
+	@contextmanager
+	def driver(self):
+		"""Borrow a driver, starting a new one only when no idle driver is available"""
+		with self._slots:
+			try:
+				driver = self._idle.get_nowait()
+			except queue.Empty:
+				driver = self.factory()
+
+			try:
+				yield driver
+			except BaseException:
+				self._quit(driver)
+				raise
+
+			if self._closed:
+				self._quit(driver)
+			else:
+				self._idle.put(driver)
+
+	def close(self):
+		"""Quit every idle driver; drivers in use are quit when returned"""
+		self._closed = True
+		while True:
+			try:
+				driver = self._idle.get_nowait()
+			except queue.Empty:
+				break
+			self._quit(driver)
+
+	def _quit(self, driver):
+		try:
+			driver.quit()
+		except Exception:
+			pass
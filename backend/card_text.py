@@ -0,0 +1,163 @@
+# card_text.py (Date and price extraction from card text)
+import re
+from datetime import datetime, timedelta
+
+
+NO_DATE = "Check event page for dates"
+NO_PRICE = "See event page for pricing"
+
+MONTHS = {name: number for number, name in
+		  enumerate(['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], 1)}
+MONTH = '(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)'
+
+# Every date and price form in one alternation. Group order is priority order within
+# each kind: a "12 Oct" style date beats a numeric one and "from $20" beats a bare
+# "$20" wherever they appear in the text. Dollar amounts are matched by lookahead so
+# they never swallow the day of a following date ("$12 Oct").
+CARD_PATTERN = re.compile(
+	r'(?=[\d$f])(?:'
+	rf'(?P<day_month>(?P<start_day>\d{{1,2}})\s+(?P<start_month>{MONTH})'
+	rf'(?:\s*-\s*(?P<end_day>\d{{1,2}})\s+(?P<end_month>{MONTH}))?)'
+	r'|(?P<numeric>(?P<n_day>\d{1,2})/(?P<n_month>\d{1,2})/(?P<n_year>\d{4}))'
+	r'|(?P<iso>(?P<i_year>\d{4})-(?P<i_month>\d{2})-(?P<i_day>\d{2}))'
+	r'|(?P<price_from>from\s*\$)(?=(?P<from_amount>\d+))'
+	r'|(?P<price>\$)(?=(?P<amount>\d+(?:\.\d{2})?))'
+	r'|(?P<free>free)'
+	r')',
+	re.IGNORECASE)
+
+# Where CARD_PATTERN can match, found fast: a leading character class lets the regex
+# engine skip straight to candidate characters, which CARD_PATTERN's lookahead doesn't,
+# and width-1 lookbehinds pick the alternative. Each branch matches exactly where the
+# CARD_PATTERN alternative it stands for does; CARD_PATTERN then reads that match's groups.
+CANDIDATE_PATTERN = re.compile(
+	r'[\d$Ff](?:'
+	rf'(?<=\d)\d?\s+(?i:{MONTH})'
+	r'|(?<=\d)\d?/\d{1,2}/\d{4}'
+	r'|(?<=\d)\d{3}-\d{2}-\d{2}'
+	r'|(?<=[Ff])(?i:rom)\s*\$(?=\d)'
+	r'|(?<=\$)(?=\d)'
+	r'|(?<=[Ff])(?i:ree)'
+	r')')
+
+# Rank of each alternative keyed by the last group it closes; dates rank 0-2, prices 10-12
+RANKS = {'day_month': 0, 'numeric': 1, 'iso': 2, 'from_amount': 10, 'amount': 11, 'free': 12}
+DATE_KINDS = {'day_month': 'day_month', 'numeric': 'numeric', 'iso': 'iso'}
+
+
+class CardTextExtractor:
+	"""Find a card's date and price in a single scan of its text.
+
+	Date ranges like "12 Oct - 14 Oct" are also turned into start/end datetimes;
+	day-month dates without a year are placed in the year that keeps them no more
+	than lookback_days before the reference date.
+	"""
+
+	def __init__(self, lookback_days=180):
+		self.lookback = timedelta(days=lookback_days)
+
+	def extract(self, text, reference=None):
+		"""Return date_time, price, start_date and end_date for one card's text"""
+		return self.extract_many([text], reference)[0]
+
+	def extract_many(self, texts, reference=None):
+		"""Extract fields for a batch of card texts against one reference date.
+
+		All texts are scanned in one pass, and parsed start/end dates are memoized
+		per date string within the batch, since cards on one listing tend to share
+		a handful of dates.
+		"""
+		reference = reference or datetime.now()
+		parsed_dates = {}
+		results = []
+
+		for date_match, price_match in self._scan_many(texts):
+			if date_match is None:
+				date_text, start, end = NO_DATE, None, None
+			else:
+				kind = DATE_KINDS[date_match.lastgroup]
+				date_text = date_match.group(kind)
+				if date_text not in parsed_dates:
+					parsed_dates[date_text] = self._dates(date_match, reference)
+				start, end = parsed_dates[date_text]
+
+			results.append({
+				'date_time': date_text,
+				'price': self._price(price_match) if price_match else NO_PRICE,
+				'start_date': start,
+				'end_date': end
+			})
+
+		return results
+
+	@staticmethod
+	def _scan_many(texts):
+		"""Best-ranked (date, price) matches of each text, from one pass over all texts joined by NULs.
+
+		No alternative of the pattern matches a NUL, so a match never spans two texts.
+		"""
+		date_matches = [None] * len(texts)
+		price_matches = [None] * len(texts)
+		date_ranks = [3] * len(texts)
+		price_ranks = [13] * len(texts)
+		ends = []
+		offset = -1
+		for text in texts:
+			offset += len(text) + 1
+			ends.append(offset)
+
+		joined = '\0'.join(texts)
+		index = 0
+		for match in CardTextExtractor._matches(joined):
+			while match.start() > ends[index]:
+				index += 1
+			rank = RANKS[match.lastgroup]
+			if rank < date_ranks[index]:
+				date_ranks[index], date_matches[index] = rank, match
+			elif 10 <= rank < price_ranks[index]:
+				price_ranks[index], price_matches[index] = rank, match
+
+		return zip(date_matches, price_matches)
+
+	@staticmethod
+	def _matches(text):
+		"""CARD_PATTERN.finditer(text), jumping between candidates with CANDIDATE_PATTERN"""
+		search, match = CANDIDATE_PATTERN.search, CARD_PATTERN.match
+		candidate = search(text)
+		while candidate is not None:
+			found = match(text, candidate.start())
+			if found is None:  # never expected; keep scanning rather than stop early
+				candidate = search(text, candidate.start() + 1)
+				continue
+			yield found
+			candidate = search(text, found.end())
+
+	@staticmethod
+	def _price(match):
+		if match.group('price_from') is not None:
+			return match.group('price_from') + match.group('from_amount')
+		if match.group('price') is not None:
+			return match.group('price') + match.group('amount')
+		return match.group('free')
+
+	def _dates(self, match, reference):
+		try:
+			if match.group('day_month') is not None:
+				start = datetime(reference.year, MONTHS[match.group('start_month').lower()], int(match.group('start_day')))
+				if start < reference - self.lookback:
+					start = start.replace(year=start.year + 1)
+				if match.group('end_day') is None:
+					return start, start
+				end = datetime(start.year, MONTHS[match.group('end_month').lower()], int(match.group('end_day')))
+				if end < start:
+					end = end.replace(year=end.year + 1)
+				return start, end
+
+			if match.group('numeric') is not None:
+				start = datetime(int(match.group('n_year')), int(match.group('n_month')), int(match.group('n_day')))
+			else:
+				start = datetime(int(match.group('i_year')), int(match.group('i_month')), int(match.group('i_day')))
+			return start, start
+		except ValueError:
+			# e.g. "31 Feb" or a US-style numeric date that isn't a valid day/month
+			return None, None
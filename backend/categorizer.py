@@ -0,0 +1,142 @@
+# categorizer.py (Keyword-based event categorization)
+import json
+import re
+
+try:
+	import ahocorasick
+except ImportError:  # optional; falls back to per-category substring checks
+	ahocorasick = None
+
+
+DEFAULT_CATEGORY = 'events'
+
+# Source category slugs (lower-cased) that map straight onto an API category
+DEFAULT_SOURCE_HINTS = {
+	'festivals': 'festivals', 'festival': 'festivals',
+	'performance': 'performance', 'performanc': 'performance',
+	'exhibit': 'exhibit', 'exhibition': 'exhibit',
+	'food': 'food', 'evtfood': 'food',
+	'sport': 'sport', 'sports': 'sport',
+	'community': 'community', 'evtcomnty': 'community',
+	'markets': 'markets', 'evtmarket': 'markets',
+	'business': 'business', 'evtbus': 'business'
+}
+
+# Keywords searched in the title and description; earlier categories win
+DEFAULT_KEYWORDS = [
+	('festivals', ['festival', 'fest', 'carnival']),
+	('performance', ['concert', 'music', 'band', 'singer', 'performance', 'show', 'theatre', 'theater']),
+	('exhibit', ['exhibition', 'exhibit', 'gallery', 'museum', 'art']),
+	('food', ['food', 'wine', 'dining', 'restaurant', 'cuisine', 'cooking']),
+	('sport', ['sport', 'game', 'match', 'race', 'competition']),
+	('markets', ['market', 'farmers', 'craft', 'vendor']),
+	('business', ['business', 'conference', 'workshop', 'seminar', 'networking']),
+	('community', ['community', 'local', 'neighborhood', 'volunteer'])
+]
+
+
+class EventCategorizer:
+	"""Assign each event one API category from its source category or keywords.
+
+	All keywords are compiled once into a single Aho-Corasick automaton (when
+	pyahocorasick is installed), so each event's text is scanned once no matter
+	how many keywords there are. By default keywords match anywhere in the text,
+	as the original rules did; word_boundaries=True only accepts whole words.
+	"""
+
+	def __init__(self, keywords=None, source_hints=None, default=DEFAULT_CATEGORY, word_boundaries=False):
+		self.keywords = [(category, [word.lower() for word in words])
+						 for category, words in (DEFAULT_KEYWORDS if keywords is None else keywords)]
+		self.source_hints = {slug.lower(): category for slug, category in
+							 (DEFAULT_SOURCE_HINTS if source_hints is None else source_hints).items()}
+		self.default = default
+		self.word_boundaries = word_boundaries
+		self.categories = [category for category, _ in self.keywords]
+		self._automaton = self._build_automaton() if ahocorasick is not None else None
+		self._patterns = [re.compile(r'\b(?:' + '|'.join(map(re.escape, words)) + r')\b')
+						  for _, words in self.keywords]
+
+	@classmethod
+	def from_json(cls, path, **kwargs):
+		"""Load keyword and source-hint tables from a JSON file.
+
+		The file holds {"keywords": [[category, [words...]], ...], "source_hints": {slug: category}};
+		either key may be omitted to keep the defaults.
+		"""
+		with open(path, encoding='utf-8') as f:
+			tables = json.load(f)
+		return cls(keywords=tables.get('keywords'), source_hints=tables.get('source_hints'), **kwargs)
+
+	def _build_automaton(self):
+		automaton = ahocorasick.Automaton()
+		for rank, (_, words) in enumerate(self.keywords):
+			for word in words:
+				# A keyword listed under several categories keeps its highest priority
+				if word not in automaton:
+					automaton.add_word(word, (rank, len(word)))
+		automaton.make_automaton()
+		return automaton
+
+	def categorize(self, event):
+		"""Category for a single event"""
+		return self.categorize_many([event])[0]
+
+	def categorize_many(self, events):
+		"""Categories for a batch of events, scanning all keyword texts in one pass"""
+		categories = [None] * len(events)
+		texts = {}
+
+		for index, event in enumerate(events):
+			category = self.source_hints.get(event.get('source_category', '').lower())
+			if category is not None:
+				categories[index] = category
+			else:
+				# Identical title/description pairs are only classified once
+				text = (event.get('title', '') + ' ' + event.get('description', '')).lower()
+				texts.setdefault(text, []).append(index)
+
+		matches = self._match_batch(list(texts)) if self._automaton is not None else map(self._match_fallback, texts)
+		for category, indexes in zip(matches, texts.values()):
+			for index in indexes:
+				categories[index] = category
+
+		return categories
+
+	def _match_batch(self, texts):
+		"""Run the automaton once over all texts joined by NUL separators"""
+		no_match = len(self.keywords)
+		best = [no_match] * len(texts)
+		ends = []
+		offset = -1
+		for text in texts:
+			offset += len(text) + 1
+			ends.append(offset)
+
+		joined = '\0'.join(texts)
+		index = 0
+		for end, (rank, length) in self._automaton.iter(joined):
+			while end > ends[index]:
+				index += 1
+			if rank < best[index] and (not self.word_boundaries or self._whole_word(joined, end - length + 1, end)):
+				best[index] = rank
+
+		return [self.categories[rank] if rank < no_match else self.default for rank in best]
+
+	def _match_fallback(self, text):
+		if self.word_boundaries:
+			for category, pattern in zip(self.categories, self._patterns):
+				if pattern.search(text):
+					return category
+			return self.default
+
+		for category, words in self.keywords:
+			for word in words:
+				if word in text:
+					return category
+		return self.default
+
+	@staticmethod
+	def _whole_word(text, start, end):
+		before = text[start - 1] if start > 0 else ' '
+		after = text[end + 1] if end + 1 < len(text) else ' '
+		return not (before.isalnum() or before == '_') and not (after.isalnum() or after == '_')
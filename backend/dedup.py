@@ -0,0 +1,185 @@
+# dedup.py (Cross-source event deduplication)
+import gc
+import re
+import unicodedata
+import zlib
+from functools import lru_cache
+from operator import attrgetter
+
+from event_record import FIELDS, MISSING, EventRecord, _all_fields
+
+
+STOPWORDS = {'the', 'a', 'an', 'and', 'of', 'at', 'in', 'on', 'for', 'with', 'to'}
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+YEAR_PATTERN = re.compile(r'^(?:19|20)\d{2}$')
+
+# MinHash over title tokens: 8 hash functions in 4 bands of 2 rows, so titles
+# sharing roughly 70%+ of their tokens almost always land in a common bucket
+MINHASH_PERMUTATIONS = [((i * 0x9E3779B1) | 1, i * 0x7F4A7C15 + 1) for i in range(1, 9)]
+MINHASH_BANDS = 4
+MINHASH_PRIME = (1 << 61) - 1
+
+# Fields every added event is matched on, read straight from its record's slots
+_match_fields = attrgetter('title', 'ticket_link', 'source', 'start_date')
+
+
+def normalize_title(title):
+	"""Lower-case, accent-free title tokens without stopwords or years"""
+	text = unicodedata.normalize('NFKD', title or '').encode('ascii', 'ignore').decode().lower()
+	text = text.replace('&', ' and ')
+	return [token for token in TOKEN_PATTERN.findall(text)
+			if token not in STOPWORDS and not YEAR_PATTERN.match(token)]
+
+
+def normalize_url(url):
+	"""Host (without www.) and path of a URL, ignoring scheme, query and trailing slash"""
+	if not url:
+		return None
+	url = url.lower().split('://', 1)[-1].split('#', 1)[0].split('?', 1)[0]
+	return (url[4:] if url.startswith('www.') else url).rstrip('/')
+
+
+def normalize_location(location):
+	"""Location tokens joined, so "The Rocks, Sydney" and "the rocks sydney" agree"""
+	return ' '.join(normalize_title(location))
+
+
+@lru_cache(maxsize=65536)
+def token_signature(token):
+	"""Per-token MinHash values; titles share a small vocabulary, so these are cached"""
+	h = zlib.crc32(token.encode())
+	return tuple((a * h + b) % MINHASH_PRIME for a, b in MINHASH_PERMUTATIONS)
+
+
+def minhash_bands(tokens):
+	signature = tuple(map(min, zip(*map(token_signature, tokens))))
+	rows = len(signature) // MINHASH_BANDS
+	return [(band,) + tuple(signature[band * rows:(band + 1) * rows]) for band in range(MINHASH_BANDS)]
+
+
+class DedupIndex:
+	"""Collapse the same event scraped from several sources or categories into one record.
+
+	Events are blocked by normalized URL, normalized title and MinHash bands of the
+	title tokens; only events sharing a block are compared, by token Jaccard
+	similarity and start date. Two listings from the same source with different
+	URLs are never merged, and without a start date on both sides the locations
+	must agree too. Each canonical record gains `categories` (every API category
+	it was filed under) and `sources` tuples.
+
+	Events are read through their EventRecord slots rather than the mapping
+	methods, which cost as much as the rest of add() on large builds.
+	"""
+
+	def __init__(self, threshold=0.75, block_size=8):
+		self.threshold = threshold
+		self.block_size = block_size
+		self.records = []
+		self.merged = 0
+		self._tokens = []
+		self._start_dates = []
+		self._urls = []
+		self._blocks = {}
+
+	def add_many(self, events, categories):
+		"""Index a batch of events with their categories.
+
+		The garbage collector is paused meanwhile: indexing only allocates
+		records, sets and block lists, never cycles, but enough of them that
+		collections triggered along the way keep re-scanning every record.
+		"""
+		enabled = gc.isenabled()
+		gc.disable()
+		try:
+			for event, category in zip(events, categories):
+				self.add(event, category)
+		finally:
+			if enabled:
+				gc.enable()
+
+	def add(self, event, category):
+		"""Index one categorized event; returns its canonical record"""
+		# Copied up front: most events are new, and a duplicate's copy is read the same way
+		record = EventRecord.from_event(event)
+		title, ticket_link, source, start_date = (None if value is MISSING else value
+												  for value in _match_fields(record))
+		tokens = normalize_title(title)
+		url = normalize_url(ticket_link)
+		keys = self._keys(url, tokens)
+
+		match = self._find(record, title, source, start_date, tokens, url, keys)
+		if match is None:
+			record.categories = (category,)
+			record.sources = (source,)
+			match = len(self.records)
+			self.records.append(record)
+			self._tokens.append(set(tokens))
+			self._start_dates.append(start_date)
+			# (source, URL) pairs as a tuple: nothing for the collector to track
+			self._urls.append(((source, url),) if url else ())
+		else:
+			canonical = self.records[match]
+			self._merge(canonical, record, source, category)
+			self._start_dates[match] = None if canonical.start_date is MISSING else canonical.start_date
+			if url and (source, url) not in self._urls[match]:
+				self._urls[match] += ((source, url),)
+			self.merged += 1
+
+		for key in keys:
+			block = self._blocks.setdefault(key, [])
+			# Oversized blocks are common-token buckets that stop being selective
+			if match not in block and len(block) < self.block_size:
+				block.append(match)
+		return self.records[match]
+
+	def _keys(self, url, tokens):
+		keys = []
+		if url:
+			keys.append(('url', url))
+		if tokens:
+			keys.append(('title', ' '.join(tokens)))
+			keys.extend(('minhash',) + band for band in minhash_bands(tokens))
+		return keys
+
+	def _find(self, record, title, source, start_date, tokens, url, keys):
+		token_set = set(tokens)
+		location = None
+		checked = set()
+		for key in keys:
+			for candidate in self._blocks.get(key, ()):
+				if candidate in checked:
+					continue
+				checked.add(candidate)
+
+				other_title = self.records[candidate].title
+				if key[0] == 'url' and (None if other_title is MISSING else other_title) == title:
+					return candidate
+				other_start = self._start_dates[candidate]
+				if start_date and other_start and start_date != other_start:
+					continue
+				other = self._tokens[candidate]
+				if not token_set or len(token_set & other) / len(token_set | other) < self.threshold:
+					continue
+
+				# A source lists one event once; another URL there is another event
+				urls = self._urls[candidate]
+				if url and urls and (source, url) not in urls and any(other == source for other, _ in urls):
+					continue
+				if not (start_date and other_start):
+					if location is None:
+						location = normalize_location(record.get('location'))
+					if not location or location != normalize_location(self.records[candidate].get('location')):
+						continue
+				return candidate
+		return None
+
+	@staticmethod
+	def _merge(record, duplicate, source, category):
+		if category not in record.categories:
+			record.categories += (category,)
+		if source not in record.sources:
+			record.sources += (source,)
+		# Fill gaps in the canonical record from the duplicate; both hold interned values already
+		for key, value, current in zip(FIELDS, _all_fields(duplicate), _all_fields(record)):
+			if value and value is not MISSING and (not current or current is MISSING):
+				setattr(record, key, value)
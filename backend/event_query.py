@@ -0,0 +1,145 @@
+# event_query.py (Filtered, paginated and projected event queries)
+import base64
+from datetime import date
+
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+# Fields the frontend's event cards render; `fields=card` selects these
+FIELD_PRESETS = {
+	'card': ['event_id', 'title', 'description', 'image_url', 'image_alt', 'date_time', 'location', 'price',
+			 'ticket_link']
+}
+
+
+def encode_cursor(position):
+	return base64.urlsafe_b64encode(str(position).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+	try:
+		return int(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode())
+	except (ValueError, UnicodeDecodeError):
+		raise ValueError(f'Invalid cursor: {cursor}')
+
+
+def parse_date(value, name):
+	"""A from/to argument as an ISO date (YYYY-MM-DD), None if absent; raises ValueError if invalid"""
+	if not value:
+		return None
+	try:
+		return date.fromisoformat(value).isoformat()
+	except ValueError:
+		raise ValueError(f'Invalid {name} date: {value}')
+
+
+def search_text(event):
+	"""Lower-cased text that free-text queries are matched against"""
+	return ' '.join(event.get(key) or '' for key in ('title', 'description', 'location')).lower()
+
+
+class EventQuery:
+	"""Filters, page size, cursor and field projection for one events request.
+
+	Events are ordered by their position in the published response; the cursor
+	is the position of the last event returned, so a page never repeats or
+	skips events while the snapshot is unchanged.
+	"""
+
+	def __init__(self, category=None, source=None, start=None, end=None, text=None, limit=DEFAULT_LIMIT,
+				 after=None, fields=None):
+		self.category = category
+		self.source = source
+		self.start = start
+		self.end = end
+		self.text = text.lower() if text else None
+		self.limit = limit
+		self.after = after
+		self.fields = fields
+
+	@classmethod
+	def from_args(cls, args, source_names=None):
+		"""Build a query from request arguments; raises ValueError for bad values.
+
+		source_names maps source keys (e.g. sydney_com) to the names stored on events.
+		"""
+		try:
+			limit = int(args.get('limit', DEFAULT_LIMIT))
+		except ValueError:
+			raise ValueError(f"Invalid limit: {args.get('limit')}")
+		if not 1 <= limit <= MAX_LIMIT:
+			raise ValueError(f'limit must be between 1 and {MAX_LIMIT}')
+
+		fields = None
+		if args.get('fields'):
+			fields = []
+			for name in args['fields'].split(','):
+				fields.extend(FIELD_PRESETS.get(name.strip(), [name.strip()]))
+			if 'event_id' not in fields:
+				fields.insert(0, 'event_id')
+
+		source = args.get('source')
+		return cls(
+			category=args.get('category'),
+			source=(source_names or {}).get(source, source),
+			start=parse_date(args.get('from'), 'from'),
+			end=parse_date(args.get('to'), 'to'),
+			text=args.get('q'),
+			limit=limit,
+			after=decode_cursor(args['cursor']) if args.get('cursor') else None,
+			fields=fields
+		)
+
+	@classmethod
+	def date_range(cls, args):
+		"""A query with only the from/to date filters of request arguments; raises ValueError for bad dates"""
+		return cls(start=parse_date(args.get('from'), 'from'), end=parse_date(args.get('to'), 'to'))
+
+	def matches(self, event, categories=None):
+		"""Whether an event passes every filter; categories defaults to the event's own list"""
+		if self.category and self.category not in (categories or event.get('categories', [])):
+			return False
+		if self.source and self.source not in (event.get('sources') or [event.get('source')]):
+			return False
+		if self.start or self.end:
+			# Dates may carry a time (YYYY-MM-DDTHH:MM:SS); both bounds are whole days, inclusive
+			first = event.get('start_date')
+			last = event.get('end_date') or first
+			if not first or (self.start and last[:10] < self.start) or (self.end and first[:10] > self.end):
+				return False
+		return not self.text or self.text in search_text(event)
+
+	def project(self, event):
+		if self.fields is None:
+			return event
+		return {field: event[field] for field in self.fields if field in event}
+
+	def page(self, records):
+		"""Run the query over (position, categories, event) tuples in response order"""
+		matched = [(position, event) for position, categories, event in records
+				   if self.matches(event, categories)]
+		remaining = [(position, event) for position, event in matched
+					 if self.after is None or position > self.after]
+		return self.result([event for _, event in remaining[:self.limit]], len(matched),
+						   remaining[self.limit - 1][0] if len(remaining) > self.limit else None)
+
+	def result(self, events, total, last_position):
+		"""API body for one page; last_position is None on the final page"""
+		events = [self.project(event) for event in events]
+		return {
+			'success': True,
+			'total_events': total,
+			'count': len(events),
+			'events': events,
+			'next_cursor': encode_cursor(last_position) if last_position is not None else None
+		}
+
+
+def response_records(data):
+	"""(position, categories, event) for every event in an API response, in order"""
+	position = 0
+	for category, events in data.get('category_groups', {}).items():
+		for event in events:
+			yield position, event.get('categories', [category]), event
+			position += 1
@@ -0,0 +1,93 @@
+# event_record.py (Compact event records)
+import sys
+from collections.abc import MutableMapping
+from operator import attrgetter
+
+
+# Every field an event or merged record can carry, in output order
+FIELDS = ('title', 'ticket_link', 'location', 'description', 'image_url', 'image_alt', 'date_time', 'price',
+		  'start_date', 'end_date', 'source', 'source_category', 'event_id', 'scraped_at', 'categories', 'sources')
+FIELD_SET = frozenset(FIELDS)
+
+# Fields drawn from a small set of values; interned so every event shares one string
+INTERNED = frozenset(('location', 'date_time', 'price', 'start_date', 'end_date', 'source', 'source_category',
+					  'scraped_at'))
+
+# Value of a field that was never set; every slot always holds a value so reads never raise
+MISSING = object()
+
+_all_fields = attrgetter(*FIELDS)
+
+
+class EventRecord(MutableMapping):
+	"""One event as a fixed set of slots instead of a dict.
+
+	Behaves like the dict it replaces - event['title'], event.get('price'),
+	dict(event) - without a per-event hash table, and with its categorical
+	values interned. A field that was never set is absent, like a missing key;
+	None is a value like any other.
+	"""
+
+	__slots__ = FIELDS
+
+	def __init__(self, fields=()):
+		for key in FIELDS:
+			setattr(self, key, MISSING)
+		for key, value in (fields.items() if hasattr(fields, 'items') else fields):
+			self[key] = value
+
+	@classmethod
+	def from_event(cls, event):
+		"""A record copy of an event dict or record"""
+		return event.copy() if isinstance(event, EventRecord) else cls(event)
+
+	def __getitem__(self, key):
+		if key in FIELD_SET:
+			value = getattr(self, key)
+			if value is not MISSING:
+				return value
+		raise KeyError(key)
+
+	def __setitem__(self, key, value):
+		if key not in FIELD_SET:
+			raise KeyError(f'Unknown event field: {key}')
+		if type(value) is str:
+			if key in INTERNED:
+				value = sys.intern(value)
+			elif key == 'image_alt' and value == self.title:
+				value = self.title  # usually the title; share it
+		setattr(self, key, value)
+
+	def __delitem__(self, key):
+		if key not in self:
+			raise KeyError(key)
+		setattr(self, key, MISSING)
+
+	def __iter__(self):
+		return (key for key, value in zip(FIELDS, _all_fields(self)) if value is not MISSING)
+
+	def __len__(self):
+		return sum(1 for value in _all_fields(self) if value is not MISSING)
+
+	def __contains__(self, key):
+		return key in FIELD_SET and getattr(self, key) is not MISSING
+
+	def get(self, key, default=None):
+		if key in FIELD_SET:
+			value = getattr(self, key)
+			if value is not MISSING:
+				return value
+		return default
+
+	def copy(self):
+		record = EventRecord.__new__(EventRecord)
+		for key, value in zip(FIELDS, _all_fields(self)):
+			# Never share a mutable list between records
+			setattr(record, key, list(value) if type(value) is list else value)
+		return record
+
+	def to_dict(self):
+		return {key: value for key, value in zip(FIELDS, _all_fields(self)) if value is not MISSING}
+
+	def __repr__(self):
+		return f'EventRecord({self.to_dict()!r})'
@@ -0,0 +1,185 @@
+# event_store.py (SQLite persistence for scraped events)
+import json
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+
+from event_query import search_text
+
+
+# Bump when the events tables change; they are rebuilt from listings on the next publish
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+	event_id TEXT PRIMARY KEY,
+	category TEXT NOT NULL,
+	source TEXT,
+	sources TEXT,
+	start_date TEXT,
+	end_date TEXT,
+	location TEXT,
+	position INTEGER NOT NULL,
+	search_text TEXT,
+	seen_at REAL NOT NULL,
+	data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_position ON events (position);
+CREATE INDEX IF NOT EXISTS events_category ON events (category, position);
+CREATE INDEX IF NOT EXISTS events_source ON events (source);
+CREATE INDEX IF NOT EXISTS events_start_date ON events (start_date);
+CREATE INDEX IF NOT EXISTS events_location ON events (location);
+
+CREATE TABLE IF NOT EXISTS event_categories (
+	category TEXT NOT NULL,
+	event_id TEXT NOT NULL REFERENCES events (event_id) ON DELETE CASCADE,
+	PRIMARY KEY (category, event_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS event_categories_event ON event_categories (event_id);
+
+CREATE TABLE IF NOT EXISTS listings (
+	source_key TEXT NOT NULL,
+	category TEXT NOT NULL,
+	refreshed_at REAL NOT NULL,
+	events TEXT NOT NULL,
+	PRIMARY KEY (source_key, category)
+);
+"""
+
+
+class EventStore:
+	"""Embedded SQLite store of the served events, keyed on event_id.
+
+	Each published response is upserted in one transaction and events that
+	dropped out of it are pruned, so the table always mirrors the latest
+	snapshot. Category, source, start date and location are indexed for
+	lookups. The raw events of every scraped listing are kept as well so a
+	restarted process can rebuild its response without scraping first.
+	"""
+
+	def __init__(self, path='events.db'):
+		self.path = path
+		self._local = threading.local()
+		with self._connect() as conn:
+			version, = conn.execute('PRAGMA user_version').fetchone()
+			if version != SCHEMA_VERSION:
+				conn.executescript('DROP TABLE IF EXISTS event_categories; DROP TABLE IF EXISTS events;')
+			conn.executescript(SCHEMA)
+			conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+	def _connect(self):
+		conn = getattr(self._local, 'conn', None)
+		if conn is None:
+			conn = sqlite3.connect(self.path, timeout=30)
+			conn.execute('PRAGMA journal_mode=WAL')
+			conn.execute('PRAGMA foreign_keys=ON')
+			self._local.conn = conn
+		return conn
+
+	def save_listing(self, source_key, category, events, refreshed_at=None):
+		"""Replace the raw events last scraped from one category URL"""
+		with self._connect() as conn:
+			conn.execute(
+				'INSERT OR REPLACE INTO listings (source_key, category, refreshed_at, events) VALUES (?, ?, ?, ?)',
+				(source_key, category, refreshed_at or time.time(), json.dumps(events, ensure_ascii=False, default=dict)))
+
+	def load_listings(self):
+		"""Raw events per (source_key, category), with the time each was scraped"""
+		rows = self._connect().execute('SELECT source_key, category, refreshed_at, events FROM listings')
+		return {(source_key, category): (refreshed_at, json.loads(events))
+				for source_key, category, refreshed_at, events in rows}
+
+	def upsert_response(self, response):
+		"""Upsert every event of an API response and drop events no longer in it"""
+		seen_at = time.time()
+		rows, memberships = [], []
+		position = 0
+		for category, events in response.get('category_groups', {}).items():
+			for event in events:
+				if not event.get('event_id'):
+					continue
+				sources = event.get('sources') or [event.get('source')]
+				rows.append((event['event_id'], category, event.get('source'), '|' + '|'.join(map(str, sources)) + '|',
+							 event.get('start_date'), event.get('end_date'), event.get('location'), position,
+							 search_text(event), seen_at, json.dumps(event, ensure_ascii=False, default=dict)))
+				memberships.extend((member, event['event_id']) for member in event.get('categories', [category]))
+				position += 1
+
+		with self._connect() as conn:
+			conn.executemany(
+				'INSERT INTO events (event_id, category, source, sources, start_date, end_date, location, position, '
+				'search_text, seen_at, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) '
+				'ON CONFLICT (event_id) DO UPDATE SET category = excluded.category, source = excluded.source, '
+				'sources = excluded.sources, start_date = excluded.start_date, end_date = excluded.end_date, '
+				'location = excluded.location, position = excluded.position, search_text = excluded.search_text, '
+				'seen_at = excluded.seen_at, data = excluded.data', rows)
+			conn.execute('DELETE FROM events WHERE seen_at < ?', (seen_at,))
+			# Memberships are small; rewrite them rather than diffing each event's list
+			conn.execute('DELETE FROM event_categories')
+			conn.executemany('INSERT OR IGNORE INTO event_categories (category, event_id) VALUES (?, ?)', memberships)
+		return len(rows)
+
+	def category_events(self, category, start=None, end=None):
+		"""Events filed or also listed under a category, optionally overlapping a date range.
+
+		Events filed under the category come first, then those only listed in it,
+		each in response order.
+		"""
+		sql = ('SELECT e.data FROM event_categories c JOIN events e ON e.event_id = c.event_id '
+			   'WHERE c.category = ?')
+		params = [category]
+		sql, params = self._date_filter(sql, params, start, end)
+		sql += ' ORDER BY e.category != ?, e.position'
+		params.append(category)
+		return [json.loads(data) for data, in self._connect().execute(sql, params)]
+
+	def page(self, query):
+		"""One page of an EventQuery, as the API response body"""
+		where = 'WHERE 1'
+		params = []
+		if query.category:
+			where += ' AND e.event_id IN (SELECT event_id FROM event_categories WHERE category = ?)'
+			params.append(query.category)
+		if query.source:
+			where += " AND e.sources LIKE ? ESCAPE '\\'"
+			params.append('%|' + query.source.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '|%')
+		if query.text:
+			where += ' AND instr(e.search_text, ?) > 0'
+			params.append(query.text)
+		where, params = self._date_filter(where, params, query.start, query.end)
+
+		conn = self._connect()
+		total, = conn.execute(f'SELECT COUNT(*) FROM events e {where}', params).fetchone()
+		if query.after is not None:
+			where += ' AND e.position > ?'
+			params.append(query.after)
+		# Fetch one extra row to know whether another page follows
+		rows = conn.execute(f'SELECT e.position, e.data FROM events e {where} ORDER BY e.position LIMIT ?',
+							params + [query.limit + 1]).fetchall()
+		events = [json.loads(data) for _, data in rows[:query.limit]]
+		return query.result(events, total, rows[query.limit - 1][0] if len(rows) > query.limit else None)
+
+	@staticmethod
+	def _date_filter(sql, params, start, end):
+		# Keep events whose [start_date, end_date] overlaps the requested range. Stored dates
+		# may carry a time, so the inclusive end day is bound as "before the next day"
+		if start:
+			sql += ' AND COALESCE(e.end_date, e.start_date) >= ?'
+			params.append(start)
+		if end:
+			sql += ' AND e.start_date < ?'
+			params.append((date.fromisoformat(end[:10]) + timedelta(days=1)).isoformat())
+		return sql, params
+
+	def status(self):
+		"""Row counts and the age of the oldest stored listing"""
+		conn = self._connect()
+		events, = conn.execute('SELECT COUNT(*) FROM events').fetchone()
+		listings, oldest = conn.execute('SELECT COUNT(*), MIN(refreshed_at) FROM listings').fetchone()
+		return {
+			'path': self.path,
+			'events': events,
+			'listings': listings,
+			'oldest_listing_seconds_ago': round(time.time() - oldest, 1) if oldest else None
+		}
@@ -0,0 +1,87 @@
+# fetch_cache.py (Per-URL validators and parsed listings)
+import hashlib
+import threading
+import time
+
+
+class FetchCache:
+	"""Remember each listing URL's HTTP validators, content hash and parsed events.
+
+	Lets a refresh send conditional requests and skip extraction entirely when
+	the listing content has not changed since it was last parsed.
+	"""
+
+	def __init__(self):
+		self._entries = {}
+		self._lock = threading.Lock()
+		self.stats = {'not_modified': 0, 'unchanged': 0, 'parsed': 0}
+
+	@staticmethod
+	def content_hash(content):
+		if isinstance(content, str):
+			content = content.encode('utf-8')
+		return hashlib.sha1(content).hexdigest()
+
+	def conditional_headers(self, url):
+		"""If-None-Match / If-Modified-Since headers for a previously fetched URL"""
+		entry = self._entries.get(url)
+		if not entry:
+			return {}
+
+		headers = {}
+		if entry.get('etag'):
+			headers['If-None-Match'] = entry['etag']
+		if entry.get('last_modified'):
+			headers['If-Modified-Since'] = entry['last_modified']
+		return headers
+
+	def not_modified(self, url):
+		"""Cached events for a URL the server answered with 304 Not Modified"""
+		entry = self._entries.get(url)
+		if entry is None:
+			return None
+		entry['checked_at'] = time.time()
+		self._count('not_modified')
+		return list(entry['events'])
+
+	def unchanged(self, url, content_hash):
+		"""Cached events if the listing content hash matches the last parse, else None"""
+		entry = self._entries.get(url)
+		if entry is None or entry['content_hash'] != content_hash:
+			return None
+		entry['checked_at'] = time.time()
+		self._count('unchanged')
+		return list(entry['events'])
+
+	def cached_events(self, url):
+		"""Events last parsed from a URL, or None; does not count as a cache hit"""
+		entry = self._entries.get(url)
+		return list(entry['events']) if entry is not None else None
+
+	def cached_age(self, url):
+		"""Seconds since a URL's cached events were last confirmed by a fetch, or None"""
+		entry = self._entries.get(url)
+		return time.time() - entry['checked_at'] if entry is not None else None
+
+	def store(self, url, content_hash, events, headers=None):
+		"""Record freshly parsed events with the response's validators"""
+		headers = headers or {}
+		with self._lock:
+			self._entries[url] = {
+				'content_hash': content_hash,
+				'events': list(events),
+				'etag': headers.get('ETag'),
+				'last_modified': headers.get('Last-Modified'),
+				'checked_at': time.time()
+			}
+			self.stats['parsed'] += 1
+
+	def _count(self, key):
+		with self._lock:
+			self.stats[key] += 1
+
+	def hit_rate(self):
+		with self._lock:
+			total = sum(self.stats.values())
+			hits = self.stats['not_modified'] + self.stats['unchanged']
+		return round(hits / total, 3) if total else None
@@ -0,0 +1,38 @@
+# json_codec.py (JSON encoding for API responses and saved files)
+import json
+from datetime import date
+
+from event_record import EventRecord
+
+try:
+	import orjson
+except ImportError:  # optional; falls back to the standard library encoder
+	orjson = None
+
+
+def _default(value):
+	if isinstance(value, EventRecord):
+		return value.to_dict()
+	if isinstance(value, date):
+		return value.isoformat()
+	raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def dumps(data, indent=False):
+	"""Encode data as UTF-8 JSON bytes, compact unless indent is set, using orjson when installed"""
+	if orjson is not None:
+		return orjson.dumps(data, default=_default, option=orjson.OPT_INDENT_2 if indent else 0)
+	if indent:
+		return json.dumps(data, indent=2, ensure_ascii=False, default=_default).encode('utf-8')
+	return json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=_default).encode('utf-8')
+
+
+def loads(data):
+	"""Decode UTF-8 JSON from bytes or a memoryview"""
+	if orjson is not None:
+		return orjson.loads(data)
+	return json.loads(bytes(data))
+
+
+def encoder_name():
+	return 'orjson' if orjson is not None else 'json'
@@ -0,0 +1,183 @@
+# metrics.py (Stage timings, listing counters and Prometheus exposition)
+import statistics
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+
+PREFIX = 'sydney_events'
+
+# Histogram buckets in seconds, from a cached parse up to a slow browser page load
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# Pipeline stages in the order a listing goes through them
+STAGES = ['load', 'wait', 'parse', 'extract', 'categorize', 'dedup', 'serialize']
+
+
+def _escape(value):
+	return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels):
+	pairs = [f'{key}="{_escape(value)}"' for key, value in labels.items() if value is not None]
+	return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class Metrics:
+	"""Thread-safe stage timings and per-listing counters for one process.
+
+	Stages are timed per (stage, source_key, category); stages that work on the
+	whole response (categorize, dedup, serialize) use empty source and category.
+	Every listing scrape is recorded with its event count, so a listing that
+	suddenly returns zero events - usually a changed page layout - stands out.
+	"""
+
+	def __init__(self, buckets=DEFAULT_BUCKETS, sample_size=500):
+		self.buckets = tuple(buckets)
+		self.started_at = time.time()
+		self._histograms = {}
+		self._samples = {}
+		self._sample_size = sample_size
+		self._listings = {}
+		self._collectors = []
+		self._lock = threading.Lock()
+
+	def observe(self, stage, seconds, source='', category=''):
+		"""Record one duration for a stage"""
+		key = (stage, source, category)
+		with self._lock:
+			histogram = self._histograms.get(key)
+			if histogram is None:
+				histogram = self._histograms[key] = {'buckets': [0] * len(self.buckets), 'count': 0, 'sum': 0.0}
+			for index, bound in enumerate(self.buckets):
+				if seconds <= bound:
+					histogram['buckets'][index] += 1
+			histogram['count'] += 1
+			histogram['sum'] += seconds
+			self._samples.setdefault(stage, deque(maxlen=self._sample_size)).append(seconds)
+
+	@contextmanager
+	def timer(self, stage, source='', category=''):
+		"""Time the body of a with block as one observation of a stage"""
+		started = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.observe(stage, time.perf_counter() - started, source, category)
+
+	def record_listing(self, source, category, events, seconds, error=None):
+		"""Record the outcome of scraping one listing URL"""
+		with self._lock:
+			listing = self._listings.setdefault((source, category), {
+				'runs': 0, 'failures': 0, 'events_total': 0, 'last_events': None, 'peak_events': 0,
+				'last_seconds': None, 'last_error': None, 'last_run': None
+			})
+			listing['runs'] += 1
+			listing['last_seconds'] = round(seconds, 3)
+			listing['last_run'] = time.time()
+			if error is not None:
+				listing['failures'] += 1
+				listing['last_error'] = str(error)
+				return
+			listing['events_total'] += events
+			listing['last_events'] = events
+			listing['peak_events'] = max(listing['peak_events'], events)
+			listing['last_error'] = None
+
+	def add_collector(self, name, help_text, label, collect):
+		"""Export counters read at scrape time, e.g. cache stats, as name{label="key"} value"""
+		self._collectors.append((name, help_text, label, collect))
+
+	def suspected_breakage(self):
+		"""Listings that returned events before but none on their last successful run"""
+		with self._lock:
+			return sorted(f'{source}/{category}' for (source, category), listing in self._listings.items()
+						  if listing['last_events'] == 0 and listing['peak_events'] > 0)
+
+	def render_prometheus(self):
+		"""All metrics in the Prometheus text exposition format"""
+		with self._lock:
+			histograms = {key: dict(value, buckets=list(value['buckets'])) for key, value in self._histograms.items()}
+			listings = {key: dict(value) for key, value in self._listings.items()}
+
+		lines = [f'# HELP {PREFIX}_stage_seconds Time spent in each pipeline stage',
+				 f'# TYPE {PREFIX}_stage_seconds histogram']
+		for (stage, source, category), histogram in sorted(histograms.items()):
+			for bound, count in zip(self.buckets, histogram['buckets']):
+				labels = _labels(stage=stage, source=source, category=category, le=bound)
+				lines.append(f'{PREFIX}_stage_seconds_bucket{labels} {count}')
+			labels = _labels(stage=stage, source=source, category=category, le='+Inf')
+			lines.append(f'{PREFIX}_stage_seconds_bucket{labels} {histogram["count"]}')
+			labels = _labels(stage=stage, source=source, category=category)
+			lines.append(f'{PREFIX}_stage_seconds_sum{labels} {histogram["sum"]:.6f}')
+			lines.append(f'{PREFIX}_stage_seconds_count{labels} {histogram["count"]}')
+
+		listing_metrics = [
+			('listing_runs_total', 'counter', 'Scrapes of each listing URL', 'runs'),
+			('listing_failures_total', 'counter', 'Failed scrapes of each listing URL', 'failures'),
+			('listing_events_total', 'counter', 'Events extracted from each listing URL', 'events_total'),
+			('listing_last_events', 'gauge', 'Events found by the last successful scrape', 'last_events'),
+			('listing_last_seconds', 'gauge', 'Duration of the last scrape', 'last_seconds'),
+		]
+		for name, kind, help_text, field in listing_metrics:
+			lines += [f'# HELP {PREFIX}_{name} {help_text}', f'# TYPE {PREFIX}_{name} {kind}']
+			for (source, category), listing in sorted(listings.items()):
+				if listing[field] is not None:
+					lines.append(f'{PREFIX}_{name}{_labels(source=source, category=category)} {listing[field]}')
+
+		lines += [f'# HELP {PREFIX}_listing_empty Listings that had events before but none on their last scrape',
+				  f'# TYPE {PREFIX}_listing_empty gauge']
+		for (source, category), listing in sorted(listings.items()):
+			empty = int(listing['last_events'] == 0 and listing['peak_events'] > 0)
+			lines.append(f'{PREFIX}_listing_empty{_labels(source=source, category=category)} {empty}')
+
+		for name, help_text, label, collect in self._collectors:
+			lines += [f'# HELP {PREFIX}_{name} {help_text}', f'# TYPE {PREFIX}_{name} counter']
+			for key, value in sorted(collect().items()):
+				lines.append(f'{PREFIX}_{name}{_labels(**{label: key})} {value}')
+
+		return '\n'.join(lines) + '\n'
+
+	def report(self):
+		"""JSON-friendly summary: where time goes by stage and by listing, and what looks broken"""
+		with self._lock:
+			histograms = {key: dict(value) for key, value in self._histograms.items()}
+			samples = {stage: sorted(values) for stage, values in self._samples.items()}
+			listings = {key: dict(value) for key, value in self._listings.items()}
+
+		stages = {}
+		for stage in STAGES + sorted(set(samples) - set(STAGES)):
+			entries = [histogram for (name, _, _), histogram in histograms.items() if name == stage]
+			if not entries:
+				continue
+			count = sum(entry['count'] for entry in entries)
+			total = sum(entry['sum'] for entry in entries)
+			recent = samples.get(stage, [])
+			stages[stage] = {
+				'count': count,
+				'total_seconds': round(total, 3),
+				'mean_seconds': round(total / count, 4),
+				'p50_seconds': round(statistics.median(recent), 4) if recent else None,
+				'p95_seconds': round(recent[min(len(recent) - 1, int(len(recent) * 0.95))], 4) if recent else None
+			}
+
+		per_listing = {}
+		for (source, category), listing in sorted(listings.items()):
+			stage_seconds = {stage: round(histogram['sum'], 3) for (stage, hist_source, hist_category), histogram
+							 in histograms.items() if (hist_source, hist_category) == (source, category)}
+			per_listing[f'{source}/{category}'] = dict(listing, stage_seconds=stage_seconds)
+
+		slowest = max(per_listing.items(), key=lambda item: item[1]['last_seconds'] or 0, default=(None, None))[0]
+		dominant = max(stages.items(), key=lambda item: item[1]['total_seconds'], default=(None, None))[0]
+		return {
+			'generated_at': datetime.now().isoformat(),
+			'uptime_seconds': round(time.time() - self.started_at, 1),
+			'stages': stages,
+			'dominant_stage': dominant,
+			'slowest_listing': slowest,
+			'listings': per_listing,
+			'suspected_breakage': self.suspected_breakage(),
+			'counters': {name: dict(collect()) for name, _, _, collect in self._collectors}
+		}
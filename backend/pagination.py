@@ -0,0 +1,76 @@
+# pagination.py (Multi-page listing crawls)
+
+
+def page_url(url, param, page):
+	"""URL of a listing's page-th page (0 is the listing URL itself), for zero-based ?param=N pagers"""
+	if not page:
+		return url
+	return f"{url}{'&' if '?' in url else '?'}{param}={page}"
+
+
+class ListingCrawl:
+	"""Book-keeping for pages 2..N of one listing, fetched a window at a time.
+
+	The crawl stops at the first page that fails, comes back empty, or only
+	repeats event_ids already known - seen on an earlier page of this crawl, or
+	cached from the last fetch of any page of the listing. Pages past a stop on
+	known ids or a failure keep the events cached from their last fetch, so an
+	unchanged listing costs two pages instead of N without losing coverage.
+
+	Ids known only from the cache end the crawl only while every later page was
+	fetched within max_cached_age seconds; otherwise the listing is crawled in
+	full, so events that expired from later pages are not served indefinitely.
+	"""
+
+	def __init__(self, urls, first_events, fetch_cache, max_cached_age=None):
+		self.urls = urls
+		self.fetch_cache = fetch_cache
+		self.pages = {0: first_events}
+		self.seen = {event['event_id'] for event in first_events}
+		self.known = {event['event_id'] for url in urls for event in fetch_cache.cached_events(url) or []}
+		self.cache_fresh = all(self.fresh(url, max_cached_age) for url in urls[1:])
+		self.next_page = 1
+		self.stopped = None
+
+	def fresh(self, url, max_cached_age):
+		if max_cached_age is None:
+			return True
+		age = self.fetch_cache.cached_age(url)
+		return age is not None and age <= max_cached_age
+
+	def next_pages(self, window):
+		"""Page indexes to fetch next, at most `window` of them; empty once the crawl is over"""
+		if self.stopped is not None:
+			return []
+		pages = list(range(self.next_page, min(self.next_page + window, len(self.urls))))
+		self.next_page += len(pages)
+		return pages
+
+	def add(self, page, events):
+		"""Record one fetched page (events=None if it failed); call in page order"""
+		if events is None:
+			self.stopped = self.stopped or 'failed'
+			return
+		self.pages[page] = events
+		ids = {event['event_id'] for event in events}
+		if not ids:
+			self.stopped = self.stopped or 'empty'
+		elif ids <= self.seen or (self.cache_fresh and ids <= self.seen | self.known):
+			self.stopped = self.stopped or 'known'
+		self.seen |= ids
+
+	def events(self):
+		"""Events of every fetched page, plus cached pages past a stop, each event once"""
+		pages = dict(self.pages)
+		if self.stopped in ('known', 'failed'):
+			for page in range(1, len(self.urls)):
+				if page not in pages:
+					pages[page] = self.fetch_cache.cached_events(self.urls[page]) or []
+
+		events, ids = [], set()
+		for page in sorted(pages):
+			for event in pages[page]:
+				if event['event_id'] not in ids:
+					ids.add(event['event_id'])
+					events.append(event)
+		return events
@@ -0,0 +1,139 @@
+# parsing.py (Listing-only HTML parsing)
+from bs4 import BeautifulSoup, CData, NavigableString, SoupStrainer, Tag
+import soupsieve
+
+
+# lxml is already a dependency and parses several times faster than html.parser
+PARSER = 'lxml'
+
+
+def _classes(attrs):
+	value = attrs.get('class') or ''
+	return ' '.join(value) if isinstance(value, (list, tuple)) else value
+
+
+class ListingStrainer(SoupStrainer):
+	"""Build tree nodes only for tags accepted by predicate(name, attrs) and their subtrees"""
+
+	def __init__(self, predicate):
+		super().__init__()
+		self.predicate = predicate
+
+	def allow_tag_creation(self, nsprefix, name, attrs):
+		# beautifulsoup4 >= 4.13
+		return self.predicate(name, attrs or {})
+
+	def search_tag(self, markup_name=None, markup_attrs={}):
+		# beautifulsoup4 < 4.13
+		if isinstance(markup_name, str):
+			return markup_name if self.predicate(markup_name, dict(markup_attrs or {})) else None
+		return super().search_tag(markup_name, markup_attrs)
+
+
+def _sydney_com_listing(name, attrs):
+	return name == 'div' and 'product-list__results-wrapper' in _classes(attrs).split()
+
+
+def _visit_nsw_listing(name, attrs):
+	classes = _classes(attrs)
+	if name == 'article':
+		return True
+	if name == 'div' and any(fragment in classes for fragment in ('event', 'listing', 'card')):
+		return True
+	return any(token in ('event-item', 'listing-item', 'product-item') for token in classes.split())
+
+
+LISTING_STRAINERS = {
+	'sydney_com': ListingStrainer(_sydney_com_listing),
+	'visit_nsw': ListingStrainer(_visit_nsw_listing)
+}
+
+JSON_LD_STRAINER = SoupStrainer('script', type='application/ld+json')
+
+# Selectors compiled once and shared by every extraction call
+SELECTORS = {
+	'sydney_com_items': soupsieve.compile('div[itemprop="Event"], div[data-type="Event"]'),
+	'sydney_com_title': soupsieve.compile('h3.title__product-list-title-heading, h3'),
+	'sydney_com_location': soupsieve.compile('span.title__area-name'),
+	'sydney_com_description': soupsieve.compile('div[itemprop="description"]'),
+	'visit_nsw_containers': [soupsieve.compile(selector) for selector in (
+		'div[class*="event"]',
+		'div[class*="listing"]',
+		'div[class*="card"]',
+		'article',
+		'.event-item',
+		'.listing-item',
+		'.product-item'
+	)],
+}
+
+
+def _tag(tag_name):
+	return lambda name, classes: name == tag_name
+
+
+def _class_token(token):
+	return lambda name, classes: token in classes.split()
+
+
+def _class_contains(fragment):
+	return lambda name, classes: fragment in classes
+
+
+# Visit NSW card fields as (field, minimum text length, matchers in priority order);
+# the first element matching the earliest matcher with long enough text wins
+VISIT_NSW_FIELDS = (
+	('title', 3, (_tag('h1'), _tag('h2'), _tag('h3'), _tag('h4'), _class_token('title'), _class_contains('title'))),
+	('location', 2, (_class_token('location'), _class_contains('location'), _class_contains('venue'))),
+	('description', 20, (_class_token('description'), _class_contains('description'), _tag('p')))
+)
+
+TEXT_TYPES = (NavigableString, CData)
+
+
+def read_visit_nsw_card(container):
+	"""Read every Visit NSW card field in a single walk of the container's subtree.
+
+	Returns a dict with the title, location and description text (when found),
+	the first link and image tags, and the container's full text.
+	"""
+	candidates = [[None] * len(matchers) for _, _, matchers in VISIT_NSW_FIELDS]
+	link = image = None
+	strings = []
+
+	for node in container.descendants:
+		if isinstance(node, Tag):
+			name = node.name
+			if link is None and name == 'a' and node.get('href') is not None:
+				link = node
+			elif image is None and name == 'img':
+				image = node
+
+			classes = _classes(node.attrs)
+			for (_, _, matchers), found in zip(VISIT_NSW_FIELDS, candidates):
+				for index, matcher in enumerate(matchers):
+					if found[index] is None and matcher(name, classes):
+						found[index] = node
+		elif type(node) in TEXT_TYPES:
+			strings.append(node)
+
+	card = {'link': link, 'image': image, 'text': ''.join(strings)}
+	for (field, min_length, _), found in zip(VISIT_NSW_FIELDS, candidates):
+		for node in found:
+			if node is not None:
+				text = node.get_text(strip=True)
+				if len(text) > min_length:
+					card[field] = text
+					break
+
+	return card
+
+
+def parse_listing(html, source_key):
+	"""Parse only the listing region of a source's page"""
+	return BeautifulSoup(html, PARSER, parse_only=LISTING_STRAINERS[source_key])
+
+
+def parse_json_ld(html):
+	"""Parse only the JSON-LD script blocks of a page"""
+	return BeautifulSoup(html, PARSER, parse_only=JSON_LD_STRAINER)
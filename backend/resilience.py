@@ -0,0 +1,130 @@
+# resilience.py (Retries with backoff and per-host circuit breakers)
+import asyncio
+import random
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+
+class CircuitOpenError(Exception):
+	"""Raised instead of loading a page from a host whose circuit is open"""
+
+
+class RetryPolicy:
+	"""Bounded retries with exponential backoff and full jitter.
+
+	A call is tried at most `attempts` times; before retry n it sleeps a random
+	time of up to base_delay * 2^(n-1) seconds, capped at max_delay, so retries
+	from parallel workers don't hit a struggling host in step.
+	"""
+
+	def __init__(self, attempts=3, base_delay=1.0, max_delay=8.0):
+		self.attempts = attempts
+		self.base_delay = base_delay
+		self.max_delay = max_delay
+
+	def delay(self, attempt):
+		"""Seconds to wait after failed attempt number `attempt` (1-based)"""
+		return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+	def call(self, fn, retryable, label):
+		"""Return fn(), retrying while it raises an exception that retryable(e) accepts"""
+		for attempt in range(1, self.attempts + 1):
+			try:
+				return fn()
+			except Exception as e:
+				if attempt == self.attempts or not retryable(e):
+					raise
+				delay = self.delay(attempt)
+				print(f"    🔁 {label} failed ({e}); retrying in {delay:.1f}s")
+				time.sleep(delay)
+
+	async def call_async(self, fn, retryable, label):
+		"""Async counterpart of call(): awaits fn() and sleeps without blocking the loop"""
+		for attempt in range(1, self.attempts + 1):
+			try:
+				return await fn()
+			except Exception as e:
+				if attempt == self.attempts or not retryable(e):
+					raise
+				delay = self.delay(attempt)
+				print(f"    🔁 {label} failed ({e}); retrying in {delay:.1f}s")
+				await asyncio.sleep(delay)
+
+
+class CircuitBreakers:
+	"""One circuit breaker per host.
+
+	After failure_threshold consecutive failed page loads a host's circuit
+	opens, and loads from it fail at once with CircuitOpenError instead of
+	waiting out timeouts. After reset_timeout seconds one trial load is let
+	through: success closes the circuit, failure opens it again.
+	"""
+
+	def __init__(self, failure_threshold=5, reset_timeout=60.0):
+		self.failure_threshold = failure_threshold
+		self.reset_timeout = reset_timeout
+		self._hosts = {}
+		self._lock = threading.Lock()
+
+	@contextmanager
+	def guard(self, url, counts=None):
+		"""Load from url's host inside this block, counting an exception as the host's failure.
+
+		counts(e) picks the exceptions that say something about the host's health,
+		e.g. timeouts and 5xx but not a 404; any other exception means the host
+		answered, so it counts as a success.
+		"""
+		host = urlparse(url).netloc
+		self._before(host)
+		try:
+			yield
+		except Exception as e:
+			if counts is None or counts(e):
+				self._failure(host)
+			else:
+				self._success(host)
+			raise
+		self._success(host)
+
+	def _before(self, host):
+		with self._lock:
+			state = self._hosts.get(host)
+			if state is None or state['opened_at'] is None:
+				return
+			if state['trial'] or time.monotonic() - state['opened_at'] < self.reset_timeout:
+				raise CircuitOpenError(f"Circuit open for {host} after {state['failures']} failures")
+			state['trial'] = True  # half-open: this load decides
+
+	def _success(self, host):
+		with self._lock:
+			self._hosts.pop(host, None)
+
+	def _failure(self, host):
+		with self._lock:
+			state = self._hosts.setdefault(host, {'failures': 0, 'opened_at': None, 'trial': False})
+			state['failures'] += 1
+			reopened = state['trial']
+			state['trial'] = False
+			if state['opened_at'] is not None and not reopened:
+				return  # a load that started before the circuit opened
+			if state['failures'] < self.failure_threshold and not reopened:
+				return
+			state['opened_at'] = time.monotonic()
+		print(f"⛔ Circuit open for {host} after {state['failures']} failures; retrying in {self.reset_timeout:.0f}s")
+
+	def status(self):
+		"""State of every host with recent failures"""
+		now = time.monotonic()
+		with self._lock:
+			return {
+				host: {
+					'state': 'closed' if state['opened_at'] is None else
+							 'half_open' if state['trial'] or now - state['opened_at'] >= self.reset_timeout else 'open',
+					'failures': state['failures'],
+					'retry_in_seconds': round(max(0.0, state['opened_at'] + self.reset_timeout - now), 1)
+					if state['opened_at'] is not None else None
+				}
+				for host, state in self._hosts.items()
+			}
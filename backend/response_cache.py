@@ -0,0 +1,159 @@
+# response_cache.py (Serialized and precompressed API responses per snapshot)
+import gzip
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+try:
+	import brotli
+except ImportError:  # optional; responses are gzip-compressed only
+	brotli = None
+
+
+# Bodies smaller than this are sent uncompressed; compression wouldn't pay for itself
+MIN_COMPRESS_SIZE = 512
+
+ENCODERS = {'gzip': lambda body: gzip.compress(body, compresslevel=6)}
+if brotli is not None:
+	ENCODERS['br'] = lambda body: brotli.compress(body, quality=5)
+
+# Server preference when the client accepts several encodings equally
+PREFERRED_ENCODINGS = ['br', 'gzip']
+
+
+def negotiate_encoding(accept_encoding, size):
+	"""Best supported Content-Encoding for an Accept-Encoding header, or None for identity"""
+	if not accept_encoding or size < MIN_COMPRESS_SIZE:
+		return None
+
+	accepted = {}
+	for part in accept_encoding.split(','):
+		name, _, params = part.strip().partition(';')
+		quality = 1.0
+		if params.strip().startswith('q='):
+			try:
+				quality = float(params.strip()[2:])
+			except ValueError:
+				quality = 0.0
+		accepted[name.strip().lower()] = quality
+
+	best, best_quality = None, 0.0
+	for encoding in PREFERRED_ENCODINGS:
+		quality = accepted.get(encoding, accepted.get('*', 0.0))
+		if encoding in ENCODERS and quality > best_quality:
+			best, best_quality = encoding, quality
+	return best
+
+
+def etag_matches(if_none_match, etag):
+	"""Whether an If-None-Match header matches an ETag (weak comparison, as RFC 9110 requires)"""
+	if not if_none_match:
+		return False
+	if if_none_match.strip() == '*':
+		return True
+	return any(tag.strip().removeprefix('W/') == etag for tag in if_none_match.split(','))
+
+
+def conditional_response(body, if_none_match, accept_encoding, cache_control):
+	"""(status, headers, content) for serving a CachedBody: 304 on a matching ETag, else the best encoding"""
+	headers = {
+		'ETag': body.etag,
+		'Cache-Control': cache_control,
+		'Vary': 'Accept-Encoding'
+	}
+	if etag_matches(if_none_match, body.etag):
+		return 304, headers, b''
+
+	encoding = negotiate_encoding(accept_encoding, len(body.body))
+	if encoding:
+		headers['Content-Encoding'] = encoding
+	headers['Content-Type'] = 'application/json'
+	return 200, headers, body.encoded(encoding)
+
+
+class CachedBody:
+	"""One serialized response body with a strong ETag and lazily compressed variants"""
+
+	def __init__(self, body):
+		self.body = body
+		self.etag = '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+		self._encoded = {}
+		self._lock = threading.Lock()
+
+	def encoded(self, encoding):
+		"""Body in the given Content-Encoding (None for identity), compressed at most once"""
+		if encoding is None:
+			return self.body
+		variant = self._encoded.get(encoding)
+		if variant is None:
+			with self._lock:
+				variant = self._encoded.get(encoding)
+				if variant is None:
+					variant = self._encoded[encoding] = ENCODERS[encoding](self.body)
+		return variant
+
+	def variants(self):
+		"""The body in every encoding produced so far, as {'identity' or Content-Encoding: bytes}"""
+		return dict(self._encoded, identity=self.body)
+
+	def precompress(self):
+		"""Compress every supported encoding ahead of the first request for it"""
+		if len(self.body) >= MIN_COMPRESS_SIZE:
+			for encoding in ENCODERS:
+				self.encoded(encoding)
+
+
+class ResponseCache:
+	"""Serialized bodies keyed by request, valid while the snapshot they came from is served.
+
+	Entries remember the snapshot object they were built from, so a publish
+	invalidates them without any explicit purge; the least recently used
+	entries are evicted beyond max_entries.
+	"""
+
+	def __init__(self, serialize, max_entries=256, metrics=None):
+		self.serialize = serialize
+		self.max_entries = max_entries
+		self.metrics = metrics
+		self.stats = {'hits': 0, 'misses': 0}
+		self._entries = OrderedDict()
+		self._lock = threading.Lock()
+
+	def peek(self, key, snapshot):
+		"""CachedBody for key under snapshot if it is already cached, else None"""
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is None or entry[0] is not snapshot:
+				return None
+			self._entries.move_to_end(key)
+			self.stats['hits'] += 1
+			return entry[1]
+
+	def get(self, key, snapshot, build):
+		"""CachedBody for key under snapshot, calling build() for the payload on a miss"""
+		body = self.peek(key, snapshot)
+		if body is not None:
+			return body
+
+		payload = build()
+		started = time.perf_counter()
+		body = CachedBody(self.serialize(payload))
+		if self.metrics is not None:
+			self.metrics.observe('serialize', time.perf_counter() - started)
+		with self._lock:
+			self.stats['misses'] += 1
+		return self.put(key, snapshot, body)
+
+	def put(self, key, snapshot, body):
+		"""Cache an already serialized body for key under snapshot"""
+		with self._lock:
+			self._entries[key] = (snapshot, body)
+			self._entries.move_to_end(key)
+			while len(self._entries) > self.max_entries:
+				self._entries.popitem(last=False)
+		return body
+
+	def hit_rate(self):
+		lookups = self.stats['hits'] + self.stats['misses']
+		return round(self.stats['hits'] / lookups, 3) if lookups else None
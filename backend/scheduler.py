@@ -0,0 +1,250 @@
+# scheduler.py (Background refresh of category listings)
+import heapq
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urlparse
+
+
+# Seconds between refreshes of one category URL; busy listings refresh more often
+DEFAULT_INTERVAL = 1800
+DEFAULT_INTERVALS = {
+	('sydney_com', 'events'): 600,
+	('visit_nsw', 'events'): 600,
+	('visit_nsw', 'general'): 900,
+	('visit_nsw', 'markets'): 3600,
+	('visit_nsw', 'business'): 7200,
+}
+
+
+class RefreshScheduler:
+	"""Scrape each category URL on its own cadence and publish the merged result.
+
+	Runs in a daemon thread that hands due jobs to `workers` fetch threads (by
+	default one per pooled browser) that go through the API - plain HTTP first,
+	then its browser pool - so Flask workers never touch Selenium. Jobs for one
+	host start at least the source's request_delay apart. Every finished category replaces its previous
+	events and the combined response is published to the snapshot store in one
+	atomic swap; a category that fails or comes back empty keeps its previous
+	events instead. Listings kept in the API's event store are published on start
+	and only re-scraped once their interval has passed.
+	"""
+
+	def __init__(self, api, store, intervals=None, default_interval=DEFAULT_INTERVAL, jitter=0.2, feed=None,
+				 max_pages=2, workers=None):
+		self.api = api
+		self.store = store
+		self.feed = feed
+		self.max_pages = max_pages
+		self.workers = workers or api.browser_pool.size
+		self._in_flight = 0
+		self._first_pass = set()
+		self.intervals = dict(DEFAULT_INTERVALS if intervals is None else intervals)
+		self.default_interval = default_interval
+		self.jitter = jitter
+		self.results = {}
+		self.last_run = {}
+		self._queue = []
+		self._thread = None
+		self._pid = None
+		self._stop = threading.Event()
+		self._wake = threading.Event()
+		self._lock = threading.Lock()
+		self._publish_lock = threading.Lock()
+
+	def jobs(self):
+		"""All (source_key, category) pairs known to the API"""
+		return [(source_key, category)
+				for source_key, source in self.api.sources.items()
+				for category in source['urls']]
+
+	def interval_for(self, job):
+		return self.intervals.get(job, self.default_interval)
+
+	def next_delay(self, job):
+		"""Interval for a job with random jitter so refreshes don't line up"""
+		interval = self.interval_for(job)
+		return interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+	def start(self):
+		"""Start the worker thread once per process (safe to call after a fork)"""
+		with self._lock:
+			if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+				return
+			self._pid = os.getpid()
+			self._stop.clear()
+			self._in_flight = 0
+			if not self.results and not self.load_stored():
+				# Cold start: stream each listing to followers until every one has run once
+				self._first_pass = set(self.jobs())
+				if self.feed is not None:
+					self.feed.start()
+			now = time.time()
+			self._queue = [(max(now, self.last_run[job] + self.next_delay(job)) if job in self.last_run else now, job)
+						   for job in self.jobs()]
+			heapq.heapify(self._queue)
+			self._thread = threading.Thread(target=self._run, name='refresh-scheduler', daemon=True)
+			self._thread.start()
+
+	def load_stored(self):
+		"""Seed results from stored listings and publish them, so a restart starts warm"""
+		listings = self.api.stored_listings()
+		if not listings:
+			return False
+		for job, (refreshed_at, events) in listings.items():
+			self.results[job] = events
+			self.last_run[job] = refreshed_at
+		print(f"💾 Loaded {len(listings)} stored listings")
+		self.publish(created_at=min(self.last_run.values()))
+		return True
+
+	def stop(self, timeout=None):
+		self._stop.set()
+		self._wake.set()
+		if self._thread is not None:
+			self._thread.join(timeout)
+
+	def prioritize(self, jobs):
+		"""Move jobs to the front of the queue, e.g. for a category nobody has loaded yet"""
+		jobs = set(jobs)
+		with self._lock:
+			self._queue = [(0 if job in jobs else due, job) for due, job in self._queue]
+			heapq.heapify(self._queue)
+		self._wake.set()
+
+	def host(self, job):
+		return urlparse(self.api.sources[job[0]]['urls'][job[1]]).netloc
+
+	def _run(self):
+		host_free_at = {}
+		with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='refresh-job') as executor:
+			while not self._stop.is_set():
+				self._wake.clear()
+				job, wait = self._next_job(host_free_at)
+				if job is None:
+					# Sleep until a job is due, one finishes, or prioritize() reorders the queue
+					self._wake.wait(wait)
+					continue
+				executor.submit(self._run_and_requeue, job)
+
+	def _next_job(self, host_free_at):
+		"""Pop a job that may start now, or return (None, seconds to wait; None until woken)"""
+		with self._lock:
+			while self._queue and self._in_flight < self.workers:
+				due, job = self._queue[0]
+				host = self.host(job)
+				start = max(due, host_free_at.get(host, 0))
+				now = time.time()
+				if start > now:
+					if start > due:
+						# Due, but its host saw a job start less than request_delay ago
+						heapq.heapreplace(self._queue, (start, job))
+						continue
+					return None, start - now
+				heapq.heappop(self._queue)
+				self._in_flight += 1
+				host_free_at[host] = now + self.api.sources[job[0]]['request_delay']
+				return job, None
+			return None, None
+
+	def _run_and_requeue(self, job):
+		try:
+			self.run_job(job)
+		except Exception as e:
+			print(f"    ❌ Refresh of {job[0]}/{job[1]} failed: {e}")
+		finally:
+			with self._lock:
+				self._in_flight -= 1
+				heapq.heappush(self._queue, (time.time() + self.next_delay(job), job))
+			self._wake.set()
+
+	def run_job(self, job):
+		"""Scrape one category URL and publish the updated snapshot"""
+		source_key, category = job
+		print(f"🔄 Refreshing {source_key}/{category}")
+		started = time.monotonic()
+		try:
+			events = self.api.fetch_category(source_key, category, self.max_pages)
+		except Exception as e:
+			print(f"    ❌ Refresh of {source_key}/{category} failed: {e}")
+			self.api.metrics.record_listing(source_key, category, 0, time.monotonic() - started, error=e)
+			self._finish_first_pass(job)
+			return False
+		self.api.metrics.record_listing(source_key, category, len(events), time.monotonic() - started)
+		if not events and self.results.get(job):
+			# Most likely a blocked or broken page; keep serving the last good listing
+			print(f"    ⚠️  {source_key}/{category} came back empty; keeping its last {len(self.results[job])} events")
+			self._finish_first_pass(job)
+			return False
+
+		self.results[job] = events
+		self.last_run[job] = time.time()
+		self.api.store_listing(source_key, category, events)
+		print(f"    ✅ Found {len(events)} events")
+		self.publish()
+		if self.feed is not None and job in self._first_pass:
+			self.feed.push(source_key, category, events)
+		self._finish_first_pass(job)
+		return True
+
+	@property
+	def first_pass_complete(self):
+		"""Whether every listing has been tried at least once since a cold start"""
+		return not self._first_pass
+
+	def _finish_first_pass(self, job):
+		with self._lock:
+			if job not in self._first_pass:
+				return
+			self._first_pass.discard(job)
+			finished = not self._first_pass
+		if finished:
+			# Publish once more now the pass is complete: earlier publishes, and the last
+			# job's own if it ran, were made while it was still running
+			self.publish()
+			if self.feed is not None:
+				self.feed.finish()
+
+	def publish(self, created_at=None):
+		"""Publish every listing's events, unless there are none yet to replace the served snapshot with"""
+		# One build at a time, so a slow build of older results never replaces a newer snapshot
+		with self._publish_lock:
+			all_events = [event for events in list(self.results.values()) for event in events]
+			if not all_events:
+				return None
+			return self.store.publish(self.api.build_response(all_events), created_at)
+
+	def category_freshness(self, category):
+		"""When each listing feeding a category was last refreshed; refreshed_at is the oldest"""
+		runs = {f"{source_key}/{job_category}": self.last_run.get((source_key, job_category))
+				for source_key, job_category in self.api.category_jobs(category)}
+		return freshness(runs)
+
+	def status(self):
+		"""Describe when each category was last refreshed and is next due"""
+		now = time.time()
+		next_due = {job: due for due, job in list(self._queue)}
+		return {
+			f"{source_key}/{category}": {
+				'interval_seconds': self.interval_for((source_key, category)),
+				'last_refreshed_seconds_ago': round(now - self.last_run[(source_key, category)], 1)
+				if (source_key, category) in self.last_run else None,
+				'next_refresh_in_seconds': round(max(0, next_due[(source_key, category)] - now), 1)
+				if (source_key, category) in next_due else None,
+				'events': len(self.results.get((source_key, category), []))
+			}
+			for source_key, category in self.jobs()
+		}
+
+
+def freshness(runs):
+	"""Freshness summary for {listing: last refresh epoch or None}"""
+	loaded = [run for run in runs.values() if run is not None]
+	oldest = min(loaded) if loaded and len(loaded) == len(runs) else None
+	return {
+		'refreshed_at': datetime.fromtimestamp(oldest).isoformat() if oldest else None,
+		'listings': {listing: datetime.fromtimestamp(run).isoformat() if run else None for listing, run in runs.items()}
+	}
@@ -0,0 +1,222 @@
+# shared_snapshot.py (Snapshots shared between worker processes through memory-mapped files)
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from collections.abc import Mapping
+
+try:
+	import fcntl
+except ImportError:  # no flock on Windows; every process produces its own snapshots
+	fcntl = None
+
+import json_codec
+from response_cache import CachedBody
+
+
+# File layout: MAGIC, the index length, the JSON index, then every body back to back
+MAGIC = b'SYDSNAP1'
+HEADER = struct.Struct('<8sQ')
+POINTER = 'current'
+LOCK = 'producer.lock'
+
+
+def snapshot_name(version):
+	return f'snapshot-{version:08d}.bin'
+
+
+def snapshot_version(name):
+	return int(name[len('snapshot-'):-len('.bin')])
+
+
+class MappedBody(CachedBody):
+	"""A CachedBody whose encodings are slices of a mapped snapshot file instead of copies"""
+
+	def __init__(self, payload, etag, ranges):
+		self.etag = etag
+		self._encoded = {encoding: payload[offset:offset + length] for encoding, (offset, length) in ranges.items()}
+		self.body = self._encoded.pop('identity')
+		self._lock = threading.Lock()
+
+
+class SnapshotFile(Mapping):
+	"""One mapped snapshot file, readable as the API response it was written from.
+
+	The response bodies are served straight from the mapping, so every process
+	shares one copy in the page cache; the response itself is only decoded,
+	from the body stored under data_key, when something reads it as a dict.
+	"""
+
+	def __init__(self, path):
+		with open(path, 'rb') as f:
+			self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+		view = memoryview(self._map)
+		magic, index_length = HEADER.unpack_from(view)
+		if magic != MAGIC:
+			raise ValueError(f'Not a snapshot file: {path}')
+		index = json.loads(bytes(view[HEADER.size:HEADER.size + index_length]))
+		payload = view[HEADER.size + index_length:]
+
+		self.path = path
+		self.size = len(view)
+		self.version = index['version']
+		self.created_at = index['created_at']
+		self.freshness = index['freshness']
+		self.data_key = index['data_key']
+		self.bodies = {key: MappedBody(payload, entry['etag'], entry['ranges'])
+					   for key, entry in index['bodies'].items()}
+		self._decoded = None
+		self._lock = threading.Lock()
+
+	def decoded(self):
+		"""The full API response, decoded once on first use"""
+		if self._decoded is None:
+			with self._lock:
+				if self._decoded is None:
+					self._decoded = json_codec.loads(self.bodies[self.data_key].body)
+		return self._decoded
+
+	def __getitem__(self, key):
+		return self.decoded()[key]
+
+	def __iter__(self):
+		return iter(self.decoded())
+
+	def __len__(self):
+		return len(self.decoded())
+
+
+class SharedSnapshot:
+	"""A directory of immutable, versioned snapshot files shared by the processes of one server.
+
+	The process holding the directory's producer lock scrapes and write()s each
+	snapshot as snapshot-<version>.bin, then repoints `current` at it. Every
+	other process maps the file `current` names and swaps to the next one when
+	it changes. The lock is an flock, so it is released when the producer
+	exits and the next process to claim_producer() takes over scraping.
+	"""
+
+	def __init__(self, directory, poll_interval=1.0, keep=2):
+		self.directory = directory
+		self.poll_interval = poll_interval
+		self.keep = keep
+		self.version = None
+		self.size = None
+		os.makedirs(directory, exist_ok=True)
+		self._lock_file = None
+		self._pid = None
+		self._current = None
+		self._checked_at = None
+		self._lock = threading.Lock()
+
+	@property
+	def is_producer(self):
+		# The lock file of a forked parent is inherited, but its lock is not this process's to use
+		return fcntl is None or (self._lock_file is not None and self._pid == os.getpid())
+
+	def claim_producer(self):
+		"""Whether this process is the producer, taking the lock without blocking if it is free"""
+		if self.is_producer:
+			return True
+		with self._lock:
+			if self.is_producer:
+				return True
+			lock_file = open(os.path.join(self.directory, LOCK), 'a+b')
+			try:
+				fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+			except OSError:
+				lock_file.close()
+				return False
+			self._lock_file, self._pid = lock_file, os.getpid()
+		print(f"🔒 Process {self._pid} produces the shared snapshots in {self.directory}")
+		return True
+
+	def write(self, bodies, data_key, created_at, freshness):
+		"""Write {request key: CachedBody} as the next snapshot file and point followers at it.
+
+		data_key names the body holding the full API response; freshness maps
+		each category to its freshness for followers to report.
+		"""
+		name = self._read_pointer()
+		version = snapshot_version(name) + 1 if name else 1
+		index = {
+			'version': version,
+			'created_at': created_at,
+			'data_key': data_key,
+			'freshness': freshness,
+			'bodies': {}
+		}
+		chunks, offset = [], 0
+		for key, body in bodies.items():
+			ranges = {}
+			for encoding, content in body.variants().items():
+				ranges[encoding] = (offset, len(content))
+				chunks.append(content)
+				offset += len(content)
+			index['bodies'][key] = {'etag': body.etag, 'ranges': ranges}
+		index_bytes = json.dumps(index, separators=(',', ':')).encode('utf-8')
+
+		# Files are never changed once named, so a follower never maps a partial one
+		path = os.path.join(self.directory, snapshot_name(version))
+		with open(f'{path}.{os.getpid()}.tmp', 'wb') as f:
+			f.write(HEADER.pack(MAGIC, len(index_bytes)))
+			f.write(index_bytes)
+			f.writelines(chunks)
+		os.replace(f'{path}.{os.getpid()}.tmp', path)
+		self._write_pointer(snapshot_name(version))
+		self.version, self.size = version, HEADER.size + len(index_bytes) + offset
+		self._prune()
+		return path
+
+	def current(self):
+		"""The newest snapshot file, mapped; the pointer is re-read at most every poll_interval seconds"""
+		now = time.monotonic()
+		if self._checked_at is not None and now - self._checked_at < self.poll_interval:
+			return self._current
+		with self._lock:
+			if self._checked_at is not None and now - self._checked_at < self.poll_interval:
+				return self._current
+			self._checked_at = now
+			name = self._read_pointer()
+			if name and (self._current is None or os.path.basename(self._current.path) != name):
+				try:
+					# The old mapping is unmapped once the last snapshot and response using it are gone
+					self._current = SnapshotFile(os.path.join(self.directory, name))
+					self.version, self.size = self._current.version, self._current.size
+				except (OSError, ValueError) as e:
+					print(f"⚠️  Could not map shared snapshot {name}: {e}")
+		return self._current
+
+	def _read_pointer(self):
+		try:
+			with open(os.path.join(self.directory, POINTER), encoding='utf-8') as f:
+				return f.read().strip() or None
+		except FileNotFoundError:
+			return None
+
+	def _write_pointer(self, name):
+		pointer = os.path.join(self.directory, POINTER)
+		with open(f'{pointer}.{os.getpid()}.tmp', 'w', encoding='utf-8') as f:
+			f.write(name)
+		os.replace(f'{pointer}.{os.getpid()}.tmp', pointer)
+
+	def _prune(self):
+		"""Delete all but the newest `keep` files; processes still mapping one keep reading it"""
+		names = sorted(name for name in os.listdir(self.directory)
+					   if name.startswith('snapshot-') and name.endswith('.bin'))
+		for name in names[:-self.keep]:
+			try:
+				os.remove(os.path.join(self.directory, name))
+			except OSError as e:
+				print(f"⚠️  Could not remove old snapshot {name}: {e}")
+
+	def status(self):
+		"""Describe this process's role and the snapshot file it last wrote or mapped"""
+		return {
+			'directory': self.directory,
+			'role': 'producer' if self.is_producer else 'follower',
+			'version': self.version,
+			'size_bytes': self.size
+		}
@@ -0,0 +1,115 @@
+# snapshot_store.py (Cached API responses)
+import threading
+import time
+
+
+class Snapshot:
+	"""One published API response together with its version and age"""
+
+	def __init__(self, data, version, created_at=None):
+		self.data = data
+		self.version = version
+		self.created_at = created_at or time.time()
+
+	def age(self):
+		return time.time() - self.created_at
+
+
+class SnapshotStore:
+	"""Serve the last good response and refresh it with a single scrape at a time.
+
+	With loader=None the store is fed only through publish(), e.g. by the
+	background scheduler, and reads never trigger a scrape.
+	"""
+
+	def __init__(self, loader=None, ttl=900):
+		self.loader = loader
+		self.ttl = ttl
+		self.last_error = None
+		self._current = None
+		self._version = 0
+		self._lock = threading.Lock()
+		self._inflight = None
+		self._published = threading.Event()
+		self._listeners = []
+
+	def get(self, wait_timeout=None):
+		"""Return the current snapshot, refreshing it in the background once it is stale.
+
+		Only a cold store makes callers wait, and then only for the one refresh in flight.
+		Returns None if nothing has been loaded within wait_timeout seconds.
+		"""
+		snapshot = self._current
+		if snapshot is not None:
+			if self.loader is not None and snapshot.age() > self.ttl:
+				self.refresh_async()
+			return snapshot
+
+		if self.loader is None:
+			self._published.wait(wait_timeout)
+		else:
+			self.refresh_async().wait(wait_timeout)
+		return self._current
+
+	def peek(self):
+		"""The current snapshot or None, without waiting or triggering a refresh"""
+		return self._current
+
+	def refresh_async(self):
+		"""Start a refresh unless one is already running; return its completion event"""
+		with self._lock:
+			if self._inflight is not None:
+				return self._inflight
+			inflight = self._inflight = threading.Event()
+
+		thread = threading.Thread(target=self._refresh, args=(inflight,), daemon=True)
+		thread.start()
+		return inflight
+
+	def refresh(self):
+		"""Refresh synchronously, joining a refresh that is already running"""
+		self.refresh_async().wait()
+		return self._current
+
+	def publish(self, data, created_at=None):
+		"""Atomically replace the served snapshot; created_at backdates data loaded from storage"""
+		with self._lock:
+			self._version += 1
+			snapshot = Snapshot(data, self._version, created_at)
+			self._current = snapshot
+		self._published.set()
+		for listener in list(self._listeners):
+			try:
+				listener(snapshot)
+			except Exception as e:
+				print(f"⚠️  Snapshot listener failed: {e}")
+		return snapshot
+
+	def on_publish(self, listener):
+		"""Call listener(snapshot) in the publishing thread after every publish"""
+		self._listeners.append(listener)
+		return listener
+
+	def _refresh(self, inflight):
+		try:
+			data = self.loader()
+			self.publish(data)
+			self.last_error = None
+		except Exception as e:
+			print(f"❌ Snapshot refresh failed: {e}")
+			self.last_error = str(e)
+		finally:
+			with self._lock:
+				self._inflight = None
+			inflight.set()
+
+	def status(self):
+		"""Describe the served snapshot for health checks"""
+		snapshot = self._current
+		return {
+			'version': snapshot.version if snapshot else 0,
+			'age_seconds': round(snapshot.age(), 1) if snapshot else None,
+			'ttl_seconds': self.ttl,
+			'refreshing': self._inflight is not None,
+			'last_error': self.last_error
+		}
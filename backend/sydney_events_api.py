@@ -1,19 +1,44 @@
 # sydney_events_api.py (Standalone Python API)
 import requests
-from bs4 import BeautifulSoup
 import json
-import re
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
 import time
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
 import hashlib
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+from itertools import zip_longest
+from collections import deque
+from browser_pool import BrowserPool
+from fetch_cache import FetchCache
+from categorizer import EventCategorizer
+from dedup import DedupIndex
+from event_record import EventRecord
+from metrics import Metrics
+from pagination import ListingCrawl, page_url
+from resilience import CircuitBreakers, CircuitOpenError, RetryPolicy
+import json_codec
+from card_text import CardTextExtractor, NO_DATE
+from parsing import SELECTORS, parse_listing, parse_json_ld, read_visit_nsw_card
+
+try:
+	from async_engine import AsyncScraper
+except ImportError:  # optional; httpx is only needed for the async engine
+	AsyncScraper = None
+
+
+# Response category groups, in output order
+CATEGORY_GROUPS = ['events', 'festivals', 'performance', 'exhibit', 'food', 'sport', 'community', 'markets',
+				   'business', 'general']
 
 
 class SydneyEventsAPI:
-	def __init__(self):
+	def __init__(self, pool_size=4, per_host_limit=2, page_timeout=20, settle_time=1.0, http_first=True, http_timeout=10,
+				 categorizer=None, event_store=None, metrics=None, retry_policy=None, breakers=None, refresh_timeout=600,
+				 cached_page_ttl=3600):
 		self.session = requests.Session()
 		self.session.headers.update({
 			'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -22,7 +47,16 @@ class SydneyEventsAPI:
 		# All URLs for both sources
 		self.sources = {
 			'sydney_com': {
+				'name': 'Sydney.com',
+				'default_location': 'Sydney',
 				'base_url': 'https://www.sydney.com',
+				'ready_selector': 'div.product-list__results-wrapper div[itemprop="Event"], '
+								  'div.product-list__results-wrapper div[data-type="Event"]',
+				'fixed_wait': 6,
+				'request_delay': 2,
+				# Listings use a zero-based ?page=N pager over HTTP and a "load more" button in a browser
+				'page_param': 'page',
+				'load_more_selector': 'button[class*="load-more"], a[class*="load-more"]',
 				'urls': {
 					"events": "https://www.sydney.com/destinations/sydney/sydney-city/city-centre/events",
 					"festivals": "https://www.sydney.com/destinations/sydney/sydney-city/city-centre/events?19346-classification[]=FESTIVAL",
@@ -34,7 +68,14 @@ class SydneyEventsAPI:
 				}
 			},
 			'visit_nsw': {
+				'name': 'Visit NSW',
+				'default_location': 'NSW, Australia',
 				'base_url': 'https://www.visitnsw.com',
+				'ready_selector': 'div[class*="event"], div[class*="listing"], div[class*="card"], article',
+				'fixed_wait': 8,
+				'request_delay': 3,
+				'page_param': 'page',
+				'load_more_selector': 'button[class*="load-more"], a[class*="load-more"], button[class*="show-more"]',
 				'urls': {
 					"events": "https://www.visitnsw.com/events",
 					"general": "https://www.visitnsw.com/events?17896-classification[]=EVTCLASS",
@@ -50,6 +91,49 @@ class SydneyEventsAPI:
 			}
 		}
 
+		# Browsers are shared by all scrapes made through this instance
+		self.browser_pool = BrowserPool(self.setup_selenium_driver, size=pool_size, per_host=per_host_limit)
+
+		# Listing readiness: give up after page_timeout seconds, treat the listing as
+		# complete once its item count has not changed for settle_time seconds
+		self.page_timeout = page_timeout
+		self.settle_time = settle_time
+		self.poll_interval = 0.25
+		self.page_timings = deque(maxlen=500)
+
+		# Try a plain HTTP fetch through self.session before starting a browser
+		self.http_first = http_first
+		self.http_timeout = http_timeout
+
+		# Keyword tables compiled once; pass an EventCategorizer to use other tables
+		self.categorizer = categorizer or EventCategorizer()
+
+		# Single-scan date and price extraction shared by all extractors
+		self.card_text = CardTextExtractor()
+
+		# Index of the container selector that last matched, per source
+		self.container_selectors = {}
+
+		# Validators and content hashes of fetched listings, so unchanged pages aren't re-parsed.
+		# A crawl stops early on known events only while its later pages are younger than cached_page_ttl
+		self.fetch_cache = FetchCache()
+		self.cached_page_ttl = cached_page_ttl
+
+		# Optional EventStore that keeps published events and raw listings across restarts
+		self.event_store = event_store
+
+		# Stage timings and per-listing counters behind /metrics and the run report
+		self.metrics = metrics or Metrics()
+
+		# Transient page load failures are retried with backoff; a host that keeps failing
+		# is skipped until its circuit closes, and a crawl stops waiting on listings after
+		# refresh_timeout seconds. Failed or empty listings serve their last good events.
+		self.retry_policy = retry_policy or RetryPolicy()
+		self.breakers = breakers or CircuitBreakers()
+		self.refresh_timeout = refresh_timeout
+		self.last_good = {}
+		self._last_good_loaded = False
+
 	def setup_selenium_driver(self):
 		"""Setup headless Chrome driver"""
 		chrome_options = Options()
@@ -59,57 +143,106 @@ class SydneyEventsAPI:
 		chrome_options.add_argument('--window-size=1920,1080')
 		chrome_options.add_argument('--disable-logging')
 		chrome_options.add_argument('--log-level=3')
-		return webdriver.Chrome(options=chrome_options)
-
-	def scrape_all_events(self, max_pages=2):
-		"""Main API method - scrape all events and return organized data"""
+		driver = webdriver.Chrome(options=chrome_options)
+		# A hung page load or script raises instead of holding the pooled browser forever
+		driver.set_page_load_timeout(self.page_timeout)
+		driver.set_script_timeout(self.page_timeout)
+		return driver
+
+	@staticmethod
+	def retryable_http_error(error):
+		"""Timeouts, dropped connections, 429 and 5xx responses are worth retrying; other HTTP errors are not"""
+		if isinstance(error, requests.HTTPError) and error.response is not None:
+			return error.response.status_code == 429 or error.response.status_code >= 500
+		return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+	@staticmethod
+	def retryable_browser_error(error):
+		"""Browser start-up failures and page load timeouts are worth retrying"""
+		return isinstance(error, WebDriverException)
+
+	def scrape_all_events(self, max_pages=2, on_batch=None):
+		"""Main API method - scrape all events and return organized data.
+
+		on_batch(source_key, category, events) is called as each listing page finishes.
+		"""
 		print("🚀 Starting Sydney Events API...")
 		print("📊 Scraping all categories from Sydney.com and Visit NSW...")
 
-		# Initialize category groups
-		category_groups = {
-			'events': [],
-			'festivals': [],
-			'performance': [],
-			'exhibit': [],
-			'food': [],
-			'sport': [],
-			'community': [],
-			'markets': [],
-			'business': [],
-			'general': []
-		}
-
-		# Scrape Sydney.com
-		print("\n🏢 Scraping Sydney.com...")
-		sydney_events = self.scrape_sydney_com_all_categories(max_pages)
-
-		# Scrape Visit NSW
-		print("\n🗺️  Scraping Visit NSW...")
-		visit_nsw_events = self.scrape_visit_nsw_all_categories(max_pages)
+		# Scrape both sources at once through the browser pool
+		jobs = [(source_key, category) for source_key, source in self.sources.items() for category in source['urls']]
+		results = [None] * len(jobs)
+		for index, events in self.iter_category_batches(jobs, max_pages):
+			source_key, category = jobs[index]
+			events = results[index] = self.listing_result(source_key, category, events)
+			if on_batch is not None:
+				on_batch(source_key, category, events)
+
+		totals = {}
+		for (source_key, _), events in zip(jobs, results):
+			totals[source_key] = totals.get(source_key, 0) + len(events)
+		print(f"\n🏢 Sydney.com total: {totals.get('sydney_com', 0)} events")
+		print(f"🗺️  Visit NSW total: {totals.get('visit_nsw', 0)} events")
 
 		# Combine all events
-		all_events = sydney_events + visit_nsw_events
+		all_events = [event for events in results for event in events]
 		print(f"\n📈 Total raw events collected: {len(all_events)}")
-
-		# Group events by category using intelligent categorization
-		for event in all_events:
-			category = self.categorize_event(event)
-			if category in category_groups:
-				category_groups[category].append(event)
-			else:
-				category_groups['events'].append(event)  # Default category
-
-		# Remove duplicates within each category
-		for category in category_groups:
-			category_groups[category] = self.remove_duplicates(category_groups[category])
+		if not all_events:
+			# Raising keeps whatever is served now instead of replacing it with nothing
+			raise RuntimeError('No listing returned events or has earlier ones to fall back on')
+
+		return self.build_response(all_events)
+
+	def category_jobs(self, category):
+		"""(source_key, category) pairs whose listing URL feeds an API category"""
+		return [(source_key, category) for source_key, source in self.sources.items() if category in source['urls']]
+
+	def scrape_category_response(self, category, max_pages=2):
+		"""Scrape only the listing URLs that feed one category and build a response from them"""
+		jobs = self.category_jobs(category)
+		print(f"🚀 Scraping {len(jobs)} listing(s) for {category}...")
+		results = self.scrape_categories(jobs, max_pages)
+		all_events = [event for events in results for event in events]
+		if not all_events:
+			raise RuntimeError(f'No listing for {category} returned events or has earlier ones to fall back on')
+		# A partial crawl must not replace the full event set in the store
+		return self.build_response(all_events, persist=False)
+
+	async def scrape_all_events_async(self, max_pages=2, on_batch=None):
+		"""Async counterpart of scrape_all_events, run on the caller's event loop (needs httpx)"""
+		if AsyncScraper is None:
+			raise RuntimeError('The async scraping engine needs httpx installed')
+		scraper = AsyncScraper(self, per_host=self.browser_pool.per_host)
+		return await scraper.scrape_all_events(max_pages, on_batch)
+
+	def build_response(self, all_events, persist=True):
+		"""Categorize, dedupe and summarize raw events into the API response"""
+		# Initialize category groups
+		category_groups = {category: [] for category in CATEGORY_GROUPS}
+
+		# Merge the same event found in several sources or categories into one record
+		with self.metrics.timer('categorize'):
+			categories = self.categorizer.categorize_many(all_events)
+		dedup = DedupIndex()
+		with self.metrics.timer('dedup'):
+			dedup.add_many(all_events, [category if category in category_groups else 'events'  # Default category
+										for category in categories])
+
+		# File each record once, under its most specific category, counting sources on the way
+		source_counts = {}
+		for record in dedup.records:
+			for category in record.categories:
+				if category != 'events':
+					break
+			category_groups[category].append(record)
+			source = record.source
+			source_counts[source] = source_counts.get(source, 0) + 1
 
 		# Calculate statistics
-		total_events = sum(len(events) for events in category_groups.values())
-		sydney_com_total = sum(
-			len([e for e in events if e.get('source') == 'Sydney.com']) for events in category_groups.values())
-		visit_nsw_total = sum(
-			len([e for e in events if e.get('source') == 'Visit NSW']) for events in category_groups.values())
+		total_events = len(dedup.records)
+		sydney_com_total = source_counts.get('Sydney.com', 0)
+		visit_nsw_total = source_counts.get('Visit NSW', 0)
+		categories_with_events = len([category for category, events in category_groups.items() if events])
 
 		# Create final response
 		response = {
@@ -124,7 +257,8 @@ class SydneyEventsAPI:
 				'total_events': total_events,
 				'sydney_com_count': sydney_com_total,
 				'visit_nsw_count': visit_nsw_total,
-				'categories_with_events': len([cat for cat, events in category_groups.items() if events])
+				'duplicates_merged': dedup.merged,
+				'categories_with_events': categories_with_events
 			},
 			'category_counts': {category: len(events) for category, events in category_groups.items() if events},
 			'category_groups': category_groups
@@ -134,87 +268,489 @@ class SydneyEventsAPI:
 		print(f"📊 Total events: {total_events}")
 		print(f"🏢 Sydney.com: {sydney_com_total}")
 		print(f"🗺️  Visit NSW: {visit_nsw_total}")
-		print(f"📂 Categories with events: {len([cat for cat, events in category_groups.items() if events])}")
+		print(f"📂 Categories with events: {categories_with_events}")
+
+		if persist and self.event_store is not None:
+			self.event_store.upsert_response(response)
 
 		return response
 
+	def listing_result(self, source_key, category, events):
+		"""Events to serve for a scraped listing (events=None if it failed).
+
+		Fresh events become the listing's last good result and are stored; a
+		listing that failed or came back empty serves its last good events -
+		from this process, or from the event store after a restart - instead.
+		"""
+		job = (source_key, category)
+		if events:
+			self.last_good[job] = events
+			self.store_listing(source_key, category, events)
+			return events
+
+		if job not in self.last_good and not self._last_good_loaded:
+			self._last_good_loaded = True
+			for stored_job, (_, stored_events) in self.stored_listings().items():
+				self.last_good.setdefault(stored_job, stored_events)
+		fallback = self.last_good.get(job)
+		if fallback:
+			print(f"    ♻️  Keeping the last {len(fallback)} good events of {source_key}/{category}")
+			return fallback
+		return []
+
+	def store_listing(self, source_key, category, events):
+		"""Persist one category's raw events so a restart can rebuild the response"""
+		if self.event_store is not None:
+			self.event_store.save_listing(source_key, category, events)
+
+	def stored_listings(self):
+		"""Raw events per (source_key, category) from the event store, with their scrape times"""
+		if self.event_store is None:
+			return {}
+		return {job: (refreshed_at, [EventRecord(event) for event in events])
+				for job, (refreshed_at, events) in self.event_store.load_listings().items()
+				if job[0] in self.sources and job[1] in self.sources[job[0]]['urls']}
+
+	def stored_response(self):
+		"""Rebuild the API response from stored listings, or None if nothing is stored"""
+		listings = self.stored_listings()
+		if not listings:
+			return None
+		return self.build_response([event for _, events in listings.values() for event in events])
+
 	def scrape_sydney_com_all_categories(self, max_pages=2):
 		"""Scrape all categories from Sydney.com at once"""
-		all_events = []
+		all_events = self.scrape_source_all_categories('sydney_com', max_pages)
+		print(f"🏢 Sydney.com total: {len(all_events)} events")
+		return all_events
 
+	def scrape_visit_nsw_all_categories(self, max_pages=2):
+		"""Scrape all categories from Visit NSW at once"""
+		all_events = self.scrape_source_all_categories('visit_nsw', max_pages)
+		print(f"🗺️  Visit NSW total: {len(all_events)} events")
+		return all_events
+
+	def scrape_source_all_categories(self, source_key, max_pages=2):
+		"""Scrape every category URL of one source"""
+		jobs = [(source_key, category) for category in self.sources[source_key]['urls']]
+		results = self.scrape_categories(jobs, max_pages)
+		return [event for events in results for event in events]
+
+	def scrape_categories(self, jobs, max_pages=2):
+		"""Scrape (source_key, category) jobs concurrently; returns one event list per job"""
+		results = [None] * len(jobs)
+		for index, events in self.iter_category_batches(jobs, max_pages):
+			results[index] = self.listing_result(*jobs[index], events)
+		return results
+
+	def iter_category_batches(self, jobs, max_pages=2):
+		"""Scrape jobs concurrently, yielding (job index, events) as each listing finishes.
+
+		events is None for a listing that failed, or that was still running
+		refresh_timeout seconds in; those are left to finish in the background.
+		"""
+		# Alternate between sources so workers don't all queue on one host's limit
+		by_source = {}
+		for index, job in enumerate(jobs):
+			by_source.setdefault(job[0], []).append(index)
+		order = [index for batch in zip_longest(*by_source.values()) for index in batch if index is not None]
+
+		executor = ThreadPoolExecutor(max_workers=self.browser_pool.size)
+		futures = {executor.submit(self.scrape_category_job, *jobs[index], max_pages): index for index in order}
+		pending = set(futures)
+		try:
+			for future in as_completed(futures, timeout=self.refresh_timeout):
+				pending.discard(future)
+				yield futures[future], future.result()
+		except FuturesTimeout:
+			for future in pending:
+				source_key, category = jobs[futures[future]]
+				print(f"    ⏱️  Gave up waiting on {source_key}/{category} after {self.refresh_timeout}s")
+				yield futures[future], None
+		finally:
+			executor.shutdown(wait=False, cancel_futures=True)
+
+	def stream_records(self, batches):
+		"""Categorize and dedupe BatchFeed batches of raw events as they arrive.
+
+		Yields (category, record) once per distinct event, the first time it is
+		seen; later duplicates only fill in the index, not the stream.
+		"""
+		dedup = DedupIndex()
+		for batch in batches:
+			events = batch['events']
+			for event, category in zip(events, self.categorizer.categorize_many(events)):
+				category = category if category in CATEGORY_GROUPS else 'events'
+				merged = dedup.merged
+				record = dedup.add(event, category)
+				if dedup.merged == merged:
+					yield category, record
+
+	def scrape_category_job(self, source_key, category, max_pages=1):
+		"""Scrape one category listing across up to max_pages pages, logging the outcome"""
+		source = self.sources[source_key]
+		url = source['urls'][category]
+
+		print(f"  📄 Scraping {category}: {url}")
+		started = time.monotonic()
 		try:
-			driver = self.setup_selenium_driver()
+			events = self.fetch_category(source_key, category, max_pages)
+			print(f"    ✅ Found {len(events)} events ({source['name']} {category})")
+			self.metrics.record_listing(source_key, category, len(events), time.monotonic() - started)
+		except Exception as e:
+			print(f"    ❌ Error ({source['name']} {category}): {e}")
+			self.metrics.record_listing(source_key, category, 0, time.monotonic() - started, error=e)
+			events = None
 
-			# Scrape each category URL
-			for category, url in self.sources['sydney_com']['urls'].items():
-				print(f"  📄 Scraping {category}: {url}")
+		return events
 
-				try:
-					driver.get(url)
-					time.sleep(4)
+	def fetch_category(self, source_key, category, max_pages=1):
+		"""Fetch up to max_pages pages of one category over HTTP, falling back to a pooled browser when that finds no events.
 
-					# Scroll to load content
-					driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-					time.sleep(2)
+		Every page load holds a per-host slot and is followed by the source's
+		request delay; transient failures are retried with backoff outside the
+		slot, and a host whose circuit is open fails at once.
+		"""
+		source = self.sources[source_key]
+		if self.http_first:
+			try:
+				events = self.fetch_listing_page(source_key, category, 0)
+				if events:
+					return self.crawl_next_pages(source_key, category, events, max_pages)
+			except requests.RequestException as e:
+				print(f"    ⚠️  HTTP fetch failed for {source_key}/{category}, using browser: {e}")
 
-					soup = BeautifulSoup(driver.page_source, 'html.parser')
-					events = self.extract_sydney_com_events(soup, category)
+		def load():
+			with self.browser_pool.host_slot(source['urls'][category]):
+				try:
+					return self.fetch_category_browser(source_key, category, max_pages)
+				finally:
+					time.sleep(source['request_delay'])  # Be respectful
+		return self.retry_policy.call(load, self.retryable_browser_error, f'Browser load of {source_key}/{category}')
+
+	def listing_page_urls(self, source_key, category, max_pages):
+		"""URLs of the first max_pages pages of a category listing"""
+		source = self.sources[source_key]
+		return [page_url(source['urls'][category], source['page_param'], page) for page in range(max(1, max_pages))]
+
+	def fetch_listing_page(self, source_key, category, page):
+		"""Fetch one page of a category listing over HTTP within the per-host limit, retrying transient failures"""
+		source = self.sources[source_key]
+		url = page_url(source['urls'][category], source['page_param'], page)
+
+		def load():
+			with self.browser_pool.host_slot(url):
+				try:
+					return self.scrape_category_http(source_key, category, page)
+				finally:
+					time.sleep(source['request_delay'])  # Be respectful
+		return self.retry_policy.call(load, self.retryable_http_error, url)
 
-					all_events.extend(events)
-					print(f"    ✅ Found {len(events)} events")
+	def crawl_next_pages(self, source_key, category, first_events, max_pages):
+		"""Add pages 2..max_pages to a listing's first page, per_host pages at a time"""
+		crawl = ListingCrawl(self.listing_page_urls(source_key, category, max_pages), first_events, self.fetch_cache,
+							 self.cached_page_ttl)
 
-					time.sleep(2)  # Be respectful
+		def fetch(page):
+			try:
+				return self.fetch_listing_page(source_key, category, page)
+			except (requests.RequestException, CircuitOpenError) as e:
+				print(f"    ⚠️  Page {page + 1} of {source_key}/{category} failed: {e}")
+				return None
+
+		window = self.browser_pool.per_host
+		pages = crawl.next_pages(window)
+		if not pages:
+			return crawl.events()
+		with ThreadPoolExecutor(max_workers=window) as executor:
+			while pages:
+				for page, events in zip(pages, executor.map(fetch, pages)):
+					crawl.add(page, events)
+				pages = crawl.next_pages(window)
+		return crawl.events()
+
+	def fetch_category_browser(self, source_key, category, max_pages=1):
+		"""Scrape one category listing with a pooled browser"""
+		with self.browser_pool.driver() as driver:
+			return self.scrape_category(driver, source_key, category, max_pages)
+
+	def scrape_category_http(self, source_key, category, page=0):
+		"""Fetch one page of a category listing without a browser and extract its events"""
+		started = time.monotonic()
+
+		source = self.sources[source_key]
+		url = page_url(source['urls'][category], source['page_param'], page)
+		with self.breakers.guard(url, self.retryable_http_error):
+			response = self.session.get(url, headers=self.fetch_cache.conditional_headers(url), timeout=self.http_timeout,
+										stream=True)
+			with response:
+				if response.status_code != 304:
+					response.raise_for_status()
+				content = self.read_response(response, started + self.http_timeout)
+		loaded = time.monotonic()
+
+		return self.http_listing_events(source_key, category, url, response.status_code, content,
+										response.encoding, response.headers, started, loaded)
+
+	def read_response(self, response, deadline):
+		"""Body of a streamed response, raising requests.Timeout once the deadline passes.
+
+		The session's timeout only bounds each read, so a server trickling bytes
+		could otherwise hold a page open indefinitely.
+		"""
+		raw = response.raw
+		if hasattr(raw, 'read1'):  # urllib3 2: whatever one socket read brings, so the deadline is checked often
+			reads = iter(lambda: raw.read1(64 * 1024, decode_content=True), b'')
+		else:
+			reads = response.iter_content(8 * 1024)
+		chunks = []
+		for chunk in reads:
+			chunks.append(chunk)
+			if time.monotonic() > deadline:
+				raise requests.Timeout(f'{response.url} took longer than {self.http_timeout}s')
+		return b''.join(chunks)
+
+	def http_listing_events(self, source_key, category, url, status_code, content, encoding, headers, started, loaded):
+		"""Events of a fetched listing page, reusing cached results when it is unchanged"""
+		self.metrics.observe('load', loaded - started, source_key, category)
+		if status_code == 304:
+			events = self.fetch_cache.not_modified(url)
+		else:
+			content_hash = self.fetch_cache.content_hash(content)
+			events = self.fetch_cache.unchanged(url, content_hash)
+			if events is None:
+				events = self.extract_page_events(source_key, content.decode(encoding or 'utf-8', 'replace'), category)
+				self.fetch_cache.store(url, content_hash, events, headers)
+		events = events or []
+
+		self.page_timings.append({
+			'source': source_key,
+			'category': category,
+			'tier': 'http',
+			'load_seconds': round(loaded - started, 3),
+			'wait_seconds': 0.0,
+			'total_seconds': round(time.monotonic() - started, 3),
+			'items': len(events),
+			'events': len(events)
+		})
+		return events
 
-				except Exception as e:
-					print(f"    ❌ Error: {e}")
-					continue
+	def scrape_category(self, driver, source_key, category, max_pages=1):
+		"""Load one category listing in a browser, clicking "load more" for up to max_pages pages, and extract its events"""
+		source = self.sources[source_key]
+		started = time.monotonic()
+
+		with self.breakers.guard(source['urls'][category]):
+			driver.get(source['urls'][category])
+		loaded = time.monotonic()
+
+		items = self.wait_for_listing(driver, source['ready_selector'])
+		for _ in range(max_pages - 1):
+			clicked = driver.execute_script(
+				"const more = document.querySelector(arguments[0]); if (more) more.click(); return !!more;",
+				source['load_more_selector'])
+			if not clicked:
+				break
+			previous, items = items, self.wait_for_listing(driver, source['ready_selector'])
+			if items <= previous:  # nothing new was loaded
+				break
+		ready = time.monotonic()
+		self.metrics.observe('load', loaded - started, source_key, category)
+		self.metrics.observe('wait', ready - loaded, source_key, category)
+
+		# Hash only the rendered listing items; skip parsing if they haven't changed
+		listing = driver.execute_script(
+			"return Array.from(document.querySelectorAll(arguments[0])).map(e => e.outerHTML).join('');",
+			source['ready_selector'])
+		cache_key = 'browser:' + source['urls'][category]
+		content_hash = self.fetch_cache.content_hash(listing or '')
+		events = self.fetch_cache.unchanged(cache_key, content_hash) if listing else None
+		if events is None:
+			events = self.extract_page_events(source_key, driver.page_source, category)
+			if listing:
+				self.fetch_cache.store(cache_key, content_hash, events)
+
+		self.page_timings.append({
+			'source': source_key,
+			'category': category,
+			'tier': 'browser',
+			'load_seconds': round(loaded - started, 3),
+			'wait_seconds': round(ready - loaded, 3),
+			'total_seconds': round(time.monotonic() - started, 3),
+			'items': items,
+			'events': len(events)
+		})
+		return events
 
-			driver.quit()
+	def wait_for_listing(self, driver, selector):
+		"""Wait until the listing has items and stops growing; returns the item count.
+
+		Scrolls to the bottom every time the count grows so lazily loaded items
+		render, and returns early instead of sleeping a fixed time per page.
+		"""
+		deadline = time.monotonic() + self.page_timeout
+		count = last_count = 0
+		stable_since = time.monotonic()
+
+		while time.monotonic() < deadline:
+			count = driver.execute_script("return document.querySelectorAll(arguments[0]).length;", selector)
+			now = time.monotonic()
+
+			if count != last_count:
+				last_count, stable_since = count, now
+				# Scroll to load content
+				driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+			elif count and now - stable_since >= self.settle_time:
+				break
+
+			time.sleep(self.poll_interval)
+
+		return count
+
+	def page_timing_summary(self):
+		"""Average per-page latency by source, against the fixed sleeps it replaced"""
+		by_source = {}
+		for timing in list(self.page_timings):
+			by_source.setdefault(timing['source'], []).append(timing)
+
+		summary = {}
+		for source_key, timings in by_source.items():
+			http_pages = len([t for t in timings if t['tier'] == 'http'])
+			avg_wait = sum(t['wait_seconds'] for t in timings) / len(timings)
+			summary[source_key] = {
+				'pages': len(timings),
+				'http_pages': http_pages,
+				'browser_pages': len(timings) - http_pages,
+				'avg_wait_seconds': round(avg_wait, 3),
+				'avg_total_seconds': round(sum(t['total_seconds'] for t in timings) / len(timings), 3),
+				'fixed_wait_seconds': self.sources[source_key]['fixed_wait'],
+				'saved_seconds_per_page': round(self.sources[source_key]['fixed_wait'] - avg_wait, 3),
+				'empty_pages': len([t for t in timings if not t['events']])
+			}
 
-		except Exception as e:
-			print(f"❌ Sydney.com scraping error: {e}")
+		return summary
 
-		print(f"🏢 Sydney.com total: {len(all_events)} events")
-		return all_events
+	def extract_page_events(self, source_key, html, source_category):
+		"""Extract events from listing HTML, falling back to embedded JSON-LD data"""
+		with self.metrics.timer('parse', source_key, source_category):
+			soup = parse_listing(html, source_key)
+		with self.metrics.timer('extract', source_key, source_category):
+			events = self.extract_events(source_key, soup, source_category)
+		if events:
+			return events
 
-	def scrape_visit_nsw_all_categories(self, max_pages=2):
-		"""Scrape all categories from Visit NSW at once"""
-		all_events = []
+		with self.metrics.timer('parse', source_key, source_category):
+			soup = parse_json_ld(html)
+		with self.metrics.timer('extract', source_key, source_category):
+			return self.extract_json_ld_events(soup, source_key, source_category)
+
+	def extract_events(self, source_key, soup, source_category):
+		"""Dispatch to the extractor for the given source"""
+		if source_key == 'sydney_com':
+			return self.event_records(self.extract_sydney_com_events(soup, source_category))
+		return self.event_records(self.extract_visit_nsw_events(soup, source_category))
+
+	def event_records(self, events):
+		"""Compact EventRecords of one page's extracted events, stamped with a shared scrape time"""
+		scraped_at = datetime.now().isoformat()
+		records = []
+		for event in events:
+			record = EventRecord(event)
+			record.scraped_at = scraped_at  # one string for the page; nothing to intern
+			records.append(record)
+		return records
 
-		try:
-			driver = self.setup_selenium_driver()
+	def extract_json_ld_events(self, soup, source_key, source_category):
+		"""Extract schema.org Event objects embedded as JSON-LD"""
+		events = []
 
-			# Scrape each category URL
-			for category, url in self.sources['visit_nsw']['urls'].items():
-				print(f"  📄 Scraping {category}: {url}")
+		for script in soup.find_all('script', type='application/ld+json'):
+			try:
+				data = json.loads(script.string or '')
+			except ValueError:
+				continue
 
+			for item in self.iter_json_ld_events(data):
 				try:
-					driver.get(url)
-					time.sleep(5)
-
-					# Scroll to load content
-					driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-					time.sleep(3)
-
-					soup = BeautifulSoup(driver.page_source, 'html.parser')
-					events = self.extract_visit_nsw_events(soup, category)
+					event_data = self.extract_json_ld_event_data(item, source_key, source_category)
+					if event_data:
+						events.append(event_data)
+				except Exception as e:
+					continue
 
-					all_events.extend(events)
-					print(f"    ✅ Found {len(events)} events")
+		return self.event_records(events)
+
+	def iter_json_ld_events(self, data):
+		"""Yield Event nodes from a JSON-LD document, including @graph and ItemList wrappers"""
+		if isinstance(data, list):
+			for entry in data:
+				yield from self.iter_json_ld_events(entry)
+		elif isinstance(data, dict):
+			types = data.get('@type', [])
+			types = types if isinstance(types, list) else [types]
+			if any(str(t).endswith('Event') for t in types):
+				yield data
+			for key in ('@graph', 'itemListElement', 'item'):
+				if key in data:
+					yield from self.iter_json_ld_events(data[key])
+
+	def extract_json_ld_event_data(self, item, source_key, source_category):
+		"""Map one JSON-LD Event onto the API's event fields"""
+		source = self.sources[source_key]
+		event_data = {}
 
-					time.sleep(3)  # Be respectful
+		if item.get('name'):
+			event_data['title'] = str(item['name']).strip()
 
-				except Exception as e:
-					print(f"    ❌ Error: {e}")
-					continue
+		if item.get('url'):
+			event_data['ticket_link'] = urljoin(source['base_url'], item['url'])
 
-			driver.quit()
+		location = item.get('location')
+		if isinstance(location, list):
+			location = location[0] if location else None
+		if isinstance(location, dict):
+			address = location.get('address')
+			locality = address.get('addressLocality') if isinstance(address, dict) else address
+			event_data['location'] = location.get('name') or locality or source['default_location']
+		else:
+			event_data['location'] = location or source['default_location']
+
+		if item.get('description'):
+			event_data['description'] = str(item['description']).strip()
+
+		image = item.get('image')
+		if isinstance(image, list):
+			image = image[0] if image else None
+		if isinstance(image, dict):
+			image = image.get('url')
+		if image:
+			event_data['image_url'] = urljoin(source['base_url'], image)
+			event_data['image_alt'] = event_data.get('title', '')
+
+		start, end = item.get('startDate'), item.get('endDate')
+		if start:
+			event_data['date_time'] = f"{start} - {end}" if end and end != start else start
+		else:
+			event_data['date_time'] = NO_DATE
+		event_data['start_date'] = self.iso_date(start)
+		event_data['end_date'] = self.iso_date(end) or event_data['start_date']
+
+		offers = item.get('offers')
+		if isinstance(offers, list):
+			offers = offers[0] if offers else None
+		if item.get('isAccessibleForFree'):
+			event_data['price'] = "Free"
+		elif isinstance(offers, dict) and offers.get('price') not in (None, ''):
+			event_data['price'] = "Free" if str(offers['price']) in ('0', '0.00') else f"${offers['price']}"
+		else:
+			event_data['price'] = "See event page for pricing"
 
-		except Exception as e:
-			print(f"❌ Visit NSW scraping error: {e}")
+		# Metadata
+		event_data['source'] = source['name']
+		event_data['source_category'] = source_category
+		event_data['event_id'] = self.generate_event_id(event_data)
 
-		print(f"🗺️  Visit NSW total: {len(all_events)} events")
-		return all_events
+		return event_data if event_data.get('title') else None
 
 	def extract_sydney_com_events(self, soup, source_category):
 		"""Extract events from Sydney.com with category context"""
@@ -224,24 +760,26 @@ class SydneyEventsAPI:
 		if not product_wrapper:
 			return events
 
-		event_items = product_wrapper.select('div[itemprop="Event"], div[data-type="Event"]')
+		event_items = SELECTORS['sydney_com_items'].select(product_wrapper)
 
+		texts = []
 		for item in event_items:
 			try:
-				event_data = self.extract_sydney_com_event_data(item, source_category)
-				if event_data:
-					events.append(event_data)
+				card = self.extract_sydney_com_event_data(item, source_category)
+				if card:
+					events.append(card[0])
+					texts.append(card[1])
 			except Exception as e:
 				continue
 
-		return events
+		return self.add_text_fields(events, texts)
 
 	def extract_sydney_com_event_data(self, item, source_category):
-		"""Extract event data from Sydney.com item with category"""
+		"""Extract event data from Sydney.com item with category, and the card text its date and price are read from"""
 		event_data = {}
 
 		# Title
-		title_elem = item.select_one('h3.title__product-list-title-heading, h3')
+		title_elem = SELECTORS['sydney_com_title'].select_one(item)
 		if title_elem:
 			event_data['title'] = title_elem.get_text(strip=True)
 
@@ -252,14 +790,14 @@ class SydneyEventsAPI:
 												link_elem.get('href'))
 
 		# Location
-		location_elem = item.select_one('span.title__area-name')
+		location_elem = SELECTORS['sydney_com_location'].select_one(item)
 		if location_elem:
 			event_data['location'] = location_elem.get_text(strip=True)
 		else:
 			event_data['location'] = "Sydney"
 
 		# Description
-		desc_elem = item.select_one('div[itemprop="description"]')
+		desc_elem = SELECTORS['sydney_com_description'].select_one(item)
 		if desc_elem:
 			event_data['description'] = desc_elem.get_text(strip=True)
 
@@ -271,73 +809,63 @@ class SydneyEventsAPI:
 				event_data['image_url'] = urljoin(self.sources['sydney_com']['base_url'], src)
 				event_data['image_alt'] = img_elem.get('alt', '')
 
-		# Extract date and price
-		text_content = item.get_text()
-		event_data['date_time'] = self.extract_date_from_text(text_content)
-		event_data['price'] = self.extract_price_from_text(text_content)
-
 		# Metadata
 		event_data['source'] = 'Sydney.com'
 		event_data['source_category'] = source_category
 		event_data['event_id'] = self.generate_event_id(event_data)
-		event_data['scraped_at'] = datetime.now().isoformat()
 
-		return event_data if event_data.get('title') else None
+		return (event_data, item.get_text()) if event_data.get('title') else None
 
 	def extract_visit_nsw_events(self, soup, source_category):
 		"""Extract events from Visit NSW with category context"""
-		events = []
+		selectors = SELECTORS['visit_nsw_containers']
+
+		# Try the container selector that matched last time before the full cascade
+		remembered = self.container_selectors.get('visit_nsw')
+		order = list(range(len(selectors)))
+		if remembered is not None:
+			order.remove(remembered)
+			order.insert(0, remembered)
+
+		for index in order:
+			containers = selectors[index].select(soup)
+			if not containers:
+				continue
 
-		# Look for event containers
-		selectors = [
-			'div[class*="event"]',
-			'div[class*="listing"]',
-			'div[class*="card"]',
-			'article',
-			'.event-item',
-			'.listing-item',
-			'.product-item'
-		]
-
-		for selector in selectors:
-			containers = soup.select(selector)
-			if containers:
-				for container in containers[:15]:  # Limit per category
-					try:
-						event_data = self.extract_visit_nsw_event_data(container, source_category)
-						if event_data and event_data.get('title') and len(event_data['title']) > 5:
-							events.append(event_data)
-					except Exception as e:
-						continue
+			events, texts = [], []
+			for container in containers:
+				try:
+					event_data, text = self.extract_visit_nsw_event_data(container, source_category)
+					if event_data.get('title') and len(event_data['title']) > 5:
+						events.append(event_data)
+						texts.append(text)
+				except Exception as e:
+					continue
 
-				if events:
-					break
+			if events:
+				self.container_selectors['visit_nsw'] = index
+				return self.add_text_fields(events, texts)
 
-		return events
+		return []
 
 	def extract_visit_nsw_event_data(self, container, source_category):
-		"""Extract event data from Visit NSW container with category"""
+		"""Extract event data from Visit NSW container with category, and the card text its date and price are read from"""
+		card = read_visit_nsw_card(container)
 		event_data = {}
 
 		# Title
-		title_selectors = ['h1', 'h2', 'h3', 'h4', '.title', '[class*="title"]']
-		for selector in title_selectors:
-			title_elem = container.select_one(selector)
-			if title_elem:
-				title_text = title_elem.get_text(strip=True)
-				if len(title_text) > 3:
-					event_data['title'] = title_text
-					break
+		if card.get('title'):
+			event_data['title'] = card['title']
 
 		# Link
-		link_elem = container.find('a', href=True)
+		link_elem = card['link']
 		if link_elem:
 			href = link_elem.get('href')
 			if href:
 				event_data['ticket_link'] = urljoin(self.sources['visit_nsw']['base_url'], href)
 
 		# Image
-		img_elem = container.find('img')
+		img_elem = card['image']
 		if img_elem:
 			src = img_elem.get('src') or img_elem.get('data-src')
 			if src:
@@ -348,115 +876,57 @@ class SydneyEventsAPI:
 				event_data['image_alt'] = img_elem.get('alt', '')
 
 		# Location
-		location_selectors = ['.location', '[class*="location"]', '[class*="venue"]']
-		for selector in location_selectors:
-			location_elem = container.select_one(selector)
-			if location_elem:
-				location_text = location_elem.get_text(strip=True)
-				if len(location_text) > 2:
-					event_data['location'] = location_text
-					break
-
-		if not event_data.get('location'):
-			event_data['location'] = "NSW, Australia"
+		event_data['location'] = card.get('location') or "NSW, Australia"
 
 		# Description
-		desc_selectors = ['.description', '[class*="description"]', 'p']
-		for selector in desc_selectors:
-			desc_elem = container.select_one(selector)
-			if desc_elem:
-				desc_text = desc_elem.get_text(strip=True)
-				if len(desc_text) > 20:
-					event_data['description'] = desc_text[:300] + "..." if len(desc_text) > 300 else desc_text
-					break
-
-		# Extract date and price
-		text_content = container.get_text()
-		event_data['date_time'] = self.extract_date_from_text(text_content)
-		event_data['price'] = self.extract_price_from_text(text_content)
+		desc_text = card.get('description')
+		if desc_text:
+			event_data['description'] = desc_text[:300] + "..." if len(desc_text) > 300 else desc_text
 
 		# Metadata
 		event_data['source'] = 'Visit NSW'
 		event_data['source_category'] = source_category
 		event_data['event_id'] = self.generate_event_id(event_data)
-		event_data['scraped_at'] = datetime.now().isoformat()
 
-		return event_data
+		return event_data, card['text']
 
 	def categorize_event(self, event):
 		"""Intelligently categorize events based on title, description, and source category"""
-		title = (event.get('title', '') + ' ' + event.get('description', '')).lower()
-		source_category = event.get('source_category', '').lower()
-
-		# Use source category as primary hint
-		if source_category in ['festivals', 'festival']:
-			return 'festivals'
-		elif source_category in ['performance', 'performanc']:
-			return 'performance'
-		elif source_category in ['exhibit', 'exhibition']:
-			return 'exhibit'
-		elif source_category in ['food', 'evtfood']:
-			return 'food'
-		elif source_category in ['sport', 'sports']:
-			return 'sport'
-		elif source_category in ['community', 'evtcomnty']:
-			return 'community'
-		elif source_category in ['markets', 'evtmarket']:
-			return 'markets'
-		elif source_category in ['business', 'evtbus']:
-			return 'business'
-
-		# Fallback to keyword-based categorization
-		if any(word in title for word in ['festival', 'fest', 'carnival']):
-			return 'festivals'
-		elif any(word in title for word in
-				 ['concert', 'music', 'band', 'singer', 'performance', 'show', 'theatre', 'theater']):
-			return 'performance'
-		elif any(word in title for word in ['exhibition', 'exhibit', 'gallery', 'museum', 'art']):
-			return 'exhibit'
-		elif any(word in title for word in ['food', 'wine', 'dining', 'restaurant', 'cuisine', 'cooking']):
-			return 'food'
-		elif any(word in title for word in ['sport', 'game', 'match', 'race', 'competition']):
-			return 'sport'
-		elif any(word in title for word in ['market', 'farmers', 'craft', 'vendor']):
-			return 'markets'
-		elif any(word in title for word in ['business', 'conference', 'workshop', 'seminar', 'networking']):
-			return 'business'
-		elif any(word in title for word in ['community', 'local', 'neighborhood', 'volunteer']):
-			return 'community'
-
-		return 'events'  # Default category
+		return self.categorizer.categorize(event)
+
+	def extract_text_fields(self, text):
+		"""Extract date, price and parsed start/end dates from a card's text in one scan"""
+		return self.extract_text_fields_many([text])[0]
+
+	def extract_text_fields_many(self, texts):
+		"""extract_text_fields for all card texts of a page in one batch, against one reference time"""
+		return [{
+			'date_time': fields['date_time'],
+			'price': fields['price'],
+			'start_date': fields['start_date'].isoformat() if fields['start_date'] else None,
+			'end_date': fields['end_date'].isoformat() if fields['end_date'] else None
+		} for fields in self.card_text.extract_many(texts)]
+
+	def add_text_fields(self, events, texts):
+		"""Fill each event's date and price from its card text, extracted for the whole page at once"""
+		for event_data, fields in zip(events, self.extract_text_fields_many(texts)):
+			event_data.update(fields)
+		return events
 
 	def extract_date_from_text(self, text):
 		"""Extract date from text"""
-		patterns = [
-			r'\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)(?:\s*-\s*\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec))?',
-			r'\d{1,2}/\d{1,2}/\d{4}',
-			r'\d{4}-\d{2}-\d{2}'
-		]
-
-		for pattern in patterns:
-			match = re.search(pattern, text, re.IGNORECASE)
-			if match:
-				return match.group()
-
-		return "Check event page for dates"
+		return self.card_text.extract(text)['date_time']
 
 	def extract_price_from_text(self, text):
 		"""Extract price from text"""
-		patterns = [
-			r'from\s*\$\d+',
-			r'\$\d+(?:\.\d{2})?',
-			r'free',
-			r'Free'
-		]
-
-		for pattern in patterns:
-			match = re.search(pattern, text, re.IGNORECASE)
-			if match:
-				return match.group()
+		return self.card_text.extract(text)['price']
 
-		return "See event page for pricing"
+	def iso_date(self, value):
+		"""Normalize an ISO 8601 date string from structured data, or None"""
+		try:
+			return datetime.fromisoformat(str(value).replace('Z', '+00:00')).isoformat() if value else None
+		except ValueError:
+			return None
 
 	def generate_event_id(self, event_data):
 		"""Generate unique ID for event"""
@@ -481,8 +951,8 @@ class SydneyEventsAPI:
 		if not filename:
 			filename = f"sydney_events_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
-		with open(filename, 'w', encoding='utf-8') as f:
-			json.dump(data, f, indent=2, ensure_ascii=False)
+		with open(filename, 'wb') as f:
+			f.write(json_codec.dumps(data, indent=True))
 
 		print(f"💾 Data saved to: {filename}")
 		return filename
@@ -490,11 +960,15 @@ class SydneyEventsAPI:
 	def get_category_events(self, category, data):
 		"""Get events for a specific category"""
 		if 'category_groups' in data and category in data['category_groups']:
+			events = list(data['category_groups'][category])
+			# Events filed under another category that were also listed in this one
+			events.extend(event for group, group_events in data['category_groups'].items() if group != category
+						  for event in group_events if category in event.get('categories', []))
 			return {
 				'success': True,
 				'category': category,
-				'total_events': len(data['category_groups'][category]),
-				'events': data['category_groups'][category]
+				'total_events': len(events),
+				'events': events
 			}
 		else:
 			return {
@@ -529,15 +1003,14 @@ def main():
 def get_events_by_category(category_name):
 	"""Get events for a specific category"""
 	api = SydneyEventsAPI()
-	all_data = api.scrape_all_events(max_pages=1)
-	return api.get_category_events(category_name, all_data)
+	return api.get_category_events(category_name, api.scrape_category_response(category_name, max_pages=1))
 
 
 def get_all_events_json():
 	"""Get all events as JSON string"""
 	api = SydneyEventsAPI()
 	response = api.scrape_all_events(max_pages=2)
-	return json.dumps(response, indent=2, ensure_ascii=False)
+	return json_codec.dumps(response, indent=True).decode('utf-8')
 
 
 if __name__ == "__main__":
@@ -547,7 +1020,7 @@ if __name__ == "__main__":
 			# Get specific category
 			category = sys.argv[2]
 			result = get_events_by_category(category)
-			print(json.dumps(result, indent=2, ensure_ascii=False))
+			print(json_codec.dumps(result, indent=True).decode("utf-8"))
 		elif sys.argv[1] == "json":
 			# Get all as JSON
 			print(get_all_events_json())
@@ -0,0 +1,5 @@
+# conftest.py (Test setup: import backend modules and benchmarks from the backend directory)
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
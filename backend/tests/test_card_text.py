@@ -0,0 +1,58 @@
+# test_card_text.py (CardTextExtractor against the per-pattern searches it replaced)
+from datetime import datetime
+
+import pytest
+
+from benchmarks.bench_card_text import legacy_extract, synthetic_cards
+from card_text import CARD_PATTERN, NO_DATE, NO_PRICE, CardTextExtractor
+
+REFERENCE = datetime(2026, 10, 18)
+
+
+def test_matches_legacy_date_and_price():
+	cards = synthetic_cards(2000)
+	results = CardTextExtractor().extract_many(cards, REFERENCE)
+	assert [(result['date_time'], result['price']) for result in results] == [legacy_extract(card) for card in cards]
+
+
+@pytest.mark.parametrize('text, date_text, price', [
+	('Book now', NO_DATE, NO_PRICE),
+	('2026-11-03 tickets $25.50', '2026-11-03', '$25.50'),
+	('Entry $12 Oct 14 FREE', '12 Oct', '$12'),
+	('$30 or from $20, 5/11/2026 or 12 Oct', '12 Oct', 'from $20'),
+	('Free entry 1 Dec - 3 Dec', '1 Dec - 3 Dec', 'Free')
+])
+def test_priority_matches_legacy(text, date_text, price):
+	result = CardTextExtractor().extract(text, REFERENCE)
+	assert (result['date_time'], result['price']) == (date_text, price) == legacy_extract(text)
+
+
+@pytest.mark.parametrize('text, start, end', [
+	('12 Oct - 14 Oct', datetime(2026, 10, 12), datetime(2026, 10, 14)),
+	('28 Dec - 2 Jan', datetime(2026, 12, 28), datetime(2027, 1, 2)),
+	('3 Mar', datetime(2027, 3, 3), datetime(2027, 3, 3)),
+	('1 Jun', datetime(2026, 6, 1), datetime(2026, 6, 1)),
+	('5/11/2026', datetime(2026, 11, 5), datetime(2026, 11, 5)),
+	('2026-11-03', datetime(2026, 11, 3), datetime(2026, 11, 3)),
+	('31 Feb', None, None),
+	('12/31/2026', None, None)
+])
+def test_date_ranges(text, start, end):
+	result = CardTextExtractor(lookback_days=180).extract(text, REFERENCE)
+	assert (result['start_date'], result['end_date']) == (start, end)
+
+
+EDGE_TEXTS = ['123 Oct', '12 oct - 14 OCT', '1/2/20261', '20261-11-03', 'FREE', 'Ffree', 'FROM $5', 'from$', 'f$5',
+			  '$ 5', '$$5', '9 Octopus', '12  Dec-3 Jan', '\u0661\u0662 Oct', 'no dates here']
+
+
+def test_candidate_scan_matches_finditer():
+	text = '\0'.join(synthetic_cards(500) + EDGE_TEXTS)
+	found = [(match.span(), match.lastgroup) for match in CardTextExtractor._matches(text)]
+	assert found == [(match.span(), match.lastgroup) for match in CARD_PATTERN.finditer(text)]
+
+
+def test_batch_matches_single_cards():
+	cards = synthetic_cards(300) + EDGE_TEXTS + ['']
+	extractor = CardTextExtractor()
+	assert extractor.extract_many(cards, REFERENCE) == [extractor.extract(card, REFERENCE) for card in cards]
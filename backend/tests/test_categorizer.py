@@ -0,0 +1,31 @@
+# test_categorizer.py (EventCategorizer against the original elif chain)
+import pytest
+
+import categorizer
+from benchmarks.bench_categorize import legacy_categorize, synthetic_events
+from categorizer import EventCategorizer
+
+
+@pytest.fixture(params=['automaton', 'fallback'])
+def event_categorizer(request, monkeypatch):
+	if request.param == 'fallback':
+		monkeypatch.setattr(categorizer, 'ahocorasick', None)
+	elif categorizer.ahocorasick is None:
+		pytest.skip('pyahocorasick is not installed')
+	return EventCategorizer()
+
+
+def test_matches_legacy_chain(event_categorizer):
+	events = synthetic_events(2000)
+	assert event_categorizer.categorize_many(events) == [legacy_categorize(event) for event in events]
+
+
+@pytest.mark.parametrize('event, expected', [
+	({'title': 'Harbour Carnival', 'source_category': 'EVTBUS'}, 'business'),
+	({'title': 'Jazz concert at the museum', 'source_category': 'general'}, 'performance'),
+	({'title': 'Business networking', 'description': 'and a farmers stall'}, 'markets'),
+	({'title': 'Quiet morning walk'}, 'events'),
+	({}, 'events')
+])
+def test_source_category_then_keyword_order(event_categorizer, event, expected):
+	assert event_categorizer.categorize(event) == legacy_categorize(event) == expected
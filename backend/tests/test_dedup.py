@@ -0,0 +1,57 @@
+# test_dedup.py (DedupIndex merging of cross-source duplicates)
+from dedup import DedupIndex
+
+
+def event(title, source='Sydney.com', ticket_link=None, start_date='2026-11-01T00:00:00', **fields):
+	return dict(title=title, source=source, ticket_link=ticket_link, start_date=start_date, **fields)
+
+
+def test_same_url_and_title_merge_across_categories():
+	index = DedupIndex()
+	first = index.add(event('Harbour Jazz Night', ticket_link='https://www.sydney.com/jazz/'), 'performance')
+	second = index.add(event('Harbour Jazz Night', ticket_link='http://sydney.com/jazz?ref=1'), 'events')
+	assert second is first
+	assert first['categories'] == ('performance', 'events')
+	assert first['sources'] == ('Sydney.com',)
+	assert index.merged == 1 and len(index.records) == 1
+
+
+def test_similar_titles_merge_across_sources_and_fill_gaps():
+	index = DedupIndex()
+	first = index.add(event('The Sydney Film Festival 2026', price=None), 'festivals')
+	index.add(event('Sydney Film Festival', source='Visit NSW', price='$25', location='State Theatre'), 'performance')
+	assert len(index.records) == 1
+	assert first['sources'] == ('Sydney.com', 'Visit NSW')
+	assert first['categories'] == ('festivals', 'performance')
+	assert first['price'] == '$25' and first['location'] == 'State Theatre'
+	assert first['title'] == 'The Sydney Film Festival 2026'
+
+
+def test_different_start_dates_stay_separate():
+	index = DedupIndex()
+	index.add(event('Night Noodle Markets', start_date='2026-10-01T00:00:00'), 'food')
+	index.add(event('Night Noodle Markets', source='Visit NSW', start_date='2026-11-01T00:00:00'), 'food')
+	assert len(index.records) == 2 and index.merged == 0
+
+
+def test_dissimilar_titles_stay_separate():
+	index = DedupIndex()
+	index.add(event('Vivid Light Walk'), 'festivals')
+	index.add(event('Vivid Ideas Conference'), 'business')
+	assert len(index.records) == 2
+
+
+def test_same_source_with_different_urls_stays_separate():
+	index = DedupIndex()
+	index.add(event('Trivia Night', ticket_link='https://www.sydney.com/a', location='Newtown Hotel'), 'community')
+	index.add(event('Trivia Night', ticket_link='https://www.sydney.com/b', location='Manly Pub'), 'community')
+	assert len(index.records) == 2 and index.merged == 0
+
+
+def test_missing_start_date_needs_the_same_location():
+	index = DedupIndex()
+	index.add(event('Trivia Night', start_date=None, location='Newtown Hotel'), 'community')
+	index.add(event('Trivia Night', source='Visit NSW', start_date=None, location='Manly Pub'), 'community')
+	assert len(index.records) == 2
+	merged = index.add(event('Trivia Night', source='Visit NSW', start_date=None, location='newtown hotel'), 'events')
+	assert len(index.records) == 2 and merged['sources'] == ('Sydney.com', 'Visit NSW')
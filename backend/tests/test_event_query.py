@@ -0,0 +1,81 @@
+# test_event_query.py (EventQuery filters, date bounds and cursors)
+import pytest
+
+from event_query import EventQuery, decode_cursor, encode_cursor, response_records
+
+DATA = {
+	'category_groups': {
+		'festivals': [
+			{'event_id': 'a', 'title': 'Film Festival', 'source': 'Sydney.com', 'location': 'State Theatre',
+			 'start_date': '2026-11-01T00:00:00', 'end_date': '2026-11-03T00:00:00'},
+			{'event_id': 'b', 'title': 'Light Festival', 'source': 'Visit NSW', 'sources': ['Visit NSW', 'Sydney.com'],
+			 'start_date': '2026-11-05T00:00:00'}
+		],
+		'food': [
+			{'event_id': 'c', 'title': 'Noodle Markets', 'source': 'Visit NSW', 'categories': ['food', 'markets'],
+			 'start_date': '2026-11-10T00:00:00'},
+			{'event_id': 'd', 'title': 'Wine Dinner', 'source': 'Sydney.com', 'description': 'Harbour views'}
+		]
+	}
+}
+SOURCE_NAMES = {'sydney_com': 'Sydney.com', 'visit_nsw': 'Visit NSW'}
+
+
+def ids(args):
+	query = EventQuery.from_args(args, SOURCE_NAMES)
+	return [event['event_id'] for event in query.page(list(response_records(DATA)))['events']]
+
+
+@pytest.mark.parametrize('args, expected', [
+	({}, ['a', 'b', 'c', 'd']),
+	({'category': 'markets'}, ['c']),
+	({'category': 'food'}, ['c', 'd']),
+	({'source': 'sydney_com'}, ['a', 'b', 'd']),
+	({'q': 'harbour'}, ['d']),
+	({'q': 'THEATRE'}, ['a']),
+	({'from': '2026-11-03'}, ['a', 'b', 'c']),
+	({'from': '2026-11-04'}, ['b', 'c']),
+	({'to': '2026-11-05'}, ['a', 'b']),
+	({'to': '2026-10-31'}, []),
+	({'from': '2026-11-05', 'to': '2026-11-05'}, ['b']),
+	({'category': 'festivals', 'source': 'visit_nsw', 'to': '2026-11-10'}, ['b'])
+])
+def test_filters(args, expected):
+	assert ids(args) == expected
+
+
+def test_cursor_pages_through_every_match_once():
+	seen, args = [], {'limit': '1', 'source': 'sydney_com'}
+	while True:
+		page = EventQuery.from_args(args, SOURCE_NAMES).page(list(response_records(DATA)))
+		assert page['total_events'] == 3
+		seen.extend(event['event_id'] for event in page['events'])
+		if page['next_cursor'] is None:
+			break
+		args = dict(args, cursor=page['next_cursor'])
+	assert seen == ['a', 'b', 'd']
+
+
+def test_fields_projection_keeps_event_id():
+	page = EventQuery.from_args({'fields': 'title'}).page(list(response_records(DATA)))
+	assert page['events'][0] == {'event_id': 'a', 'title': 'Film Festival'}
+
+
+def test_cursor_round_trip():
+	assert decode_cursor(encode_cursor(41)) == 41
+
+
+@pytest.mark.parametrize('args', [
+	{'limit': 'ten'}, {'limit': '0'}, {'limit': '501'}, {'cursor': '!!'},
+	{'from': 'soon'}, {'to': '2026-13-01'}, {'to': '2026-11-05T00:00:00'}
+])
+def test_bad_arguments_raise(args):
+	with pytest.raises(ValueError):
+		EventQuery.from_args(args)
+
+
+def test_date_range_ignores_other_arguments():
+	query = EventQuery.date_range({'from': '2026-11-01', 'category': 'food', 'q': 'x'})
+	assert (query.start, query.end, query.category, query.text) == ('2026-11-01', None, None, None)
+	with pytest.raises(ValueError):
+		EventQuery.date_range({'to': 'garbage'})
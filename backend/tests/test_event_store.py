@@ -0,0 +1,92 @@
+# test_event_store.py (EventStore upserts, category lookups and pages against a temporary database)
+import pytest
+
+from event_query import EventQuery
+from event_store import EventStore
+
+
+def event(event_id, title, source='Sydney.com', start_date=None, end_date=None, **fields):
+	return dict(event_id=event_id, title=title, source=source, start_date=start_date, end_date=end_date, **fields)
+
+
+def response(*groups):
+	return {'category_groups': dict(groups)}
+
+
+RESPONSE = response(
+	('festivals', [
+		event('a', 'Film Festival', start_date='2026-11-01T00:00:00', end_date='2026-11-03T00:00:00'),
+		event('b', 'Light Festival', source='Visit NSW', sources=['Visit NSW', 'Sydney.com'],
+			  start_date='2026-11-05T00:00:00', categories=['festivals', 'food'])
+	]),
+	('food', [
+		event('c', 'Noodle Markets', source='Visit NSW', start_date='2026-11-10T00:00:00'),
+		event('d', 'Wine Dinner', description='Harbour views')
+	])
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+	store = EventStore(str(tmp_path / 'events.db'))
+	store.upsert_response(RESPONSE)
+	return store
+
+
+def ids(events):
+	return [event['event_id'] for event in events]
+
+
+def test_upsert_updates_and_prunes(store):
+	updated = response(('festivals', [event('a', 'Film Festival (extended)', start_date='2026-11-01T00:00:00')]),
+					   ('food', [event('e', 'Oyster Festival')]))
+	assert store.upsert_response(updated) == 2
+	assert ids(store.page(EventQuery(limit=10))['events']) == ['a', 'e']
+	assert store.category_events('festivals')[0]['title'] == 'Film Festival (extended)'
+	assert store.category_events('food') == [event('e', 'Oyster Festival')]
+	assert store.status()['events'] == 2
+
+
+def test_category_events_lists_filed_events_first(store):
+	assert ids(store.category_events('food')) == ['c', 'd', 'b']
+
+
+@pytest.mark.parametrize('start, end, expected', [
+	('2026-11-03', None, ['c', 'b']),
+	('2026-11-06', None, ['c']),
+	(None, '2026-11-05', ['b']),
+	(None, '2026-11-04', []),
+	('2026-11-10', '2026-11-10', ['c'])
+])
+def test_category_events_date_range(store, start, end, expected):
+	assert ids(store.category_events('food', start, end)) == expected
+
+
+@pytest.mark.parametrize('args, expected', [
+	({}, ['a', 'b', 'c', 'd']),
+	({'category': 'food'}, ['b', 'c', 'd']),
+	({'source': 'sydney_com'}, ['a', 'b', 'd']),
+	({'q': 'harbour'}, ['d']),
+	({'from': '2026-11-03', 'to': '2026-11-05'}, ['a', 'b']),
+	({'to': '2026-11-01'}, ['a'])
+])
+def test_page_filters(store, args, expected):
+	query = EventQuery.from_args(args, {'sydney_com': 'Sydney.com', 'visit_nsw': 'Visit NSW'})
+	assert ids(store.page(query)['events']) == expected
+
+
+def test_page_cursor_walks_every_event_once(store):
+	seen, args = [], {'limit': '3'}
+	while True:
+		page = store.page(EventQuery.from_args(args))
+		assert page['total_events'] == 4
+		seen.extend(ids(page['events']))
+		if page['next_cursor'] is None:
+			break
+		args = dict(args, cursor=page['next_cursor'])
+	assert seen == ['a', 'b', 'c', 'd']
+
+
+def test_listings_round_trip(store):
+	store.save_listing('visit_nsw', 'food', [event('c', 'Noodle Markets')], refreshed_at=100.0)
+	assert store.load_listings() == {('visit_nsw', 'food'): (100.0, [event('c', 'Noodle Markets')])}
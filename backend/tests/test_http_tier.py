@@ -0,0 +1,52 @@
+# test_http_tier.py (HTTP listing fetches against a local StubSite)
+import pytest
+import requests
+
+from benchmarks.fixtures import StubSite, listing_pages
+from resilience import CircuitBreakers, RetryPolicy
+from sydney_events_api import SydneyEventsAPI
+
+
+@pytest.fixture
+def api():
+	api = SydneyEventsAPI(pool_size=1, retry_policy=RetryPolicy(attempts=1),
+						  breakers=CircuitBreakers(failure_threshold=2))
+	yield api
+	api.browser_pool.close()
+
+
+@pytest.fixture
+def site(api):
+	site = StubSite(listing_pages(api.sources, events_per_page=6), extra_pages=1, events_per_page=4)
+	site.point(api)
+	yield site
+	site.close()
+
+
+@pytest.mark.parametrize('source_key', ['sydney_com', 'visit_nsw'])
+def test_first_page_is_extracted_over_http(api, site, source_key):
+	events = api.scrape_category_http(source_key, 'events')
+	assert len(events) == 6
+	assert all(event['title'] and event['source'] == api.sources[source_key]['name'] for event in events)
+	assert api.page_timings[-1]['tier'] == 'http'
+
+
+def test_unchanged_page_reuses_cached_events(api, site):
+	first = api.scrape_category_http('sydney_com', 'food')
+	assert api.scrape_category_http('sydney_com', 'food') == first
+	assert site.requests == 2
+
+
+def test_crawl_follows_pages_until_an_empty_one(api, site):
+	events = api.fetch_category('sydney_com', 'events', max_pages=3)
+	assert len(events) == 6 + 4
+	assert len({event['event_id'] for event in events}) == len(events)
+
+
+def test_missing_listing_does_not_open_the_circuit(api, site):
+	url = api.sources['sydney_com']['urls']['events']
+	api.sources['sydney_com']['urls']['events'] = url.replace('/events', '/missing')
+	for _ in range(3):
+		with pytest.raises(requests.HTTPError):
+			api.scrape_category_http('sydney_com', 'events')
+	assert api.breakers.status() == {}
@@ -0,0 +1,65 @@
+# test_scheduler.py (First refresh pass of the scheduler against a local StubSite)
+import importlib
+import os
+import sys
+import time
+
+import pytest
+
+from benchmarks.fixtures import StubSite, listing_pages
+
+
+@pytest.fixture
+def app_module(tmp_path, monkeypatch):
+	"""app imported as a shared snapshot's producer, with its scheduler pointed at a StubSite"""
+	monkeypatch.setenv('EVENT_DB', '')
+	monkeypatch.setenv('SHARED_SNAPSHOT_DIR', str(tmp_path / 'shared'))
+	monkeypatch.delenv('EXTERNAL_REFRESH', raising=False)
+	monkeypatch.delenv('SCHEDULER_ENABLED', raising=False)
+	sys.modules.pop('app', None)
+	app = importlib.import_module('app')
+	site = StubSite(listing_pages(app.events_api.sources, events_per_page=3))
+	site.point(app.events_api)
+	app.scheduler.max_pages = 1
+	assert app.shared_snapshot.claim_producer()
+	yield app
+	app.scheduler.stop(timeout=10)
+	site.close()
+	app.events_api.browser_pool.close()
+	sys.modules.pop('app', None)
+
+
+def shared_files(app):
+	return sorted(name for name in os.listdir(app.shared_snapshot.directory) if name.startswith('snapshot-'))
+
+
+def wait_for(condition, timeout=30):
+	deadline = time.monotonic() + timeout
+	while not condition():
+		assert time.monotonic() < deadline, 'timed out'
+		time.sleep(0.05)
+
+
+def test_first_pass_writes_a_shared_snapshot(app_module):
+	app_module.scheduler.start()
+	wait_for(lambda: app_module.scheduler.first_pass_complete and shared_files(app_module))
+	snapshot = app_module.shared_snapshot.current()
+	assert snapshot['statistics']['total_events'] == app_module.snapshots.peek().data['statistics']['total_events']
+	assert app_module.app.test_client().get('/api/events/all').status_code == 200
+
+
+def test_failed_last_job_still_writes_a_shared_snapshot(app_module, monkeypatch):
+	api, scheduler = app_module.events_api, app_module.scheduler
+	scheduler.workers = 1
+	fetch_category, calls = api.fetch_category, []
+
+	def failing_last(source_key, category, max_pages=1):
+		calls.append((source_key, category))
+		if len(calls) == len(scheduler.jobs()):
+			raise RuntimeError('listing unavailable')
+		return fetch_category(source_key, category, max_pages)
+
+	monkeypatch.setattr(api, 'fetch_category', failing_last)
+	scheduler.start()
+	wait_for(lambda: scheduler.first_pass_complete and shared_files(app_module))
+	assert len(calls) == len(scheduler.jobs())
@@ -1,5 +1,5 @@
 import axios from 'axios';
-import { ApiResponse } from '../types';
+import { ApiResponse, EventPage, EventQuery } from '../types';
 
 const API_BASE_URL = 'http://localhost:5000';
 
@@ -12,3 +12,15 @@ export const fetchEvents = async (): Promise<ApiResponse> => {
     throw error;
   }
 };
+
+// One page of events; pass the previous page's next_cursor as `cursor` to continue
+export const fetchEventPage = async (query: EventQuery = {}): Promise<EventPage> => {
+  try {
+    const params = { ...query, fields: query.fields?.join(',') };
+    const response = await axios.get<EventPage>(`${API_BASE_URL}/api/events`, { params });
+    return response.data;
+  } catch (error) {
+    console.error('Error fetching events:', error);
+    throw error;
+  }
+};
@@ -24,6 +24,25 @@ export interface ApiResponse {
   category_groups: Record<string, Event[]>;
 }
 
+export interface EventQuery {
+  category?: EventCategory;
+  source?: string;
+  from?: string;
+  to?: string;
+  q?: string;
+  limit?: number;
+  cursor?: string;
+  fields?: (keyof Event | 'card')[];
+}
+
+export interface EventPage {
+  success: boolean;
+  total_events: number;
+  count: number;
+  events: Partial<Event>[];
+  next_cursor: string | null;
+}
+
 export type EventCategory = 
   | 'business' 
   | 'community' 